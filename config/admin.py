@@ -10,6 +10,9 @@ from django.utils.translation import gettext_lazy as _
 
 from unfold.admin import ModelAdmin as UnfoldModelAdmin
 
+from .db_router import use_read_replica
+from .models import ArchivedLogEntry
+
 admin.site.site_header = "대시보드"
 admin.site.site_title = "대시보드"
 admin.site.index_title = "대시보드"
@@ -19,6 +22,16 @@ admin.site.unregister(Group)
 
 
 class ModelAdmin(UnfoldModelAdmin):
+    def changelist_view(self, request, extra_context=None):
+        """목록 조회는 읽기 replica로 보냅니다. (list_editable 저장 등 POST는 primary)"""
+        if request.method != "GET":
+            return super().changelist_view(request, extra_context)
+        with use_read_replica():
+            response = super().changelist_view(request, extra_context)
+            if hasattr(response, "render"):
+                response.render()  # 목록 표시 중의 조회(관계 필드 등)도 replica로
+        return response
+
     def getLogMessage(self, form, add=False, formsetObj=None):
         """
         Return a list of messages describing the changes from the form.
@@ -181,6 +194,8 @@ class LogEntryAdmin(ModelAdmin):
     list_display = ["action_time_str", "username", "object_repr_str", "action_flag_str", "change_message_str"]
     list_filter = ["action_time", "action_flag"]
     search_fields = ["object_repr", "user__username"]
+    list_select_related = ["user", "content_type"]
+    show_full_result_count = False
     change_list_template = "admin/log/logentry_changelist.html"
 
     def has_add_permission(self, request):
@@ -219,3 +234,44 @@ class LogEntryAdmin(ModelAdmin):
         field_change = f"{obj.user.username}님이 {obj.content_type.app_label}탭의 ID: {obj.object_id}의 "
         field_change += parse_action_string(obj.change_message, obj.action_flag)
         return field_change
+
+
+@admin.register(ArchivedLogEntry)
+class ArchivedLogEntryAdmin(ModelAdmin):
+    """
+    보관된 관리자 로그 (archive_admin_logs)
+
+    보관 테이블은 계속 커지므로 검색어를 입력했을 때만 조회하고, 전체 개수는 세지 않습니다.
+    """
+
+    list_display = ["action_time_str", "username", "object_repr", "action_flag_str", "change_message_str"]
+    list_filter = ["action_time", "action_flag"]
+    search_fields = ["=username", "object_repr"]
+    search_help_text = _("유저네임(정확히 일치) 또는 수정대상으로 보관된 로그를 검색합니다.")
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset.none(), False
+        return super().get_search_results(request, queryset, search_term)
+
+    @admin.display(description=_("시간"), ordering="action_time")
+    def action_time_str(self, obj):
+        return obj.action_time.strftime("%Y-%m-%d %H:%M")
+
+    @admin.display(description=_("액션"))
+    def action_flag_str(self, obj):
+        return LogEntryAdmin.action_flag_str(self, obj)
+
+    @admin.display(description=_("수정내용"))
+    def change_message_str(self, obj):
+        return f"{obj.username}님이 {obj.content_type.split('.')[0]}탭의 ID: {obj.object_id}의 " + parse_action_string(obj.change_message, obj.action_flag)
@@ -0,0 +1,19 @@
+"""
+Celery Application
+
+백그라운드 작업(대시보드 지표 사전 계산 등)을 위한 Celery 앱을 설정합니다.
+
+사용법:
+    celery -A config worker -l info
+    celery -A config beat -l info
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("config")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
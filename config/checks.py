@@ -0,0 +1,26 @@
+"""
+배포 시스템 체크 (python manage.py check --deploy)
+"""
+
+from typing import Any
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.checks import Error, Tags, register
+
+
+@register(Tags.staticfiles, deploy=True)
+def check_static_manifest(app_configs: Any, **kwargs: Any) -> list[Error]:
+    """StaticStorage의 staticfiles manifest가 배포 결과물에 있는지 확인합니다. (없으면 해시 파일명 대신 원본 파일명을 제공)"""
+    from .storages import StaticStorage
+
+    storage = staticfiles_storage
+    if not isinstance(storage, StaticStorage) or storage.manifest_storage.exists(storage.manifest_name):
+        return []
+    return [
+        Error(
+            "staticfiles manifest가 없습니다.",
+            hint="collectstatic을 실행한 뒤 STATIC_MANIFEST_ROOT를 배포 결과물에 포함하세요.",
+            obj=storage.manifest_storage.path(storage.manifest_name),
+            id="config.E001",
+        )
+    ]
@@ -1,9 +1,13 @@
+from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
 from unfold.contrib.constance.settings import UNFOLD_CONSTANCE_ADDITIONAL_FIELDS
 
 CONSTANCE_BACKEND = "constance.backends.database.DatabaseBackend"
 
+# API 요청 한도 형식: "요청 수/기간" (기간은 s/m/h/d로 시작, 예: 120/min, 10/sec), 빈 값은 제한 없음
+RATE_LIMIT_PATTERN = r"^\s*(\d+)\s*/\s*([smhd])[a-z]*\s*$"
+
 CONSTANCE_ADDITIONAL_FIELDS = {
     **UNFOLD_CONSTANCE_ADDITIONAL_FIELDS,
     "language_select": [
@@ -17,6 +21,14 @@ CONSTANCE_ADDITIONAL_FIELDS = {
             ),
         },
     ],
+    "rate_limit": [
+        "django.forms.fields.CharField",
+        {
+            "widget": "unfold.widgets.UnfoldAdminTextInputWidget",
+            "required": False,
+            "validators": [RegexValidator(RATE_LIMIT_PATTERN, _("'요청 수/기간' 형식이어야 합니다. (예: 120/min)"))],
+        },
+    ],
     "long_text": [
         "django.forms.fields.CharField",
         {
@@ -61,8 +73,13 @@ CONSTANCE_CONFIG = {
     "MAINTENANCE_MODE": (False, _("점검 모드 활성화"), bool),
     # 사용자 설정
     "MAX_LOGIN_ATTEMPTS": (5, _("최대 로그인 시도 횟수"), int),
+    "MAX_LOGIN_ATTEMPTS_PER_IP": (50, _("IP별 최대 로그인 시도 횟수"), int),
+    "LOGIN_LOCKOUT_MINUTES": (15, _("로그인 잠금 시간 (분)"), int),
     "SESSION_TIMEOUT_MINUTES": (3600, _("세션 타임아웃 (분)"), int),
     "ALLOW_REGISTRATION": (True, _("회원가입 허용"), bool),
+    # API 설정 ("요청 수/기간" 형식, 기간: sec/min/hour/day, 비우면 제한 없음)
+    "API_RATE_LIMIT_APP": ("600/min", _("앱 API 요청 한도 (클라이언트별)"), "rate_limit"),
+    "API_RATE_LIMIT_EXTERNAL": ("120/min", _("외부 API 요청 한도 (클라이언트별)"), "rate_limit"),
     # 화폐 설정
     "DEFAULT_CURRENCY": ("KRW", _("기본 화폐"), "currency_select"),
     # 이메일 설정
@@ -81,7 +98,14 @@ CONSTANCE_CONFIG_FIELDSETS = (
     (
         _("사용자 설정"),
         {
-            "fields": ("MAX_LOGIN_ATTEMPTS", "SESSION_TIMEOUT_MINUTES", "ALLOW_REGISTRATION"),
+            "fields": ("MAX_LOGIN_ATTEMPTS", "MAX_LOGIN_ATTEMPTS_PER_IP", "LOGIN_LOCKOUT_MINUTES", "SESSION_TIMEOUT_MINUTES", "ALLOW_REGISTRATION"),
+            "collapse": False,
+        },
+    ),
+    (
+        _("API 설정"),
+        {
+            "fields": ("API_RATE_LIMIT_APP", "API_RATE_LIMIT_EXTERNAL"),
             "collapse": False,
         },
     ),
@@ -1,52 +1,47 @@
 """
 Custom OpenAPI schema generator for filtering by tags
+
+카테고리 URL은 각 앱 urls에서 "<category>/"로 include합니다. (예: user/urls/app.py → api/user/app/)
+카테고리 generator는 그 include만 남긴 URL 패턴으로 만들어, 다른 카테고리 endpoint는 아예 분석하지 않습니다.
 """
 
 from typing import Any
 
-from django.urls import URLPattern, URLResolver
+from django.urls import URLPattern, URLResolver, get_resolver
 
 from drf_spectacular.generators import SchemaGenerator
 from drf_spectacular.openapi import AutoSchema
 
+from config.schema_categories import category_matcher
+
+
+def category_url_patterns(category: str, patterns: list[URLPattern | URLResolver] | None = None) -> list[URLPattern | URLResolver]:
+    """최상위 include(api/<app>/) 아래의 "<category>/" include만 남긴 URL 패턴 (prefix는 그대로 유지)"""
+    scoped: list[URLPattern | URLResolver] = []
+    for resolver in get_resolver().url_patterns if patterns is None else patterns:
+        if not isinstance(resolver, URLResolver):
+            continue
+        children = [child for child in resolver.url_patterns if isinstance(child, URLResolver) and str(child.pattern) == f"{category}/"]
+        if children:
+            scoped.append(URLResolver(resolver.pattern, children, resolver.default_kwargs, resolver.app_name, resolver.namespace))
+    return scoped
+
 
 class TagFilteredSchemaGenerator(SchemaGenerator):
-    """Custom schema generator that filters endpoints by tags"""
+    """Custom schema generator that keeps only one category's endpoints (config.schema_categories)"""
 
     def __init__(self, *args, **kwargs):
-        self.target_tags = kwargs.pop("target_tags", [])
+        self.category = kwargs.pop("category", None)
+        if self.category and kwargs.get("patterns") is None and not kwargs.get("urlconf"):
+            kwargs["patterns"] = category_url_patterns(self.category)
         super().__init__(*args, **kwargs)
 
-    def get_paths(self, request: Any = None) -> dict[str, Any]:
-        """Override to filter paths by tags before processing"""
-        paths = super().get_paths(request)  # type: ignore[misc]
-
-        if not self.target_tags:
+    def parse(self, input_request: Any, public: bool) -> dict[str, Any]:
+        """Override to filter the generated paths by category tags (URL 범위 밖에서 태그만 맞춘 endpoint 제외)"""
+        paths = super().parse(input_request, public)
+        if not self.category:
             return paths
-
-        filtered_paths = {}
-
-        for path, path_item in paths.items():
-            should_include = False
-            filtered_methods = {}
-
-            for method, operation in path_item.items():
-                if method.startswith("_"):  # Skip internal attributes
-                    continue
-
-                operation_tags = operation.get("tags", [])
-                print(f"Path: {path}, Method: {method.upper()}, Tags: {operation_tags}")
-
-                if operation_tags and any(tag in self.target_tags for tag in operation_tags):
-                    should_include = True
-                    filtered_methods[method] = operation
-                    print(f"✓ Including {method.upper()} {path}")
-
-            if should_include:
-                filtered_paths[path] = filtered_methods
-
-        print(f"Filtered {len(filtered_paths)} paths from {len(paths)} total paths")
-        return filtered_paths
+        return category_matcher.filter(paths, self.category)
 
 
 class CategoryAutoSchema(AutoSchema):
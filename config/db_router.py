@@ -0,0 +1,71 @@
+"""
+읽기 replica DB 라우터
+
+settings.READ_REPLICAS(DATABASE_REPLICAS 환경변수로 추가한 DB alias)가 있으면, use_read_replica() 안의 조회를 replica로 보내고
+쓰기는 항상 primary(default)로 보냅니다. replica로 보내는 곳은 ReadReplicaMixin(ViewSet의 GET/HEAD)과 admin changelist입니다.
+
+read-your-writes
+- 같은 요청: 쓰기가 한 번이라도 일어나면 그 요청의 이후 조회는 primary로 보냅니다.
+- 다음 요청: ReadReplicaMiddleware가 쓰기가 있었던 응답에 쿠키를 붙여 READ_REPLICA_STICKY_SECONDS 동안 primary로 보냅니다.
+
+상태는 ContextVar로 관리하므로 스레드/ASGI 요청 사이에 섞이지 않습니다.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import random
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+STICKY_COOKIE = "db_primary"
+
+_replica_enabled: ContextVar[bool] = ContextVar("replica_enabled", default=False)
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+
+@contextmanager
+def use_read_replica() -> Iterator[None]:
+    """블록 안의 조회를 replica로 보냅니다. (primary에 고정된 경우 제외)"""
+    token = _replica_enabled.set(True)
+    try:
+        yield
+    finally:
+        _replica_enabled.reset(token)
+
+
+def start_request(pinned: bool = False) -> Token[bool]:
+    """요청 시작 시 고정 상태를 초기화합니다. (pinned: 직전 요청에서 쓰기가 있었음)"""
+    return _primary_pinned.set(pinned)
+
+
+def end_request(token: Token[bool]) -> bool:
+    """요청 중 쓰기가 있었는지 반환하고 상태를 되돌립니다."""
+    wrote = _primary_pinned.get()
+    _primary_pinned.reset(token)
+    return wrote
+
+
+class ReadReplicaRouter:
+    def db_for_read(self, model: Any, **hints: Any) -> str | None:
+        replicas = settings.READ_REPLICAS
+        if not replicas:
+            return None
+        if _replica_enabled.get() and not _primary_pinned.get():
+            return random.choice(replicas)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: Any, **hints: Any) -> str | None:
+        _primary_pinned.set(True)
+        return DEFAULT_DB_ALIAS if settings.READ_REPLICAS else None
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool | None:
+        databases = {DEFAULT_DB_ALIAS, *settings.READ_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str | None = None, **hints: Any) -> bool | None:
+        """replica는 primary를 복제하므로 마이그레이션하지 않습니다."""
+        return False if db in settings.READ_REPLICAS else None
@@ -0,0 +1,122 @@
+"""
+로컬 디스크 read-through 캐시
+
+S3에서 읽은 파일을 로컬 디스크에 보관하고, 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다 (LRU).
+전체 크기는 이 프로세스가 쓰고 지운 만큼 메모리에서 갱신하고, max_bytes를 넘었을 때만 디렉터리를 다시 읽어 정리합니다.
+다른 프로세스가 쓴 파일은 다음 정리 때 반영됩니다.
+항목마다 ETag와 마지막 검증 시각을 함께 저장하여 Storage가 조건부 GET(If-None-Match)으로 재검증할 수 있게 합니다.
+여러 프로세스가 같은 디렉터리를 공유할 수 있도록 파일은 임시 파일에 쓴 뒤 os.replace로 교체합니다.
+"""
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import IO
+
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    path: Path
+    etag: str
+    validated_at: float
+
+
+class DiskCache:
+    def __init__(self, root: str | os.PathLike, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._size: int | None = None  # 추정 전체 크기 (None이면 아직 디렉터리를 읽지 않음)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.root / f"{digest}.data", self.root / f"{digest}.json"
+
+    def get(self, key: str) -> CacheEntry | None:
+        data_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        if not data_path.exists():
+            return None
+        return CacheEntry(path=data_path, etag=meta["etag"], validated_at=meta["validated_at"])
+
+    def touch(self, key: str, validated: bool = False) -> None:
+        """사용 시각(LRU 기준)을 갱신합니다. validated면 검증 시각도 갱신합니다."""
+        data_path, meta_path = self._paths(key)
+        try:
+            os.utime(data_path)
+            if validated:
+                meta = json.loads(meta_path.read_text())
+                meta["validated_at"] = time.time()
+                self._write_atomic(meta_path, json.dumps(meta).encode())
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def put(self, key: str, stream: IO[bytes], etag: str) -> Path:
+        """stream 내용을 저장하고 데이터 파일 경로를 반환합니다."""
+        data_path, meta_path = self._paths(key)
+        previous = _file_size(data_path)
+        written = 0
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                while chunk := stream.read(CHUNK_SIZE):
+                    written += f.write(chunk)
+            os.replace(tmp, data_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._write_atomic(meta_path, json.dumps({"key": key, "etag": etag, "validated_at": time.time()}).encode())
+        if self._size is not None:
+            self._size += written - previous
+        if self._size is None or self._size > self.max_bytes:
+            self.evict(keep=data_path)
+        return data_path
+
+    def delete(self, key: str) -> None:
+        data_path, meta_path = self._paths(key)
+        if self._size is not None:
+            self._size = max(self._size - _file_size(data_path), 0)
+        data_path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목을 지우고 추정 전체 크기를 디스크 기준으로 다시 맞춥니다. (keep: 방금 저장한 항목, 지우지 않음)"""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.root):
+            if entry.name.endswith(".data"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+                total += stat.st_size
+        if total > self.max_bytes:
+            for _, size, data_path in sorted(entries):
+                if data_path == keep:
+                    continue
+                data_path.unlink(missing_ok=True)
+                data_path.with_suffix(".json").unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        self._size = total
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
@@ -0,0 +1,37 @@
+"""
+비밀번호 hasher
+
+Django 기본 hasher와 같은 algorithm 이름을 쓰므로 기존 해시를 그대로 검증하며, 작업량만 settings(환경변수)에서 정합니다.
+새 비밀번호는 PASSWORD_HASHERS의 첫 번째(settings.PASSWORD_HASHER)로 해싱합니다.
+로그인에 성공했을 때 저장된 해시의 algorithm이나 작업량이 현재 설정과 다르면 Django가 그 자리에서 다시 해싱해 저장합니다.
+(AbstractBaseUser.check_password → must_update)
+"""
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_PBKDF2_ITERATIONS or hashers.PBKDF2PasswordHasher.iterations
+
+
+class BCryptSHA256PasswordHasher(hashers.BCryptSHA256PasswordHasher):
+    """bcrypt (72바이트 제한이 없도록 SHA256으로 먼저 줄임)"""
+
+    @property
+    def rounds(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_BCRYPT_ROUNDS or hashers.BCryptSHA256PasswordHasher.rounds
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """argon2id (argon2-cffi 필요)"""
+
+    @property
+    def time_cost(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_TIME_COST or hashers.Argon2PasswordHasher.time_cost
+
+    @property
+    def memory_cost(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_ARGON2_MEMORY_COST or hashers.Argon2PasswordHasher.memory_cost
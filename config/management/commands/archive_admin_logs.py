@@ -0,0 +1,43 @@
+"""
+관리자 로그 보관 커맨드
+
+admin의 모든 변경은 LogEntry(django_admin_log)를 남기지만 지워지지 않아 LogEntryAdmin이 점점 느려집니다.
+settings.ADMIN_LOG_RETENTION_DAYS일보다 오래된 LogEntry를 archived_admin_log 테이블로 옮기고 삭제합니다.
+PK 순서로 batch 단위로 나눠 batch마다 짧은 트랜잭션 하나로 복사와 삭제를 함께 처리합니다.
+
+사용법:
+    python manage.py archive_admin_logs
+    python manage.py archive_admin_logs --days 30 --batch-size 1000 --sleep 0.1
+    python manage.py archive_admin_logs --dry-run
+"""
+
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.contrib.admin.models import LogEntry
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from config.models import ArchivedLogEntry
+
+
+class Command(BaseCommand):
+    help = "보존 기간이 지난 관리자 로그를 batch 단위로 보관 테이블로 옮깁니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--days", type=int, default=None, help="보존 기간(일) (기본값: ADMIN_LOG_RETENTION_DAYS)")
+        parser.add_argument("--batch-size", type=int, default=2000, help="한 트랜잭션에서 옮길 로그 수 (기본값: 2000)")
+        parser.add_argument("--sleep", type=float, default=0.0, help="batch 사이 대기 시간(초) (기본값: 0)")
+        parser.add_argument("--dry-run", action="store_true", help="옮기지 않고 대상 로그 수만 출력")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        days = settings.ADMIN_LOG_RETENTION_DAYS if options["days"] is None else options["days"]
+        expired = LogEntry.objects.filter(action_time__lt=timezone.now() - timedelta(days=days))
+
+        if options["dry_run"]:
+            self.stdout.write(f"보관 대상 로그: {expired.count()}개 ({days}일 경과)")
+            return
+
+        archived = ArchivedLogEntry.objects.archive(expired, options["batch_size"], options["sleep"])
+        self.stdout.write(self.style.SUCCESS(f"관리자 로그 {archived}개를 보관했습니다."))
@@ -0,0 +1,276 @@
+"""
+성능 벤치마크 커맨드
+
+최적화 전/후 경로의 소요 시간을 비교합니다.
+테스트 데이터는 트랜잭션 안에서 생성한 뒤 롤백하므로 DB에 남지 않습니다.
+
+사용법:
+    python manage.py benchmark serializer
+    python manage.py benchmark serializer --rows 10000 --repeat 5
+    python manage.py benchmark throttle --rows 10000
+    python manage.py benchmark session --rows 10000
+    python manage.py benchmark schema --rows 10000 --repeat 3
+    python manage.py benchmark signup --rows 10000 --repeat 3
+    python manage.py benchmark activity --rows 20000
+    python manage.py benchmark hyperloglog --rows 100000 --repeat 3
+"""
+
+import time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """func를 repeat번 실행하여 가장 빠른 소요 시간(초)을 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+class Command(BaseCommand):
+    help = "최적화 전/후 경로의 성능을 비교합니다."
+
+    benchmarks = ("serializer", "throttle", "session", "schema", "signup", "activity", "hyperloglog")
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("name", choices=self.benchmarks, help="실행할 벤치마크")
+        parser.add_argument("--rows", type=int, default=10_000, help="생성할 테스트 row 수 (기본값: 10000)")
+        parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (가장 빠른 값 사용, 기본값: 5)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            results = getattr(self, f"bench_{options['name']}")(options["rows"], options["repeat"])
+            transaction.set_rollback(True)
+
+        baseline = results[0][1]
+        for label, elapsed in results:
+            self.stdout.write(f"{label:<40} {elapsed * 1000:10.1f} ms  (x{baseline / elapsed:.1f})")
+
+    def create_users(self, rows: int) -> None:
+        from user.models import User
+
+        User.objects.bulk_create(
+            [User(username=f"bench-{i}", email=f"bench-{i}@example.com", password="!") for i in range(rows)],
+            batch_size=1000,
+        )
+
+    def bench_serializer(self, rows: int, repeat: int) -> list[tuple[str, float]]:
+        """UserListSerializer + JSONRenderer vs values() 빠른 경로 + ORJSONRenderer"""
+        from rest_framework.renderers import JSONRenderer
+
+        from config.renderers import ORJSONRenderer
+        from user.models import User
+        from user.serializers import UserListSerializer, UserListValuesSerializer
+
+        self.create_users(rows)
+
+        def model_serializer() -> bytes:
+            return JSONRenderer().render(UserListSerializer(User.objects.all(), many=True).data)
+
+        def values_serializer() -> bytes:
+            return ORJSONRenderer().render(UserListValuesSerializer.serialize(User.objects.values(*UserListValuesSerializer.fields)))
+
+        return [
+            (f"ModelSerializer + json ({rows} rows)", best_of(repeat, model_serializer)),
+            (f"ValuesSerializer + orjson ({rows} rows)", best_of(repeat, values_serializer)),
+        ]
+
+    def bench_throttle(self, rows: int, repeat: int) -> list[tuple[str, float]]:
+        """요청마다 constance 조회 vs 프로세스 메모리에 보관한 설정으로 throttle 검사 (rows = 검사 횟수)"""
+        from django.conf import settings
+        from django.core.cache import cache
+
+        from constance import config  # type: ignore[import-untyped]
+
+        from config.throttling import ExternalRateThrottle, parse_rate
+
+        throttle = ExternalRateThrottle()
+        clients = [f"ip:10.0.{i // 256 % 256}.{i % 256}" for i in range(rows)]
+
+        def constance_per_request() -> None:
+            cache.clear()
+            for client in clients:
+                rate = parse_rate(config.API_RATE_LIMIT_EXTERNAL)
+                if rate is not None:
+                    throttle.consume(client, *rate)
+
+        def cached_config() -> None:
+            cache.clear()
+            for client in clients:
+                rate = throttle.get_rate(client)
+                if rate is not None:
+                    throttle.consume(client, *rate)
+
+        baseline, optimized = best_of(repeat, constance_per_request), best_of(repeat, cached_config)
+        self.stdout.write(f"throttle check: {optimized / rows * 1_000_000:.1f} µs/request (cache backend: {settings.CACHES['default']['BACKEND']})")
+        return [
+            (f"constance per request ({rows} checks)", baseline),
+            (f"cached config ({rows} checks)", optimized),
+        ]
+
+    def bench_session(self, rows: int, repeat: int) -> list[tuple[str, float]]:
+        """세션 백엔드별 요청당 세션 로드 비용 (rows = 요청 수)"""
+        from importlib import import_module
+
+        engines = {
+            "django db": "django.contrib.sessions.backends.db",
+            "db": "config.session_backends.db",
+            "cached_db": "config.session_backends.cached_db",
+            "signed_cookies": "config.session_backends.signed_cookies",
+        }
+        results = []
+        for label, engine in engines.items():
+            store_class = import_module(engine).SessionStore
+            session = store_class()
+            session.update({"_auth_user_id": "1", "_auth_user_backend": "user.backends.LockoutModelBackend", "_auth_user_hash": "0" * 64})
+            session.save()
+            session_key = session.session_key
+
+            def load() -> None:
+                for _ in range(rows):
+                    store = store_class(session_key)
+                    store.get("_auth_user_id")
+                    store.get_expiry_age()
+
+            results.append((f"{label} ({rows} requests)", best_of(repeat, load)))
+        return results
+
+    def bench_schema(self, rows: int, repeat: int) -> list[tuple[str, float]]:
+        """
+        카테고리(external) 스키마: 전체 생성 후 필터 vs 카테고리 URL 패턴만 생성
+
+        rows // 1000, rows // 250개의 가짜 admin 라우터를 더해 endpoint 수에 따른 차이를 봅니다.
+        """
+        from django.urls import get_resolver, include, path
+
+        from drf_spectacular.drainage import GENERATOR_STATS
+        from drf_spectacular.generators import SchemaGenerator
+        from rest_framework.routers import SimpleRouter
+
+        from config.custom_schema import TagFilteredSchemaGenerator, category_url_patterns
+        from config.schema_categories import category_matcher
+        from user.views.user.admin import AdminUserViewSet
+
+        def synthetic_patterns(groups: int) -> list:
+            router = SimpleRouter()
+            for i in range(groups):
+                router.register(f"bench-{i}", AdminUserViewSet, basename=f"bench-{i}")
+            return [*get_resolver().url_patterns, path("api/bench/", include([path("admin/", include(router.urls))]))]
+
+        results = []
+        with GENERATOR_STATS.silence():
+            for groups in (0, rows // 1000, rows // 250):
+                patterns = synthetic_patterns(groups)
+                scoped = category_url_patterns("external", patterns)
+
+                def generate_then_filter() -> dict:
+                    return category_matcher.filter(SchemaGenerator(patterns=patterns).get_schema(public=True)["paths"], "external")
+
+                def scoped_generate() -> dict:
+                    return TagFilteredSchemaGenerator(category="external", patterns=scoped).get_schema(public=True)["paths"]
+
+                endpoints = len(SchemaGenerator(patterns=patterns).get_schema(public=True)["paths"])
+                baseline, optimized = best_of(repeat, generate_then_filter), best_of(repeat, scoped_generate)
+                self.stdout.write(f"+{groups} routers ({endpoints} paths): scoped x{baseline / optimized:.1f}")
+                results += [(f"generate+filter ({endpoints} paths)", baseline), (f"scoped ({endpoints} paths)", optimized)]
+
+        return results
+
+    def bench_signup(self, rows: int, repeat: int) -> list[tuple[str, float]]:
+        """
+        API 회원가입(UserSerializer.create): create_user 후 다시 set_password + save vs create_user 한 번 (rows // 1000명 가입)
+
+        현재 설정의 hasher(PASSWORD_HASHER, 작업량)를 사용하며, bcrypt_sha256(기본 rounds)도 함께 측정합니다.
+        """
+        from itertools import count
+
+        from django.test import override_settings
+
+        from user.models import User
+        from user.serializers import UserSerializer
+
+        signups = max(rows // 1000, 1)
+        ids = count()
+
+        def payload() -> dict[str, Any]:
+            i = next(ids)
+            return {"username": f"bench-signup-{i}", "email": f"bench-signup-{i}@example.com", "password": "bench-password-123"}
+
+        def double_hashing() -> None:
+            for _ in range(signups):
+                data = payload()
+                password = data.pop("password")
+                user = User.objects.create_user(password=password, **data)
+                user.set_password(password)
+                user.save()
+
+        def single_hashing() -> None:
+            for _ in range(signups):
+                UserSerializer().create(payload())
+
+        results = [
+            (f"create_user + set_password ({signups} signups)", best_of(repeat, double_hashing)),
+            (f"create_user ({signups} signups)", best_of(repeat, single_hashing)),
+        ]
+        with override_settings(PASSWORD_HASHERS=["config.hashers.BCryptSHA256PasswordHasher"]):
+            results.append((f"create_user, bcrypt_sha256 ({signups} signups)", best_of(repeat, single_hashing)))
+        return results
+
+    def bench_activity(self, rows: int, repeat: int) -> list[tuple[str, float]]:
+        """활동 이벤트: 이벤트마다 INSERT vs ActivityBuffer.log() + flush() (rows = 이벤트 수)"""
+        from django.utils import timezone
+
+        from user.activity import ActivityBuffer
+        from user.models import User, UserActivity
+
+        user = User.objects.create_user(username="bench-activity", email="bench-activity@example.com", password="!")
+        buffer = ActivityBuffer(max_size=rows + 1, flush_interval=60)
+
+        def create_per_event() -> None:
+            for _ in range(rows):
+                UserActivity.objects.create(user=user, action="GET", path="/api/user/app/users/", created_at=timezone.now())
+
+        def log_events() -> None:
+            for _ in range(rows):
+                buffer.log(user.pk, "GET", "/api/user/app/users/")
+
+        def buffered() -> None:
+            log_events()
+            buffer.flush()
+
+        baseline, optimized = best_of(repeat, create_per_event), best_of(repeat, buffered)
+        log_only = best_of(repeat, log_events)
+        buffer.clear()
+        self.stdout.write(f"log(): {log_only / rows * 1_000_000:.2f} µs/event")
+        return [
+            (f"create per event ({rows} events)", baseline),
+            (f"buffer + flush ({rows} events)", optimized),
+        ]
+
+    def bench_hyperloglog(self, rows: int, repeat: int) -> list[tuple[str, float]]:
+        """HyperLogLog: id마다 add() vs numpy 벡터화 add_many() (rows = id 수)"""
+        import numpy as np
+
+        from utils.hyperloglog import HyperLogLog
+
+        ids = np.random.default_rng(42).integers(0, 10**12, size=rows)
+
+        def add_each() -> None:
+            sketch = HyperLogLog()
+            for value in ids.tolist():
+                sketch.add(value)
+
+        def add_many() -> None:
+            HyperLogLog().add_many(ids)
+
+        baseline, optimized = best_of(repeat, add_each), best_of(repeat, add_many)
+        self.stdout.write(f"add_many(): {rows / optimized:,.0f} ids/s")
+        return [
+            (f"add per id ({rows} ids)", baseline),
+            (f"add_many ({rows} ids)", optimized),
+        ]
@@ -0,0 +1,38 @@
+"""
+만료 세션 정리 커맨드
+
+Django clearsessions는 만료된 세션 전체를 한 번의 DELETE로 지우므로 오래 쌓인 테이블에서는
+긴 트랜잭션과 잠금이 생깁니다. 이 커맨드는 만료된 세션을 PK 기준 batch 단위로 나눠 삭제합니다.
+
+사용법:
+    python manage.py clear_expired_sessions
+    python manage.py clear_expired_sessions --batch-size 1000 --sleep 0.1
+"""
+
+import time
+from typing import Any
+
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = "만료된 세션을 batch 단위로 나눠 삭제합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=5000, help="한 번에 삭제할 세션 수 (기본값: 5000)")
+        parser.add_argument("--sleep", type=float, default=0.0, help="batch 사이 대기 시간(초) (기본값: 0)")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        now = timezone.now()
+        deleted = 0
+        while True:
+            keys = list(Session.objects.filter(expire_date__lt=now).values_list("pk", flat=True)[: options["batch_size"]])
+            if not keys:
+                break
+            deleted += Session.objects.filter(pk__in=keys).delete()[0]
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"만료된 세션 {deleted}개를 삭제했습니다."))
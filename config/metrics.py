@@ -0,0 +1,144 @@
+"""
+Dashboard Metrics Registry
+
+대시보드 카드 지표를 등록하고, 백그라운드에서 미리 계산된 스냅샷만 읽어옵니다.
+스냅샷이 오래되면 이전 값을 그대로 보여주면서 백그라운드에서 갱신합니다 (stale-while-revalidate).
+"""
+
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = "dashboard:metric:{}"
+LOCK_KEY = "dashboard:metric-lock:{}"
+EMPTY_METRIC = "-"
+
+
+@dataclass(frozen=True)
+class Metric:
+    key: str
+    title: str
+    icon: str
+    compute: Callable[[], Any]
+    max_age: int  # 스냅샷 신선도 (초)
+
+
+_registry: dict[str, Metric] = {}
+
+
+def register_metric(key: str, title: str, icon: str, max_age: int = 60) -> Callable[[Callable[[], Any]], Callable[[], Any]]:
+    """대시보드 카드 지표를 등록하는 데코레이터 (등록 순서대로 카드가 표시됩니다)"""
+
+    def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        _registry[key] = Metric(key=key, title=title, icon=icon, compute=func, max_age=max_age)
+        return func
+
+    return decorator
+
+
+def get_metrics() -> list[Metric]:
+    return list(_registry.values())
+
+
+def is_stale(metric: Metric, snapshot: dict[str, Any] | None) -> bool:
+    return snapshot is None or time.time() - snapshot["computed_at"] >= metric.max_age
+
+
+def compute_snapshot(metric: Metric) -> dict[str, Any]:
+    """지표를 계산하여 스냅샷으로 저장합니다. 캐시 만료 없이 보관하고 신선도는 computed_at으로 판단합니다."""
+    snapshot = {"value": metric.compute(), "computed_at": time.time()}
+    cache.set(SNAPSHOT_KEY.format(metric.key), snapshot, timeout=None)
+    return snapshot
+
+
+def _refresh(metric: Metric) -> None:
+    try:
+        compute_snapshot(metric)
+    except Exception:
+        logger.exception("대시보드 지표 계산 실패: %s", metric.key)
+    finally:
+        cache.delete(LOCK_KEY.format(metric.key))
+        connections.close_all()
+
+
+def refresh_in_background(metric: Metric) -> None:
+    """다른 프로세스/스레드가 이미 갱신 중이 아니라면 백그라운드 스레드에서 지표를 갱신합니다."""
+    if cache.add(LOCK_KEY.format(metric.key), 1, timeout=max(metric.max_age, 30)):
+        threading.Thread(target=_refresh, args=(metric,), daemon=True).start()
+
+
+def refresh_stale_metrics() -> list[str]:
+    """오래된 스냅샷을 모두 다시 계산합니다 (Celery beat에서 주기적으로 호출)."""
+    refreshed = []
+    for metric in get_metrics():
+        if not is_stale(metric, cache.get(SNAPSHOT_KEY.format(metric.key))):
+            continue
+        try:
+            compute_snapshot(metric)
+        except Exception:
+            logger.exception("대시보드 지표 계산 실패: %s", metric.key)
+            continue
+        refreshed.append(metric.key)
+    return refreshed
+
+
+def is_shared_cache() -> bool:
+    """스냅샷 캐시를 다른 프로세스와 공유하는지 여부 (로컬 메모리 캐시는 프로세스마다 따로 저장)"""
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache)
+
+
+def has_pending_metrics() -> bool:
+    """아직 스냅샷이 없어 EMPTY_METRIC으로 표시될 지표가 있는지"""
+    keys = [SNAPSHOT_KEY.format(metric.key) for metric in get_metrics()]
+    return len(cache.get_many(keys)) < len(keys)
+
+
+def get_cards() -> list[dict[str, Any]]:
+    """대시보드 카드 목록을 반환합니다. 렌더링 중에는 집계 쿼리를 실행하지 않습니다."""
+    snapshots = cache.get_many([SNAPSHOT_KEY.format(metric.key) for metric in get_metrics()])
+    cards = []
+    for metric in get_metrics():
+        snapshot = snapshots.get(SNAPSHOT_KEY.format(metric.key))
+        if is_stale(metric, snapshot):
+            refresh_in_background(metric)
+        cards.append({"title": metric.title, "metric": snapshot["value"] if snapshot else EMPTY_METRIC, "icon": metric.icon})
+    return cards
+
+
+@register_metric("total_users", "총 유저", "people", max_age=60)
+def total_users() -> int:
+    from user.models import User
+
+    return User.objects.count()
+
+
+@register_metric("new_users", "신규가입", "person_add", max_age=60)
+def new_users() -> int:
+    from user.models import User
+    from utils.timezone_utils import get_start_of_today
+
+    return User.objects.filter(registered_at__gte=get_start_of_today()).count()
+
+
+@register_metric("pending_users", "인증대기 유저", "hourglass", max_age=60)
+def pending_users() -> int:
+    """아직 활성화되지 않은 유저 (관리자가 강제 비활성화한 유저 제외)"""
+    from user.models import User
+
+    return User.objects.filter(is_active=False, deactivated_at__isnull=True).count()
+
+
+@register_metric("mau", "MAU", "monitoring", max_age=300)
+def monthly_active_users() -> int:
+    """최근 30일 일별 HyperLogLog 스케치를 합쳐 추정한 고유 활성 유저 수"""
+    from user.models import DailyActiveUserSketch
+
+    return DailyActiveUserSketch.objects.estimate(days=30)
@@ -9,6 +9,10 @@ from django.utils.translation import activate
 
 from constance import config  # type: ignore[import-untyped]
 
+from user.activity import log_activity
+
+from . import db_router
+
 _thread_locals = threading.local()
 
 
@@ -36,3 +40,42 @@ class Admin404RedirectMiddleware:
         if response.status_code == 404 and request.path.startswith("/admin/"):
             return redirect(settings.ADMIN_REDIRECT_URL)
         return response
+
+
+class UserActivityMiddleware:
+    """인증된 사용자의 요청을 활동 이벤트로 기록하는 미들웨어 (메모리 버퍼에만 추가)"""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            log_activity(user.pk, request.method or "", request.path)
+        return response
+
+
+class ReadReplicaMiddleware:
+    """
+    읽기 replica의 read-your-writes 고정 (config.db_router)
+
+    쓰기가 있었던 응답에 쿠키를 붙이고, 쿠키가 남아 있는 동안(READ_REPLICA_STICKY_SECONDS) 그 클라이언트의 조회는 primary로 보냅니다.
+    세션 저장도 쓰기로 잡히도록 SessionMiddleware보다 앞에 둡니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.READ_REPLICAS:
+            return self.get_response(request)
+
+        token = db_router.start_request(pinned=db_router.STICKY_COOKIE in request.COOKIES)
+        try:
+            response = self.get_response(request)
+        finally:
+            wrote = db_router.end_request(token)
+        if wrote:
+            response.set_cookie(db_router.STICKY_COOKIE, "1", max_age=settings.READ_REPLICA_STICKY_SECONDS, httponly=True, samesite="Lax")
+        return response
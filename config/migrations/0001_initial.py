@@ -0,0 +1,35 @@
+# Generated by Django 5.2.13 on 2026-10-19 09:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedLogEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("original_id", models.BigIntegerField(unique=True, verbose_name="원래 ID")),
+                ("action_time", models.DateTimeField(verbose_name="시간")),
+                ("user_id", models.BigIntegerField(verbose_name="관리자 ID")),
+                ("username", models.CharField(max_length=150, verbose_name="관리자")),
+                ("content_type", models.CharField(blank=True, default="", max_length=200, verbose_name="대상 모델")),
+                ("object_id", models.TextField(blank=True, default="", verbose_name="대상 ID")),
+                ("object_repr", models.CharField(max_length=200, verbose_name="수정대상")),
+                ("action_flag", models.PositiveSmallIntegerField(verbose_name="액션")),
+                ("change_message", models.TextField(blank=True, verbose_name="수정내용")),
+            ],
+            options={
+                "verbose_name": "보관된 관리자 로그",
+                "verbose_name_plural": "보관된 관리자 로그",
+                "db_table": "archived_admin_log",
+                "ordering": ["-action_time"],
+                "indexes": [models.Index(fields=["action_time"], name="archived_ad_action__c57481_idx"), models.Index(fields=["username", "action_time"], name="archived_ad_usernam_8bf25b_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,210 @@
+"""
+ViewSet Mixins
+
+여러 앱의 ViewSet에서 공통으로 사용하는 DRF mixin들을 제공합니다.
+"""
+
+from datetime import datetime
+import hashlib
+from typing import Any, Callable, Iterable, Sequence
+
+from django.db.models import Count, Max, QuerySet
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer, ListSerializer, Serializer
+from rest_framework.views import APIView
+
+from .db_router import use_read_replica
+from .serializers import ValuesSerializer
+
+
+class ReadReplicaMixin(APIView):
+    """GET/HEAD 요청의 조회를 읽기 replica로 보냅니다. (config.db_router, 쓰기 직후에는 primary)"""
+
+    def dispatch(self, request: Any, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        if request.method in ("GET", "HEAD"):
+            with use_read_replica():
+                return super().dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+
+class ConditionalGetMixin(RetrieveModelMixin, ListModelMixin, GenericAPIView):
+    """
+    list/retrieve에 ETag / Last-Modified 조건부 GET을 적용합니다.
+
+    - list: 필터링된 queryset의 MAX(updated_at)와 COUNT로 ETag만 계산
+      (row가 삭제되어도 MAX(updated_at)는 그대로일 수 있으므로 Last-Modified는 보내지 않습니다)
+    - retrieve: 해당 row의 updated_at만 조회하여 검증자를 계산
+    검증자가 일치하면 직렬화 없이 304 Not Modified를 반환합니다.
+    """
+
+    last_modified_field = "updated_at"
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        queryset = self.filter_queryset(self.get_queryset())
+        state = queryset.order_by().aggregate(last_modified=Max(self.last_modified_field), count=Count("pk"))
+        last_modified = state["last_modified"].isoformat() if state["last_modified"] else ""
+        return self._conditional_response(request, None, f"{last_modified}|{state['count']}", super().list, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        last_modified = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}).values_list(self.last_modified_field, flat=True).first()
+        if last_modified is None:
+            return super().retrieve(request, *args, **kwargs)
+        return self._conditional_response(request, last_modified, "", super().retrieve, *args, **kwargs)
+
+    def _conditional_response(self, request: Request, last_modified: datetime | None, state: str, handler: Callable[..., Response], *args: Any, **kwargs: Any) -> Response:
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        version = f"{request.get_full_path()}|{last_modified.isoformat() if last_modified else ''}|{state}"
+        etag = quote_etag(hashlib.md5(version.encode(), usedforsecurity=False).hexdigest())
+
+        conditional = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if conditional is not None:  # 304 / 412는 본문 없는 Response로 반환
+            response = Response(status=conditional.status_code)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        return response
+
+
+class ValuesListMixin(ListModelMixin, GenericAPIView):
+    """
+    list 액션을 queryset.values() + ValuesSerializer 빠른 경로로 처리합니다.
+    모델 인스턴스 생성과 필드별 to_representation 호출을 건너뜁니다.
+    """
+
+    values_serializer_class: type[ValuesSerializer] | None = None
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if self.values_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        fields = self.get_values_fields()
+        queryset = self.filter_queryset(self.get_queryset()).values(*fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.values_serializer_class.serialize(page, fields))
+        return Response(self.values_serializer_class.serialize(queryset, fields))
+
+    def get_values_fields(self) -> Sequence[str]:
+        """values()로 조회하고 직렬화할 필드 목록"""
+        return self.values_serializer_class.fields if self.values_serializer_class else []
+
+
+class SparseFieldsetMixin(ValuesListMixin):
+    """
+    ?fields= / ?exclude= 쿼리 파라미터로 list/retrieve 응답 필드를 줄입니다.
+    선택한 필드는 SQL projection(values()/only())에도 반영되어 필요한 컬럼만 조회합니다.
+
+    sparse_fields(카테고리별 화이트리스트)는 파라미터를 쓴 응답에만 적용됩니다.
+    fields= 로는 화이트리스트 안의 필드만 선택할 수 있고, exclude= 는 화이트리스트 필드에서 제외합니다.
+    파라미터가 없는 기본 응답은 serializer의 필드를 그대로 반환합니다.
+    """
+
+    sparse_fields: tuple[str, ...] = ()
+    sparse_actions = ("list", "retrieve")
+    action: str  # ViewSetMixin이 설정
+
+    def get_sparse_fields(self) -> list[str] | None:
+        """선택된 필드 목록 (파라미터가 없거나 대상 액션이 아니면 None)"""
+        if self.action not in self.sparse_actions or getattr(self, "request", None) is None:
+            return None
+        if getattr(self, "swagger_fake_view", False):  # 스키마 생성 시에는 serializer 필드를 그대로 문서화
+            return None
+        if not hasattr(self, "_sparse_fields"):
+            self._sparse_fields = self._parse_sparse_fields()
+        return self._sparse_fields
+
+    def _parse_sparse_fields(self) -> list[str] | None:
+        params = self.request.query_params
+        fields_param, exclude_param = params.get("fields"), params.get("exclude")
+        if not fields_param and not exclude_param:
+            return None
+
+        available = [name for name in self._get_available_fields() if not self.sparse_fields or name in self.sparse_fields]
+        requested = _split_fields(fields_param) if fields_param else available
+        excluded = _split_fields(exclude_param) if exclude_param else []
+
+        errors = {}
+        invalid = [name for name in requested if name not in available]
+        if invalid:
+            errors["fields"] = [f"선택할 수 없는 필드입니다: {', '.join(invalid)}"]
+        invalid = [name for name in excluded if name not in available]
+        if invalid:
+            errors["exclude"] = [f"존재하지 않는 필드입니다: {', '.join(invalid)}"]
+        if errors:
+            raise ValidationError(errors)
+
+        selected = [name for name in available if name in requested and name not in excluded]
+        if not selected:
+            raise ValidationError({"fields": ["하나 이상의 필드를 선택해야 합니다."]})
+        return selected
+
+    def _get_available_fields(self) -> list[str]:
+        if self.action == "list" and self.values_serializer_class is not None:
+            return list(self.values_serializer_class.fields)
+        serializer = self.get_serializer_class()()
+        assert isinstance(serializer, Serializer)
+        return [name for name, field in serializer.fields.items() if not field.write_only]
+
+    def get_values_fields(self) -> Sequence[str]:
+        return self.get_sparse_fields() or super().get_values_fields()
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        concrete = {field.name for field in queryset.model._meta.concrete_fields}
+        return queryset.only(*[name for name in fields if name in concrete])
+
+    def get_serializer(self, *args: Any, **kwargs: Any) -> BaseSerializer:
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            target = serializer.child if isinstance(serializer, ListSerializer) else serializer
+            assert isinstance(target, Serializer)
+            for name in list(target.fields):
+                if name not in fields:
+                    target.fields.pop(name)
+        return serializer
+
+
+def _split_fields(value: str) -> list[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def sparse_fieldset_parameters(fields: Iterable[str]) -> list[OpenApiParameter]:
+    """?fields= / ?exclude= 파라미터 문서 (카테고리별 선택 가능 필드 포함)"""
+    allowed = ", ".join(f"`{name}`" for name in fields)
+    return [
+        OpenApiParameter(
+            name="fields",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description=f"응답에 포함할 필드 (쉼표로 구분). 선택 가능: {allowed}",
+            required=False,
+        ),
+        OpenApiParameter(
+            name="exclude",
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+            description="응답에서 제외할 필드 (쉼표로 구분)",
+            required=False,
+        ),
+    ]
@@ -0,0 +1,82 @@
+import time
+from typing import Any
+
+from django.contrib.admin.models import LogEntry
+from django.db import models, transaction
+from django.db.models import QuerySet
+from django.utils.translation import gettext_lazy as _
+
+LOG_ENTRY_FIELDS = ("pk", "action_time", "user_id", "user__username", "content_type__app_label", "content_type__model", "object_id", "object_repr", "action_flag", "change_message")
+
+
+class ArchivedLogEntryManager(models.Manager["ArchivedLogEntry"]):
+    def archive(self, entries: QuerySet[LogEntry], batch_size: int = 2000, sleep: float = 0.0) -> int:
+        """
+        LogEntry들을 보관 테이블로 옮기고 삭제합니다. PK 순서로 batch_size개씩, batch마다 트랜잭션 하나로 처리합니다.
+
+        옮긴 로그 수를 반환합니다.
+        """
+        archived = 0
+        last_pk = 0
+        while True:
+            # action_time에는 인덱스가 없으므로 PK 인덱스를 따라가며 오래된 로그(앞쪽 PK)부터 찾습니다.
+            rows = list(entries.filter(pk__gt=last_pk).order_by("pk").values_list(*LOG_ENTRY_FIELDS)[:batch_size])
+            if not rows:
+                return archived
+            last_pk = rows[-1][0]
+            archived += self._archive_rows(rows)
+            if sleep:
+                time.sleep(sleep)
+
+    def _archive_rows(self, rows: list[tuple[Any, ...]]) -> int:
+        archived = [
+            ArchivedLogEntry(
+                original_id=pk,
+                action_time=action_time,
+                user_id=user_id,
+                username=username or "",
+                content_type=f"{app_label}.{model}" if app_label else "",
+                object_id=object_id or "",
+                object_repr=object_repr,
+                action_flag=action_flag,
+                change_message=change_message,
+            )
+            for pk, action_time, user_id, username, app_label, model, object_id, object_repr, action_flag, change_message in rows
+        ]
+        with transaction.atomic(using=self.db):
+            self.bulk_create(archived, ignore_conflicts=True)  # 중단 후 재실행해도 중복 없음
+            LogEntry.objects.filter(pk__in=[entry.original_id for entry in archived]).delete()
+        return len(archived)
+
+
+class ArchivedLogEntry(models.Model):
+    """
+    보존 기간이 지난 admin LogEntry (archive_admin_logs 커맨드가 django_admin_log에서 옮김)
+
+    유저와 content type은 FK 대신 값으로 저장하므로, 유저가 삭제/보관되어도 기록이 남고 JOIN 없이 조회됩니다.
+    """
+
+    original_id = models.BigIntegerField(unique=True, verbose_name=_("원래 ID"))
+    action_time = models.DateTimeField(verbose_name=_("시간"))
+    user_id = models.BigIntegerField(verbose_name=_("관리자 ID"))
+    username = models.CharField(max_length=150, verbose_name=_("관리자"))
+    content_type = models.CharField(max_length=200, blank=True, default="", verbose_name=_("대상 모델"))  # "app_label.model"
+    object_id = models.TextField(blank=True, default="", verbose_name=_("대상 ID"))
+    object_repr = models.CharField(max_length=200, verbose_name=_("수정대상"))
+    action_flag = models.PositiveSmallIntegerField(verbose_name=_("액션"))
+    change_message = models.TextField(blank=True, verbose_name=_("수정내용"))
+
+    objects: ArchivedLogEntryManager = ArchivedLogEntryManager()
+
+    def __str__(self) -> str:
+        return f"{self.username} {self.object_repr}"
+
+    class Meta:
+        db_table = "archived_admin_log"
+        verbose_name = _("보관된 관리자 로그")
+        verbose_name_plural = _("보관된 관리자 로그")
+        ordering = ["-action_time"]
+        indexes = [
+            models.Index(fields=["action_time"]),
+            models.Index(fields=["username", "action_time"]),
+        ]
@@ -0,0 +1,25 @@
+"""
+orjson 기반 JSON Renderer
+
+DRF 기본 JSONRenderer(json.dumps) 대신 orjson으로 응답을 직렬화합니다.
+orjson이 처리하지 못하는 타입(lazy 번역 문자열 등)은 DRF JSONEncoder로 위임합니다.
+"""
+
+from typing import Any, Mapping
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data: Any, accepted_media_type: str | None = None, renderer_context: Mapping[str, Any] | None = None) -> bytes:
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=_encoder.default, option=orjson.OPT_NON_STR_KEYS)
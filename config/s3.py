@@ -0,0 +1,19 @@
+"""
+S3 클라이언트
+
+presigned URL 발급 등 django-storages를 거치지 않는 S3 호출에 사용하는 boto3 클라이언트를 제공합니다.
+커넥션 풀/재시도 설정은 django-storages와 같은 settings.AWS_S3_CLIENT_CONFIG를 사용합니다.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+
+import boto3
+
+
+@lru_cache(maxsize=1)
+def get_s3_client() -> Any:
+    """프로세스에서 공유하는 S3 클라이언트 (boto3 client는 스레드 안전, 커넥션 풀 공유)"""
+    return boto3.client("s3", region_name=settings.AWS_S3_REGION_NAME, config=settings.AWS_S3_CLIENT_CONFIG)
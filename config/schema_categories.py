@@ -0,0 +1,87 @@
+"""
+API 카테고리 (app/admin/external) 분류
+
+카테고리는 태그 접두사로 정의합니다. 태그가 접두사와 같거나 "<접두사>-"로 시작하면 그 카테고리에 속합니다.
+(예: "app-user" → app, "admin-user" → admin)
+
+CategoryMatcher는 정의를 접두사 -> 카테고리 dict로 컴파일하고, 태그별 결과를 캐시합니다.
+operation을 한 번씩만 훑으면서 모든 카테고리의 paths를 동시에 만들며, operation 객체는 복사하지 않고 공유합니다.
+
+사용처: 카테고리별 스키마 뷰, TagFilteredSchemaGenerator, 버전별 스키마 JSON
+"""
+
+from typing import Any, Iterable, Mapping, Sequence
+
+CATEGORY_TAGS: dict[str, tuple[str, ...]] = {
+    "app": ("app", "user"),
+    "admin": ("admin", "management"),
+    "external": ("external", "public", "integration"),
+}
+
+
+class CategoryMatcher:
+    def __init__(self, categories: Mapping[str, Iterable[str]]) -> None:
+        self.categories = tuple(categories)
+        self._prefixes: dict[str, frozenset[str]] = {}
+        for category, prefixes in categories.items():
+            for prefix in prefixes:
+                self._prefixes[prefix] = self._prefixes.get(prefix, frozenset()) | {category}
+        self._tags: dict[str, frozenset[str]] = {}
+
+    def categories_for_tag(self, tag: str) -> frozenset[str]:
+        """태그가 속한 카테고리. "a-b-c"는 "a-b-c", "a-b", "a" 순으로 접두사를 찾습니다."""
+        result = self._tags.get(tag)
+        if result is None:
+            found: frozenset[str] = frozenset()
+            candidate = tag
+            while True:
+                found |= self._prefixes.get(candidate, frozenset())
+                if "-" not in candidate:
+                    break
+                candidate = candidate.rsplit("-", 1)[0]
+            self._tags[tag] = result = found
+        return result
+
+    def categories_for_operation(self, operation: Mapping[str, Any]) -> frozenset[str]:
+        tags: Sequence[str] = operation.get("tags") or ()
+        if len(tags) == 1:
+            return self.categories_for_tag(tags[0])
+        return frozenset().union(*(self.categories_for_tag(tag) for tag in tags))
+
+    def split(self, paths: Mapping[str, Any], categories: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        paths를 한 번 훑어 카테고리별 paths로 나눕니다.
+
+        operation이 없는 경로는 빠지고, 경로 공통 항목(parameters 등)은 포함된 경로에 그대로 붙습니다.
+        """
+        result: dict[str, dict[str, Any]] = {category: {} for category in (self.categories if categories is None else categories)}
+        for path, path_item in paths.items():
+            for method, operation in path_item.items():
+                if method.startswith("_") or not isinstance(operation, dict):
+                    continue
+                for category in self.categories_for_operation(operation):
+                    target = result.get(category)
+                    if target is None:
+                        continue
+                    item = target.get(path)
+                    if item is None:
+                        item = target[path] = {key: value for key, value in path_item.items() if not isinstance(value, dict)}
+                    item[method] = operation
+        return result
+
+    def filter(self, paths: Mapping[str, Any], category: str) -> dict[str, Any]:
+        """카테고리 하나의 paths"""
+        return self.split(paths, (category,))[category]
+
+
+category_matcher = CategoryMatcher(CATEGORY_TAGS)
+
+
+def used_tags(paths: Mapping[str, Any]) -> set[str]:
+    """paths의 operation이 사용하는 태그"""
+    tags: set[str] = set()
+    for path_item in paths.values():
+        for operation in path_item.values():
+            if isinstance(operation, dict):
+                tags.update(operation.get("tags") or ())
+    return tags
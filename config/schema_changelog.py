@@ -0,0 +1,138 @@
+"""
+API 스키마 changelog 저장소
+
+버전별 변경사항(export_schema가 계산한 이전 버전 대비 delta)을 static/docs/changelog.jsonl에 한 줄씩 추가합니다.
+파일 전체를 다시 쓰지 않으며, 같은 버전을 다시 저장하면 뒤에 추가한 줄이 우선합니다.
+
+읽을 때는 파일을 한 번 읽어 버전 -> 항목 dict와 정렬된 버전 목록을 만들고 (파일이 바뀔 때까지 프로세스에 보관),
+버전 범위 조회는 bisect로 찾은 delta들을 합쳐 순 변경사항(net diff)을 계산합니다.
+"""
+
+from bisect import bisect_right
+import os
+import threading
+from typing import Any
+
+import orjson
+
+
+def version_key(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in version.split("."))
+
+
+class ChangelogStore:
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._token: tuple[int, int] | None = None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._versions: list[str] = []
+        self._keys: list[tuple[int, ...]] = []
+
+    @property
+    def token(self) -> str:
+        """파일 상태 (변경되면 바뀜, 캐시 키에 사용)"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return "0"
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def _load(self) -> None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._token, self._entries, self._versions, self._keys = None, {}, [], []
+            return
+        token = (stat.st_mtime_ns, stat.st_size)
+        if token == self._token:
+            return
+
+        with self._lock:
+            entries: dict[str, dict[str, Any]] = {}
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        entry = orjson.loads(line)
+                        entries[entry["version"]] = entry
+            self._entries = entries
+            self._versions = sorted(entries, key=version_key)
+            self._keys = [version_key(version) for version in self._versions]
+            self._token = token
+
+    def versions(self) -> list[str]:
+        self._load()
+        return list(self._versions)
+
+    def get(self, version: str) -> dict[str, Any] | None:
+        self._load()
+        return self._entries.get(version)
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """버전 항목을 파일 끝에 추가합니다."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(orjson.dumps(entry) + b"\n")
+
+    def between(self, from_version: str, to_version: str) -> list[dict[str, Any]]:
+        """from_version 이후부터 to_version까지(포함)의 버전 항목 (오름차순)"""
+        self._load()
+        start = bisect_right(self._keys, version_key(from_version))
+        end = bisect_right(self._keys, version_key(to_version))
+        return [self._entries[version] for version in self._versions[start:end]]
+
+    def net_diff(self, from_version: str, to_version: str) -> dict[str, Any]:
+        """
+        두 버전 사이의 순 변경사항
+
+        operation/컴포넌트마다 처음 변경 전 존재 여부와 마지막 변경 후 존재 여부만 비교합니다.
+        (추가 후 삭제 → 제외, 삭제 후 재추가 → 수정, 추가 후 수정 → 추가)
+        """
+        entries = self.between(from_version, to_version)
+        operations: dict[tuple[str, str], dict[str, Any]] = {}
+        components: dict[str, list[bool]] = {}
+
+        for entry in entries:
+            for kind in ("added", "modified", "removed"):
+                for op in entry.get(kind, []):
+                    state = operations.get((op["method"], op["path"]))
+                    if state is None:
+                        state = operations[(op["method"], op["path"])] = {"before": kind != "added", "components": set()}
+                    state["after"] = kind != "removed"
+                    state["summary"] = op.get("summary", "")
+                    state["components"].update(op.get("components", ()))
+                for name in (entry.get("components") or {}).get(kind, []):
+                    flags = components.setdefault(name, [kind != "added", True])
+                    flags[1] = kind != "removed"
+
+        result: dict[str, Any] = {
+            "from": from_version,
+            "to": to_version,
+            "versions": [entry["version"] for entry in entries],
+            "added": [],
+            "modified": [],
+            "removed": [],
+            "components": {"added": [], "modified": [], "removed": []},
+        }
+        for (method, path), state in sorted(operations.items(), key=lambda item: (item[0][1], item[0][0])):
+            net = _net_kind(state["before"], state["after"])
+            if net:
+                op = {"method": method, "path": path, "summary": state["summary"]}
+                if net == "modified" and state["components"]:
+                    op["components"] = sorted(state["components"])
+                result[net].append(op)
+        for name, (before, after) in sorted(components.items()):
+            net = _net_kind(before, after)
+            if net:
+                result["components"][net].append(name)
+        return result
+
+
+def _net_kind(before: bool, after: bool) -> str | None:
+    if before and after:
+        return "modified"
+    if after:
+        return "added"
+    if before:
+        return "removed"
+    return None
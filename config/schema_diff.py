@@ -0,0 +1,205 @@
+"""
+OpenAPI 스키마 구조 비교 (Merkle 해시)
+
+스키마의 모든 하위 트리를 한 번씩만 해시하고(Merkle), `$ref`는 참조한 컴포넌트 이름으로 기록합니다.
+두 스키마는 paths/components 루트 해시부터 비교하므로 바뀐 부분이 없으면 바로 끝나고,
+바뀐 컴포넌트는 역참조 그래프를 따라가 그 컴포넌트를 (간접적으로) 쓰는 operation까지 찾아냅니다.
+
+- summary/description/example 등 문서 필드는 구조 해시에서 제외합니다. (properties의 필드 이름은 제외하지 않음)
+- 컴포넌트는 "schemas/User"처럼 "<section>/<name>"으로 표시합니다.
+
+사용처: export_schema(changelog), check_schema, 버전별 스키마 뷰
+"""
+
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+import hashlib
+from typing import Any
+
+import yaml
+
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml이 없으면 순수 Python 로더
+
+HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
+DOC_KEYS = frozenset({"summary", "description", "example", "examples", "externalDocs"})
+REF_PREFIX = "#/components/"
+
+OperationKey = tuple[str, str]  # (path, method)
+
+
+def load_schema_file(path: str) -> Any:
+    """YAML 스키마/changelog 파일을 읽습니다. (libyaml 사용 가능 시 C 로더)"""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+def iter_operations(schema: dict[str, Any]) -> dict[OperationKey, dict[str, Any]]:
+    """스키마에서 (path, method) -> operation 매핑을 추출합니다."""
+    result: dict[OperationKey, dict[str, Any]] = {}
+    for path, path_item in (schema.get("paths") or {}).items():
+        for method, operation in path_item.items():
+            if method in HTTP_METHODS and isinstance(operation, dict):
+                result[(path, method)] = operation
+    return result
+
+
+class SchemaIndex:
+    """
+    스키마 하나의 Merkle 해시 인덱스
+
+    components: 컴포넌트별 구조 해시와 직접 참조(refs)
+    operations: operation별 구조 해시(경로 공통 parameters 포함)와 직접 참조
+    dependents: 컴포넌트 -> 그 컴포넌트를 직접 참조하는 컴포넌트/operation (역참조)
+    """
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        self.schema = schema
+        self._memo: dict[tuple[int, bool], tuple[bytes, frozenset[str]]] = {}  # (id(node), is_map)
+
+        self.components: dict[str, bytes] = {}
+        self.component_refs: dict[str, frozenset[str]] = {}
+        for section, items in (schema.get("components") or {}).items():
+            if isinstance(items, dict):
+                for name, node in items.items():
+                    digest, refs = self._hash(node)
+                    self.components[f"{section}/{name}"] = digest
+                    self.component_refs[f"{section}/{name}"] = refs
+
+        self.operations = iter_operations(schema)
+        self.operation_hashes: dict[OperationKey, bytes] = {}
+        self.operation_refs: dict[OperationKey, frozenset[str]] = {}
+        for (path, method), operation in self.operations.items():
+            digest, refs = self._hash(operation)
+            shared_digest, shared_refs = self._hash(schema["paths"][path].get("parameters") or ())
+            self.operation_hashes[(path, method)] = hashlib.blake2b(digest + shared_digest, digest_size=16).digest()
+            self.operation_refs[(path, method)] = refs | shared_refs
+
+        self.dependents: dict[str | OperationKey, set[str | OperationKey]] = defaultdict(set)
+        for name, refs in self.component_refs.items():
+            for ref in refs:
+                self.dependents[ref].add(name)
+        for key, refs in self.operation_refs.items():
+            for ref in refs:
+                self.dependents[ref].add(key)
+
+        self.components_root = self._root(self.components)
+        self.paths_root = self._root(self.operation_hashes)
+
+    def _hash(self, node: Any, is_map: bool = False) -> tuple[bytes, frozenset[str]]:
+        """하위 트리의 구조 해시와 그 안의 $ref 목록. dict/list는 객체와 is_map 조합별로 한 번만 계산합니다. (YAML anchor로 공유된 객체)"""
+        if not isinstance(node, (dict, list)):
+            return hashlib.blake2b(repr(node).encode(), digest_size=16).digest(), frozenset()
+
+        memo = self._memo.get((id(node), is_map))
+        if memo is not None:
+            return memo
+
+        h = hashlib.blake2b(b"{" if isinstance(node, dict) else b"[", digest_size=16)
+        refs: set[str] = set()
+        if isinstance(node, dict):
+            for key in sorted(node, key=str):
+                if not is_map and key in DOC_KEYS:
+                    continue
+                value = node[key]
+                if key == "$ref" and isinstance(value, str) and value.startswith(REF_PREFIX):
+                    refs.add(value[len(REF_PREFIX) :])
+                digest, child_refs = self._hash(value, is_map=not is_map and key == "properties")
+                h.update(str(key).encode() + b"\0" + digest)
+                refs |= child_refs
+        else:
+            for item in node:
+                digest, child_refs = self._hash(item)
+                h.update(digest)
+                refs |= child_refs
+
+        result = (h.digest(), frozenset(refs))
+        self._memo[(id(node), is_map)] = result
+        return result
+
+    @staticmethod
+    def _root(hashes: dict[Any, bytes]) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        for key in sorted(hashes):
+            h.update(repr(key).encode() + hashes[key])
+        return h.digest()
+
+
+@dataclass(frozen=True)
+class OperationChange:
+    path: str
+    method: str
+    summary: str = ""
+    components: tuple[str, ...] = ()  # 수정 원인이 된 컴포넌트
+
+    def as_dict(self) -> dict[str, Any]:
+        result: dict[str, Any] = {"method": self.method.upper(), "path": self.path, "summary": self.summary}
+        if self.components:
+            result["components"] = list(self.components)
+        return result
+
+
+@dataclass
+class SchemaDiff:
+    added: list[OperationChange] = field(default_factory=list)
+    modified: list[OperationChange] = field(default_factory=list)
+    removed: list[OperationChange] = field(default_factory=list)
+    components: dict[str, list[str]] = field(default_factory=lambda: {"added": [], "modified": [], "removed": []})
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed or any(self.components.values()))
+
+    def as_changelog(self) -> dict[str, Any]:
+        """changelog.jsonl 항목 형식"""
+        return {
+            "added": [op.as_dict() for op in self.added],
+            "modified": [op.as_dict() for op in self.modified],
+            "removed": [op.as_dict() for op in self.removed],
+            "components": {kind: list(names) for kind, names in self.components.items()},
+        }
+
+
+def diff_schemas(prev: dict[str, Any] | SchemaIndex, curr: dict[str, Any] | SchemaIndex) -> SchemaDiff:
+    """두 스키마의 추가/수정/삭제 operation과 바뀐 컴포넌트를 반환합니다."""
+    prev = prev if isinstance(prev, SchemaIndex) else SchemaIndex(prev)
+    curr = curr if isinstance(curr, SchemaIndex) else SchemaIndex(curr)
+    diff = SchemaDiff()
+    if prev.paths_root == curr.paths_root and prev.components_root == curr.components_root:
+        return diff
+
+    def summary(index: SchemaIndex, key: OperationKey) -> str:
+        return index.operations[key].get("summary", "")
+
+    # 컴포넌트
+    changed: set[str] = set()
+    if prev.components_root != curr.components_root:
+        diff.components["added"] = sorted(curr.components.keys() - prev.components.keys())
+        diff.components["removed"] = sorted(prev.components.keys() - curr.components.keys())
+        diff.components["modified"] = sorted(name for name in prev.components.keys() & curr.components.keys() if prev.components[name] != curr.components[name])
+        changed = set(diff.components["modified"]) | set(diff.components["removed"])
+
+    # 바뀐 컴포넌트를 (간접) 참조하는 operation
+    causes: dict[OperationKey, set[str]] = defaultdict(set)
+    for component in changed:
+        seen: set[str | OperationKey] = {component}
+        queue: deque[str | OperationKey] = deque([component])
+        while queue:
+            node = queue.popleft()
+            for index in (prev, curr):
+                for dependent in index.dependents.get(node, ()):
+                    if dependent not in seen:
+                        seen.add(dependent)
+                        if isinstance(dependent, tuple):
+                            causes[dependent].add(component)
+                        else:
+                            queue.append(dependent)
+
+    # operation
+    for key in sorted(curr.operations.keys() - prev.operations.keys()):
+        diff.added.append(OperationChange(key[0], key[1], summary(curr, key)))
+    for key in sorted(prev.operations.keys() - curr.operations.keys()):
+        diff.removed.append(OperationChange(key[0], key[1], summary(prev, key)))
+    if prev.paths_root != curr.paths_root or causes:
+        for key in sorted(prev.operations.keys() & curr.operations.keys()):
+            if prev.operation_hashes[key] != curr.operation_hashes[key] or key in causes:
+                diff.modified.append(OperationChange(key[0], key[1], summary(curr, key), tuple(sorted(causes.get(key, ())))))
+    return diff
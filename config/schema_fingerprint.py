@@ -0,0 +1,79 @@
+"""
+API 스키마 입력 fingerprint
+
+스키마 생성에 영향을 주는 소스(views/serializers/urls/models 모듈, 스키마 커스터마이징, renderer/throttling, settings, 저장된 schema_v*.yml)의 해시입니다.
+check_schema가 비교에 성공하면 fingerprint를 .cache/에 기록하고, 다음 실행 때 같으면 스키마 생성과 YAML 파싱을 건너뜁니다.
+
+Django 부팅 없이도 확인할 수 있도록 표준 라이브러리만 사용합니다. (pre-commit: scripts/check-schema.sh)
+
+    python config/schema_fingerprint.py   # 일치하면 exit 0, 아니면 exit 1
+"""
+
+import hashlib
+import os
+from pathlib import Path
+import re
+import sys
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+FINGERPRINT_PATH = BASE_DIR / ".cache" / "check_schema.fingerprint"
+
+# BASE_DIR 기준 상대 경로 (POSIX 구분자)
+SOURCE_RE = re.compile(r"(^|/)(views|serializers|urls|mixins|models)(/.+)?\.py$")
+SCHEMA_SOURCES = (
+    "config/settings.py",
+    "config/custom_schema.py",
+    "config/schema_categories.py",
+    "config/schema_views",
+    "config/renderers.py",  # 응답 media type
+    "config/throttling.py",  # 429 응답
+    ".env",
+    "requirements.txt",
+)
+SAVED_SCHEMA_RE = re.compile(r"^static/docs/schema_v[^/]+\.yml$")
+SKIP_DIRS = {".git", ".cache", ".venv", "venv", "node_modules", "__pycache__", "migrations", "media", "staticfiles", "staticfiles-manifest"}
+
+
+def iter_sources(base_dir: Path) -> list[str]:
+    """fingerprint에 포함할 파일의 상대 경로 (정렬됨)"""
+    names = []
+    for root, dirs, files in os.walk(base_dir):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
+        rel_root = os.path.relpath(root, base_dir).replace(os.sep, "/")
+        for filename in files:
+            name = filename if rel_root == "." else f"{rel_root}/{filename}"
+            if SOURCE_RE.search(name) or SAVED_SCHEMA_RE.match(name) or (name.startswith(SCHEMA_SOURCES) and name.endswith((".py", ".env", ".txt"))):
+                names.append(name)
+    return sorted(names)
+
+
+def compute_fingerprint(base_dir: Path = BASE_DIR) -> str:
+    digest = hashlib.sha256(sys.version.encode())
+    for name in iter_sources(base_dir):
+        digest.update(name.encode() + b"\0")
+        digest.update(hashlib.sha256((base_dir / name).read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def read_fingerprint(path: Path | None = None) -> str | None:
+    try:
+        return (path or FINGERPRINT_PATH).read_text().strip()
+    except FileNotFoundError:
+        return None
+
+
+def write_fingerprint(fingerprint: str, path: Path | None = None) -> None:
+    path = path or FINGERPRINT_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(fingerprint)
+    os.replace(tmp, path)
+
+
+def is_unchanged(base_dir: Path = BASE_DIR, path: Path | None = None) -> bool:
+    """마지막으로 검사를 통과한 fingerprint와 같은지"""
+    return read_fingerprint(path) == compute_fingerprint(base_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if is_unchanged() else 1)
@@ -2,21 +2,103 @@
 Base Schema View
 
 모든 카테고리별 스키마 뷰의 베이스 클래스를 제공합니다.
+
+카테고리 스키마는 그 카테고리 URL 패턴만으로 생성하고(TagFilteredSchemaGenerator) 프로세스 안에 보관합니다.
+첫 요청은 요청한 카테고리만 생성해 응답하고, 나머지 카테고리는 백그라운드 스레드에서 동시에 준비합니다. (start_warmup)
+생성은 카테고리별 lock으로 막으므로 서로 다른 카테고리는 기다리지 않습니다.
+스키마 입력 fingerprint(config.schema_fingerprint)가 바뀌면 보관된 스키마를 버립니다. (FINGERPRINT_CHECK_INTERVAL초마다 확인)
 """
 
-import json
-from typing import Any
+from collections import defaultdict
+import threading
+import time
+from typing import Any, Iterable
+
+from django.conf import settings
 
 from constance import config  # type: ignore[import-untyped]
-from drf_spectacular.generators import SchemaGenerator
 from drf_spectacular.views import SpectacularAPIView
 from rest_framework.response import Response
 
+from config.custom_schema import TagFilteredSchemaGenerator
+from config.schema_categories import CATEGORY_TAGS, used_tags
+from config.schema_fingerprint import compute_fingerprint
+
+SCHEMA_CATEGORIES: tuple[str | None, ...] = (None, *CATEGORY_TAGS)  # None: 전체
+
+_schemas: dict[str | None, dict[str, Any]] = {}
+_schemas_lock = threading.Lock()
+_generate_locks: defaultdict[str | None, threading.Lock] = defaultdict(threading.Lock)  # 카테고리별 (_schemas_lock 안에서 생성)
+_warmup_started = False
+_fingerprint: str | None = None
+_fingerprint_checked_at = 0.0
+
+FINGERPRINT_CHECK_INTERVAL = 5.0  # 초
+
+
+def generate_schema(category: str | None) -> dict[str, Any]:
+    """카테고리 URL 패턴만 분석해 스키마를 생성합니다. (None이면 전체)"""
+    return TagFilteredSchemaGenerator(category=category).get_schema(public=True)
+
+
+def warm_schemas(categories: Iterable[str | None] = SCHEMA_CATEGORIES) -> None:
+    """아직 없는 카테고리 스키마를 생성해 보관합니다."""
+    for category in categories:
+        get_schema(category, warm=False)
+
+
+def start_warmup() -> None:
+    """나머지 카테고리 스키마를 요청 처리와 동시에 백그라운드 스레드에서 생성합니다. (프로세스당 한 번)"""
+    global _warmup_started
+    with _schemas_lock:
+        if _warmup_started:
+            return
+        _warmup_started = True
+    threading.Thread(target=warm_schemas, name="schema-warmup", daemon=True).start()
+
+
+def get_schema(category: str | None, warm: bool = True) -> dict[str, Any]:
+    """보관된 카테고리 스키마. 없으면 그 카테고리만 생성하고 나머지는 백그라운드에서 준비합니다."""
+    check_fingerprint()
+    schema = _schemas.get(category)
+    if schema is None:
+        with _schemas_lock:
+            lock = _generate_locks[category]
+        with lock:  # 같은 스키마를 여러 스레드가 중복 생성하지 않도록
+            schema = _schemas.get(category)
+            if schema is None:
+                schema = _schemas[category] = generate_schema(category)
+        if warm:
+            start_warmup()
+    return schema
+
+
+def check_fingerprint() -> None:
+    """스키마 입력 fingerprint가 바뀌었으면 보관된 스키마를 버립니다. (FINGERPRINT_CHECK_INTERVAL초 안에는 다시 계산하지 않음)"""
+    global _fingerprint, _fingerprint_checked_at
+    now = time.monotonic()
+    if now - _fingerprint_checked_at < FINGERPRINT_CHECK_INTERVAL:
+        return
+    _fingerprint_checked_at = now
+    fingerprint = compute_fingerprint(settings.BASE_DIR)
+    with _schemas_lock:
+        if _fingerprint is not None and fingerprint != _fingerprint:
+            _schemas.clear()
+        _fingerprint = fingerprint
+
+
+def clear_schemas() -> None:
+    global _warmup_started, _fingerprint, _fingerprint_checked_at
+    _schemas.clear()
+    _warmup_started = False
+    _fingerprint = None
+    _fingerprint_checked_at = 0.0
+
 
 class CategoryAPISchemaView(SpectacularAPIView):
     """Base class for category-specific schema views"""
 
-    category_tags: list[str] = []
+    category: str | None = None  # config.schema_categories.CATEGORY_TAGS의 키, None이면 전체
     schema_title = ""
     schema_description = """
 
@@ -29,12 +111,9 @@ class CategoryAPISchemaView(SpectacularAPIView):
     tag_descriptions: dict[str, str] = {}
 
     def get(self, request, *args, **kwargs):
-        """Override get method to filter by tags"""
-        print(f"=== {self.__class__.__name__} get() called ===")
-        print(f"Target tags: {self.category_tags}")
-
-        generator = SchemaGenerator(patterns=None)
-        schema = generator.get_schema(request=request, public=True)
+        """카테고리 태그에 해당하는 operation만 남긴 스키마"""
+        cached = get_schema(self.category)
+        schema = {**cached, "info": dict(cached["info"])}  # 보관된 스키마는 변경하지 않음
 
         # constance에서 API 버전 동적 적용
         schema["info"]["version"] = config.API_VERSION
@@ -45,55 +124,15 @@ class CategoryAPISchemaView(SpectacularAPIView):
         if self.schema_description:
             schema["info"]["description"] = self.schema_description
 
-        if self.category_tags:
-            filtered_paths = {}
-
-            for path, path_item in schema["paths"].items():
-                should_include = False
-                filtered_methods = {}
-
-                for method, operation in path_item.items():
-                    if method.startswith("_"):
-                        continue
-
-                    operation_tags = operation.get("tags", [])
-
-                    # 접두사 기반 매칭
-                    tag_match = False
-                    for operation_tag in operation_tags:
-                        for target_tag in self.category_tags:
-                            if operation_tag == target_tag or operation_tag.startswith(target_tag + "-"):
-                                tag_match = True
-                                break
-                        if tag_match:
-                            break
-
-                    if operation_tags and tag_match:
-                        should_include = True
-                        filtered_methods[method] = operation
-
-                if should_include:
-                    filtered_paths[path] = filtered_methods
-
-            schema["paths"] = filtered_paths
-
         # 모든 자식 클래스들의 tag_descriptions를 합침
         combined_tag_descriptions = self._get_combined_tag_descriptions()
 
         # 카테고리별 태그 설명 추가
         if combined_tag_descriptions:
-            if "tags" not in schema:
-                schema["tags"] = []
-
-            # 현재 스키마에 실제로 사용된 태그들만 설명 추가
-            used_tags = set()
-            for path_item in schema["paths"].values():
-                for operation in path_item.values():
-                    if isinstance(operation, dict) and "tags" in operation:
-                        used_tags.update(operation["tags"])
-
-            # 사용된 태그에 대해서만 설명 추가
-            for tag in used_tags:
+            schema["tags"] = list(schema.get("tags", []))
+
+            # 현재 스키마에 실제로 사용된 태그에 대해서만 설명 추가
+            for tag in sorted(used_tags(schema["paths"])):
                 if tag in combined_tag_descriptions:
                     schema["tags"].append({"name": tag, "description": combined_tag_descriptions[tag]})
 
@@ -121,5 +160,4 @@ class CategoryAPISchemaView(SpectacularAPIView):
         except ImportError:
             pass  # 초기화 단계에서는 무시
 
-        print(f"Combined tag descriptions: {list(combined.keys())}")
         return combined
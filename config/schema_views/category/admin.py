@@ -10,7 +10,7 @@ from ..base import CategoryAPISchemaView
 class AdminAPISchemaView(CategoryAPISchemaView):
     """Admin API 스키마 뷰"""
 
-    category_tags = ["admin", "management"]
+    category = "admin"
     schema_title = "Admin APIs"
     schema_description = """
 ## 🛡️ 관리자 전용 API
@@ -10,7 +10,7 @@ from ..base import CategoryAPISchemaView
 class AppAPISchemaView(CategoryAPISchemaView):
     """App API 스키마 뷰"""
 
-    category_tags = ["app", "user"]
+    category = "app"
     schema_title = "App APIs"
     schema_description = """
 ## 📱 일반 애플리케이션 API
@@ -10,7 +10,7 @@ from ..base import CategoryAPISchemaView
 class ExternalAPISchemaView(CategoryAPISchemaView):
     """External API 스키마 뷰"""
 
-    category_tags = ["external", "public", "integration"]
+    category = "external"
     schema_title = "External APIs"
     schema_description = """
 ## 🌐 외부 연동 API
@@ -3,27 +3,43 @@ Versioned Schema Views
 
 저장된 API 스키마 파일을 버전별로 제공하고,
 이전 버전 대비 신규(🆕)/수정(✏️) 엔드포인트에 딱지를 표시합니다.
+
+딱지와 카테고리 필터를 적용한 JSON은 export_schema가 버전 x 카테고리별로 미리 만들어 두고 (gzip/brotli 포함),
+VersionedSchemaAPIView는 Accept-Encoding에 맞는 파일을 FileResponse로 그대로 전송합니다.
+파일이 없거나 원본 YAML보다 오래된 경우(배포 후 첫 요청 등)에는 요청 시점에 다시 만듭니다.
 """
 
+import gzip
 import os
+from pathlib import Path
 import re
 from typing import Any
 
 from django.conf import settings
+from django.core.cache import cache
+from django.http import FileResponse, HttpResponseBase
 from django.urls import reverse
+from django.utils.cache import patch_vary_headers
 
+import brotli  # type: ignore[import-untyped]
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+import orjson
 from rest_framework.response import Response
 from rest_framework.views import APIView
-import yaml
+
+from config.schema_categories import CATEGORY_TAGS, category_matcher
+from config.schema_changelog import ChangelogStore, version_key
+from config.schema_diff import diff_schemas, load_schema_file
 
 SCHEMA_DIR = os.path.join(settings.BASE_DIR, "static", "docs")
 
-CATEGORY_TAGS: dict[str, list[str]] = {
-    "app": ["app", "user"],
-    "admin": ["admin", "management"],
-    "external": ["external", "public", "integration"],
-}
+ARTIFACT_CATEGORIES = ("all", *CATEGORY_TAGS)
+DIFF_CACHE_KEY = "schema-diff:{}:{}:{}"  # from, to, changelog 파일 상태
+
+_changelog_stores: dict[str, ChangelogStore] = {}
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))  # 선호 순서
 
 
 def get_available_versions() -> list[str]:
@@ -38,7 +54,7 @@ def get_available_versions() -> list[str]:
         if match:
             versions.append(match.group(1))
 
-    versions.sort(key=lambda v: [int(x) for x in v.split(".")])
+    versions.sort(key=version_key)
     return versions
 
 
@@ -57,31 +73,21 @@ def load_schema(version: str) -> dict[str, Any] | None:
     filepath = os.path.join(SCHEMA_DIR, f"schema_v{version}.yml")
     if not os.path.exists(filepath):
         return None
-    with open(filepath, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_schema_file(filepath)
 
 
-def get_path_methods(schema: dict[str, Any]) -> set[tuple[str, str]]:
-    """스키마에서 (path, method) 조합 set을 추출합니다."""
-    result: set[tuple[str, str]] = set()
-    for path, path_item in schema.get("paths", {}).items():
-        for method in path_item:
-            if not method.startswith("x-") and method != "parameters":
-                result.add((path, method))
-    return result
+def get_changelog_store() -> ChangelogStore:
+    """SCHEMA_DIR/changelog.jsonl 저장소 (경로별로 하나, 프로세스에 보관)"""
+    path = os.path.join(SCHEMA_DIR, "changelog.jsonl")
+    store = _changelog_stores.get(path)
+    if store is None:
+        store = _changelog_stores[path] = ChangelogStore(path)
+    return store
 
 
 def load_changelog(version: str) -> dict[str, Any] | None:
-    """changelog.yml에서 특정 버전의 변경사항을 로드합니다."""
-    changelog_path = os.path.join(SCHEMA_DIR, "changelog.yml")
-    if not os.path.exists(changelog_path):
-        return None
-    with open(changelog_path, "r", encoding="utf-8") as f:
-        changelog = yaml.safe_load(f) or []
-    for entry in changelog:
-        if entry.get("version") == version:
-            return entry
-    return None
+    """changelog에서 특정 버전의 변경사항을 로드합니다."""
+    return get_changelog_store().get(version)
 
 
 def mark_changes(
@@ -107,104 +113,158 @@ def mark_changes(
     return schema
 
 
-def filter_schema_by_category(schema: dict[str, Any], category: str) -> dict[str, Any]:
-    """스키마에서 특정 카테고리 태그에 해당하는 경로만 필터링합니다."""
-    target_tags = CATEGORY_TAGS.get(category, [])
-    if not target_tags:
-        return schema
+def compile_schemas(version: str, versions: list[str]) -> dict[str, dict[str, Any]] | None:
+    """딱지, 카테고리 필터, 버전 메타데이터를 적용한 카테고리별 스키마 (스키마를 한 번만 읽고 경로 dict만 나눔)"""
+    schema = load_schema(version)
+    if schema is None:
+        return None
 
-    filtered_paths: dict[str, Any] = {}
-    for path, path_item in schema.get("paths", {}).items():
-        filtered_methods: dict[str, Any] = {}
-        for method, operation in path_item.items():
-            if not isinstance(operation, dict):
-                continue
-            operation_tags = operation.get("tags", [])
-            for op_tag in operation_tags:
-                if any(op_tag == t or op_tag.startswith(f"{t}-") for t in target_tags):
-                    filtered_methods[method] = operation
-                    break
-        if filtered_methods:
-            filtered_paths[path] = filtered_methods
-
-    schema["paths"] = filtered_paths
-    return schema
+    # changelog에서 변경사항 로드
+    changelog = load_changelog(version)
+
+    new_endpoints: set[tuple[str, str]] = set()
+    modified_endpoints: set[tuple[str, str]] = set()
+
+    if changelog:
+        for ep in changelog.get("added", []):
+            new_endpoints.add((ep["path"], ep["method"].lower()))
+        for ep in changelog.get("modified", []):
+            modified_endpoints.add((ep["path"], ep["method"].lower()))
+
+    prev_version = get_previous_version(version, versions)
+
+    # changelog가 없을 때는 이전 버전 스키마와 직접 비교
+    if not changelog and prev_version:
+        prev_schema = load_schema(prev_version)
+        if prev_schema:
+            diff = diff_schemas(prev_schema, schema)
+            new_endpoints = {(op.path, op.method) for op in diff.added}
+            modified_endpoints = {(op.path, op.method) for op in diff.modified}
+
+    if new_endpoints or modified_endpoints:
+        schema = mark_changes(schema, new_endpoints, modified_endpoints)
+
+    # 버전 정보 메타데이터 추가
+    info = schema.setdefault("info", {})
+    info["x-versions"] = versions
+    info["x-current-version"] = version
+    if prev_version:
+        info["x-previous-version"] = prev_version
+    if changelog:
+        info["x-changelog"] = {
+            "added": len(changelog.get("added", [])),
+            "modified": len(changelog.get("modified", [])),
+            "removed": len(changelog.get("removed", [])),
+        }
+
+    # 카테고리 링크 추가
+    category_links = (
+        f"\n\n### 🔗 관련 API 문서 (v{version})\n"
+        f"- **[📋 전체 API](/swagger/versions/{version}/)** - 모든 API\n"
+        f"- **[📱 App API](/swagger/versions/{version}/app/)** - 앱 서비스\n"
+        f"- **[🛠️ Admin API](/swagger/versions/{version}/admin/)** - 관리자\n"
+        f"- **[🌐 External API](/swagger/versions/{version}/external/)** - 외부 연동\n"
+    )
+    info["description"] = info.get("description", "") + category_links
+
+    compiled = {"all": schema}
+    for category, paths in category_matcher.split(schema.get("paths", {})).items():
+        compiled[category] = {**schema, "info": info, "paths": paths}
+    return compiled
+
+
+def artifact_path(version: str, category: str) -> Path:
+    """미리 만든 스키마 JSON 경로 (압축본은 .gz/.br 접미사)"""
+    return Path(SCHEMA_DIR) / "compiled" / f"v{version}" / f"{category}.json"
+
+
+def is_artifact_stale(version: str, path: Path) -> bool:
+    """원본 스키마/changelog가 바뀌었거나 버전이 추가(디렉터리 변경)되어 다시 만들어야 하는지"""
+    try:
+        built_at = path.stat().st_mtime
+    except FileNotFoundError:
+        return True
+    sources = (SCHEMA_DIR, os.path.join(SCHEMA_DIR, f"schema_v{version}.yml"), os.path.join(SCHEMA_DIR, "changelog.jsonl"))
+    return any(os.path.exists(source) and os.stat(source).st_mtime > built_at for source in sources)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_artifacts(version: str, versions: list[str] | None = None) -> list[Path]:
+    """버전의 카테고리별 JSON과 gzip/brotli 압축본을 만듭니다."""
+    compiled = compile_schemas(version, versions or get_available_versions())
+    if compiled is None:
+        return []
+
+    paths = []
+    for category, document in compiled.items():
+        path = artifact_path(version, category)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = orjson.dumps(document, option=orjson.OPT_NON_STR_KEYS)
+        _write_atomic(path.with_name(path.name + ".gz"), gzip.compress(data, compresslevel=9, mtime=0))
+        _write_atomic(path.with_name(path.name + ".br"), brotli.compress(data, mode=brotli.MODE_TEXT, quality=11))
+        _write_atomic(path, data)  # 원본을 마지막에 써서 존재 여부로 완성 여부를 판단
+        paths.append(path)
+    return paths
 
 
 class VersionedSchemaAPIView(APIView):
-    """버전별 스키마를 제공하고, 신규/수정된 엔드포인트에 딱지를 표시합니다."""
+    """버전별 스키마를 제공하고, 신규/수정된 엔드포인트에 딱지를 표시합니다. (미리 만든 JSON 파일 전송)"""
 
     authentication_classes: list[Any] = []
     permission_classes: list[Any] = []
 
-    def get(self, request: Any, version: str, category: str | None = None) -> Response:
+    def get(self, request: Any, version: str, category: str | None = None) -> HttpResponseBase:
+        category = category or self.kwargs.get("category") or "all"
         versions = get_available_versions()
-        schema = load_schema(version)
-
-        if schema is None:
-            return Response(
-                {"error": f"Schema v{version} not found."},
-                status=404,
-            )
-
-        # changelog에서 변경사항 로드
-        changelog = load_changelog(version)
-
-        new_endpoints: set[tuple[str, str]] = set()
-        modified_endpoints: set[tuple[str, str]] = set()
-
-        if changelog:
-            for ep in changelog.get("added", []):
-                new_endpoints.add((ep["path"], ep["method"].lower()))
-            for ep in changelog.get("modified", []):
-                modified_endpoints.add((ep["path"], ep["method"].lower()))
-
-        if new_endpoints or modified_endpoints:
-            schema = mark_changes(schema, new_endpoints, modified_endpoints)
-
-        # 이전 버전이 없을 때는 path-method 비교 폴백
-        if not changelog:
-            prev_version = get_previous_version(version, versions)
-            if prev_version:
-                prev_schema = load_schema(prev_version)
-                if prev_schema:
-                    current_eps = get_path_methods(schema)
-                    prev_eps = get_path_methods(prev_schema)
-                    fallback_new = current_eps - prev_eps
-                    if fallback_new:
-                        schema = mark_changes(schema, fallback_new, set())
-
-        # 카테고리 필터링
-        category = category or self.kwargs.get("category")
-        if category:
-            schema = filter_schema_by_category(schema, category)
-
-        # 버전 정보 메타데이터 추가
-        prev_version = get_previous_version(version, versions)
-        schema.setdefault("info", {})
-        schema["info"]["x-versions"] = versions
-        schema["info"]["x-current-version"] = version
-        if prev_version:
-            schema["info"]["x-previous-version"] = prev_version
-        if changelog:
-            schema["info"]["x-changelog"] = {
-                "added": len(changelog.get("added", [])),
-                "modified": len(changelog.get("modified", [])),
-                "removed": len(changelog.get("removed", [])),
-            }
+        if version not in versions:
+            return Response({"error": f"Schema v{version} not found."}, status=404)
+        if category not in ARTIFACT_CATEGORIES:
+            return Response({"error": f"Unknown category: {category}"}, status=404)
+
+        path = artifact_path(version, category)
+        if is_artifact_stale(version, path):
+            write_artifacts(version, versions)
+
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        for encoding, suffix in ENCODINGS:
+            compressed = path.with_name(path.name + suffix)
+            if re.search(rf"\b{encoding}\b", accept_encoding) and compressed.exists():
+                response = FileResponse(compressed.open("rb"), content_type="application/json")
+                response["Content-Encoding"] = encoding
+                break
+        else:
+            response = FileResponse(path.open("rb"), content_type="application/json")
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
+
+
+class VersionDiffAPIView(APIView):
+    """두 버전 사이의 순 변경사항 (버전별 changelog delta를 합산, changelog가 바뀔 때까지 캐시)"""
 
-        # 카테고리 링크 추가
-        category_links = (
-            f"\n\n### 🔗 관련 API 문서 (v{version})\n"
-            f"- **[📋 전체 API](/swagger/versions/{version}/)** - 모든 API\n"
-            f"- **[📱 App API](/swagger/versions/{version}/app/)** - 앱 서비스\n"
-            f"- **[🛠️ Admin API](/swagger/versions/{version}/admin/)** - 관리자\n"
-            f"- **[🌐 External API](/swagger/versions/{version}/external/)** - 외부 연동\n"
-        )
-        description = schema["info"].get("description", "")
-        schema["info"]["description"] = description + category_links
+    authentication_classes: list[Any] = []
+    permission_classes: list[Any] = []
 
-        return Response(schema)
+    @extend_schema(summary="스키마 버전 간 변경사항", responses={200: OpenApiTypes.OBJECT, 400: OpenApiTypes.OBJECT, 404: OpenApiTypes.OBJECT})
+    def get(self, request: Any, from_version: str, to_version: str) -> Response:
+        versions = get_available_versions()
+        for version in (from_version, to_version):
+            if version not in versions:
+                return Response({"error": f"Schema v{version} not found."}, status=404)
+        if version_key(from_version) > version_key(to_version):
+            return Response({"error": "from 버전은 to 버전보다 이전이어야 합니다."}, status=400)
+
+        store = get_changelog_store()
+        cache_key = DIFF_CACHE_KEY.format(from_version, to_version, store.token)
+        result = cache.get(cache_key)
+        if result is None:
+            result = store.net_diff(from_version, to_version)
+            cache.set(cache_key, result, None)
+        return Response(result)
 
 
 class VersionListAPIView(APIView):
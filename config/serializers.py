@@ -0,0 +1,90 @@
+"""
+values() 기반 읽기 전용 Serializer
+
+ModelSerializer의 필드 목록으로 필드별 변환 함수를 클래스 생성 시 한 번만 컴파일하고,
+queryset.values() row(dict)를 모델 인스턴스 생성 없이 바로 응답 형태로 변환합니다.
+출력은 원본 ModelSerializer와 동일합니다.
+
+사용법:
+    class UserListValuesSerializer(ValuesSerializer):
+        serializer_class = UserListSerializer
+
+    UserListValuesSerializer.serialize(User.objects.values(*UserListValuesSerializer.fields))
+"""
+
+from typing import Any, Callable, ClassVar, Iterable
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.utils import timezone
+
+from rest_framework import serializers
+
+Converter = Callable[[Any], Any]
+
+
+def _datetime_converter() -> Converter:
+    """DRF DateTimeField(ISO 8601)와 동일하게 기본 타임존(Asia/Seoul)으로 변환합니다."""
+    tz = timezone.get_default_timezone()
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+def _optional(func: Converter) -> Converter:
+    return lambda value: None if value is None else func(value)
+
+
+def compile_converter(field: models.Field) -> Converter | None:
+    """모델 필드에 맞는 변환 함수를 반환합니다. 변환이 필요 없으면 None."""
+    if isinstance(field, models.DateTimeField):
+        return _datetime_converter()
+    if isinstance(field, models.DateField):
+        return _optional(lambda value: value.isoformat())
+    if isinstance(field, models.BooleanField):
+        return _optional(bool)
+    if isinstance(field, (models.DecimalField, models.UUIDField)):
+        return _optional(str)
+    return None
+
+
+class ValuesSerializer:
+    """values() row를 미리 컴파일된 필드 변환기로 직렬화하는 읽기 전용 Serializer"""
+
+    serializer_class: ClassVar[type[serializers.ModelSerializer] | None] = None
+    fields: ClassVar[list[str]] = []
+    converters: ClassVar[dict[str, Converter | None]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.serializer_class is None:
+            return
+
+        meta = cls.serializer_class.Meta
+        model: type[models.Model] = meta.model
+        declared = cls.serializer_class._declared_fields
+        write_only = {name for name, options in getattr(meta, "extra_kwargs", {}).items() if options.get("write_only")}
+        cls.fields = [name for name in meta.fields if name not in write_only and not getattr(declared.get(name), "write_only", False)]
+        cls.converters = {}
+        for name in cls.fields:
+            if name in declared:
+                raise ImproperlyConfigured(f"{cls.__name__}: declared field '{name}' is not supported by ValuesSerializer")
+            try:
+                model_field = model._meta.get_field(name)
+            except FieldDoesNotExist as e:
+                raise ImproperlyConfigured(f"{cls.__name__}: '{name}' is not a model field") from e
+            if not isinstance(model_field, models.Field):  # 역참조 / GenericForeignKey는 values() 컬럼이 아님
+                raise ImproperlyConfigured(f"{cls.__name__}: '{name}' is not a concrete model field")
+            cls.converters[name] = compile_converter(model_field)
+
+    @classmethod
+    def serialize(cls, rows: Iterable[dict[str, Any]], fields: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        plan = [(name, cls.converters[name]) for name in (cls.fields if fields is None else fields)]
+        return [{name: convert(row[name]) if convert else row[name] for name, convert in plan} for row in rows]
@@ -0,0 +1,6 @@
+"""
+세션 백엔드
+
+Django 기본 세션 백엔드에 constance SESSION_TIMEOUT_MINUTES 만료 시간을 적용한 SessionStore를 제공합니다.
+settings.SESSION_PROFILE(환경변수)로 사용할 백엔드를 선택합니다.
+"""
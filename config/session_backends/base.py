@@ -0,0 +1,8 @@
+from utils.runtime_config import get_config
+
+
+class RuntimeExpiryMixin:
+    """세션 만료 시간을 constance SESSION_TIMEOUT_MINUTES에서 읽습니다 (프로세스 메모리에 보관한 값이라 DB 조회 없음)."""
+
+    def get_session_cookie_age(self) -> int:
+        return get_config("SESSION_TIMEOUT_MINUTES") * 60
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends.db import SessionStore as BaseSessionStore
+
+from .base import RuntimeExpiryMixin
+
+
+class SessionStore(RuntimeExpiryMixin, BaseSessionStore):
+    pass
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends.signed_cookies import SessionStore as BaseSessionStore
+
+from .base import RuntimeExpiryMixin
+
+
+class SessionStore(RuntimeExpiryMixin, BaseSessionStore):
+    pass
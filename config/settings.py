@@ -13,7 +13,8 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 import os
 from pathlib import Path
 
-import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 import environ
 
 from .unfold import unfold_settings
@@ -79,6 +80,7 @@ INSTALLED_APPS = [
     "djmoney",
     "storages",
     "user",
+    "upload",
 ]
 
 # django-money 설정
@@ -89,6 +91,7 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "config.middleware.ReadReplicaMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -96,6 +99,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django_browser_reload.middleware.BrowserReloadMiddleware",
     "config.middleware.Admin404RedirectMiddleware",
+    "config.middleware.UserActivityMiddleware",
 ]
 
 CORS_ALLOWED_ORIGINS = [
@@ -115,6 +119,15 @@ DATABASES = {
     }
 }
 
+# 읽기 replica (config.db_router): DB URL 목록, 예) DATABASE_REPLICAS=sqlite:////var/db/replica.sqlite3
+# 지정한 ViewSet(ReadReplicaMixin)의 GET과 admin changelist의 조회만 replica로 보내고 쓰기는 항상 default로 보냅니다.
+READ_REPLICAS: list[str] = []
+for _index, _url in enumerate(env.list("DATABASE_REPLICAS", default=[]), start=1):
+    DATABASES[f"replica{_index}"] = {**env.db_url_config(_url), "TEST": {"MIRROR": "default"}}
+    READ_REPLICAS.append(f"replica{_index}")
+READ_REPLICA_STICKY_SECONDS = env.int("READ_REPLICA_STICKY_SECONDS", default=5)  # 쓰기 후 primary로 조회하는 시간
+DATABASE_ROUTERS = ["config.db_router.ReadReplicaRouter"]
+
 REST_FRAMEWORK = {"DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema"}
 
 # DRF Spectacular settings
@@ -146,12 +159,70 @@ SPECTACULAR_SETTINGS = {
         "docExpansion": "list",
     },
     "COMPONENT_SPLIT_REQUEST": True,
+    # 같은 필드명(method 등)에 다른 선택지가 쓰이면 MethodXXXEnum처럼 해시가 붙으므로 이름을 고정합니다.
+    "ENUM_NAME_OVERRIDES": {
+        "UploadMethodEnum": "upload.models.Upload.Method",
+        "UploadStatusEnum": "upload.models.Upload.Status",
+    },
     "SORT_OPERATIONS": False,
     "TAG_SORTER": lambda x: x,  # 태그 정렬 방식
 }
 
 TIMEOUT = 600
 
+# Cache 설정 (REDIS_URL이 없으면 프로세스 로컬 메모리 캐시 사용)
+REDIS_URL = env("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# 세션 백엔드 (만료 시간은 constance SESSION_TIMEOUT_MINUTES)
+# - cached_db: 캐시에서 읽고 캐시 miss일 때만 DB 조회 (기본값)
+# - signed_cookies: 서명된 쿠키에 저장하여 서버 저장소를 조회하지 않음 (서버에서 강제 만료 불가, 쿠키 크기 제한)
+# - db: Django 기본 DB 세션
+SESSION_PROFILE = env("SESSION_PROFILE", default="cached_db")
+SESSION_ENGINE = f"config.session_backends.{SESSION_PROFILE}"
+
+# constance 값 캐시 (Redis를 쓸 때만, LocMemCache는 constance가 지원하지 않음)
+if REDIS_URL:
+    CONSTANCE_DATABASE_CACHE_BACKEND = "default"
+
+# API throttle 클라이언트별 한도 (config.throttling, 기본 한도는 constance API_RATE_LIMIT_*)
+# 예: {"external": {"user:42": "6000/min", "ip:10.0.0.5": ""}}
+API_THROTTLE_CLIENT_RATES: dict[str, dict[str, str]] = {}
+
+# 사용자 활동 이벤트 버퍼 (user.activity)
+ACTIVITY_BUFFER_SIZE = 1000  # 이 개수가 쌓이면 즉시 저장
+ACTIVITY_FLUSH_INTERVAL = 5.0  # 초 단위 저장 주기
+
+# 비활성 유저 보관 (user archive_users 커맨드): 비활성화 후 이 기간이 지나면 archived_user 테이블로 옮김
+USER_ARCHIVE_RETENTION_DAYS = env.int("USER_ARCHIVE_RETENTION_DAYS", default=365)
+
+# 관리자 로그 보관 (config archive_admin_logs 커맨드): 이 기간이 지난 LogEntry를 archived_admin_log 테이블로 옮김
+ADMIN_LOG_RETENTION_DAYS = env.int("ADMIN_LOG_RETENTION_DAYS", default=90)
+
+# Celery 설정
+CELERY_BROKER_URL = env("CELERY_BROKER_URL", default=REDIS_URL or "redis://localhost:6379/0")
+CELERY_TIMEZONE = "Asia/Seoul"
+CELERY_BEAT_SCHEDULE = {}
+if REDIS_URL:
+    # 대시보드 카드 지표를 미리 계산해 둡니다 (config.metrics)
+    # 로컬 메모리 캐시는 worker 프로세스 안에만 저장되어 웹 프로세스가 읽을 수 없으므로 공유 캐시일 때만 예약합니다.
+    CELERY_BEAT_SCHEDULE["refresh-dashboard-metrics"] = {
+        "task": "config.tasks.refresh_dashboard_metrics",
+        "schedule": 30.0,
+    }
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -189,6 +260,23 @@ AUTH_PASSWORD_VALIDATORS = [
 
 AUTH_USER_MODEL = "user.User"
 
+# 비밀번호 해싱 (config.hashers): 새 비밀번호는 PASSWORD_HASHER로 해싱하고, 나머지는 기존 해시 검증용
+# 작업량을 바꾸거나 PASSWORD_HASHER를 바꾸면 기존 해시는 다음 로그인 성공 시 새 설정으로 다시 해싱됩니다.
+PASSWORD_HASHER = env("PASSWORD_HASHER", default="pbkdf2_sha256")  # pbkdf2_sha256 / bcrypt_sha256 / argon2
+PASSWORD_PBKDF2_ITERATIONS = env.int("PASSWORD_PBKDF2_ITERATIONS", default=None)  # None이면 Django 기본값
+PASSWORD_BCRYPT_ROUNDS = env.int("PASSWORD_BCRYPT_ROUNDS", default=None)
+PASSWORD_ARGON2_TIME_COST = env.int("PASSWORD_ARGON2_TIME_COST", default=None)
+PASSWORD_ARGON2_MEMORY_COST = env.int("PASSWORD_ARGON2_MEMORY_COST", default=None)  # KiB
+_PASSWORD_HASHERS = {
+    "pbkdf2_sha256": "config.hashers.PBKDF2PasswordHasher",
+    "bcrypt_sha256": "config.hashers.BCryptSHA256PasswordHasher",
+    "argon2": "config.hashers.Argon2PasswordHasher",
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER], *(path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER)]
+
+# 로그인 실패 횟수 제한 (한도는 constance MAX_LOGIN_ATTEMPTS / MAX_LOGIN_ATTEMPTS_PER_IP / LOGIN_LOCKOUT_MINUTES)
+AUTHENTICATION_BACKENDS = ["user.backends.LockoutModelBackend"]
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
 
@@ -227,6 +315,26 @@ AWS_S3_SIGNATURE_VERSION = env("AWS_S3_SIGNATURE_VERSION")
 AWS_S3_CUSTOM_DOMAIN = f"{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com"
 AWS_S3_FILE_OVERWRITE = False
 
+# S3 클라이언트 커넥션 풀 / 전송 설정 (django-storages와 config.s3.get_s3_client 공통)
+AWS_S3_MAX_POOL_CONNECTIONS = env.int("AWS_S3_MAX_POOL_CONNECTIONS", default=50)
+AWS_S3_CLIENT_CONFIG = Config(
+    signature_version=AWS_S3_SIGNATURE_VERSION,
+    max_pool_connections=AWS_S3_MAX_POOL_CONNECTIONS,
+    retries={"mode": "standard", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+AWS_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024**2,
+    multipart_chunksize=16 * 1024**2,
+    max_concurrency=env.int("AWS_S3_TRANSFER_CONCURRENCY", default=10),
+    use_threads=True,
+)
+
+# 미디어 로컬 디스크 캐시 (config.storages.DiskCacheMixin, 비우면 사용 안 함)
+MEDIA_CACHE_ROOT = env("MEDIA_CACHE_ROOT", default="")
+MEDIA_CACHE_MAX_BYTES = env.int("MEDIA_CACHE_MAX_BYTES", default=1024**3)  # 1GB
+MEDIA_CACHE_REVALIDATE_AFTER = 60  # 초, 이후 읽을 때 ETag로 재검증
+
 STORAGES = {
     "default": {
         "BACKEND": "config.storages.MediaStorage",
@@ -234,6 +342,15 @@ STORAGES = {
     "staticfiles": {
         "BACKEND": "config.storages.StaticStorage",
     },
+    # 내용 해시 이름 Storage (upload.Blob 등에서 opt-in)
+    "content_addressed": {
+        "BACKEND": "config.storages.ContentAddressedStorage",
+    },
+    # 이미지 변환본 (upload.renditions, 키가 결정적이므로 덮어쓰기)
+    "renditions": {
+        "BACKEND": "config.storages.MediaStorage",
+        "OPTIONS": {"file_overwrite": True},
+    },
 }
 
 STATIC_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/static/"
@@ -241,13 +358,26 @@ STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
 MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/media/"
+STATIC_MANIFEST_ROOT = BASE_DIR / "staticfiles-manifest"  # collectstatic이 만든 manifest (배포 결과물에 포함)
+STATIC_UPLOAD_WORKERS = 16  # collectstatic 병렬 업로드 스레드 수
+
+# S3 직접 업로드 (upload 앱)
+UPLOAD_MAX_SIZE = 5 * 1024**3  # 5GB
+UPLOAD_MULTIPART_THRESHOLD = 100 * 1024**2  # 이보다 큰 파일은 multipart 업로드
+UPLOAD_PART_SIZE = 16 * 1024**2  # multipart part 크기 (S3 최소 5MB)
+UPLOAD_URL_EXPIRES = 3600  # presigned URL 유효 시간 (초)
+
+# 이미지 변환본 (upload.renditions)
+RENDITION_WIDTHS = (160, 320, 640, 1280)  # 요청 너비는 이 중 같거나 큰 값으로 올림
+RENDITION_FORMATS = ("webp", "jpeg")
+RENDITION_QUALITY = 80
+RENDITION_WORKERS = env.int("RENDITION_WORKERS", default=2)  # 리사이즈 프로세스 수
+RENDITION_ON_UPLOAD = env.bool("RENDITION_ON_UPLOAD", default=False)  # 업로드 완료 시 celery로 미리 생성
 
 CLOUDWATCH_AWS_ID = env("AWS_ACCESS_KEY_ID")
 CLOUDWATCH_AWS_KEY = env("AWS_SECRET_ACCESS_KEY")
 AWS_DEFAULT_REGION = env("AWS_S3_REGION_NAME")
 
-s3_client = boto3.client("s3")
-
 INTERNAL_IPS = [
     "localhost",
     "127.0.0.1",
@@ -275,6 +405,13 @@ if DEBUG:
         "staticfiles": {
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
         },
+        "content_addressed": {
+            "BACKEND": "config.storages.LocalContentAddressedStorage",
+        },
+        "renditions": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"allow_overwrite": True},
+        },
     }
 
     INSTALLED_APPS += [
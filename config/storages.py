@@ -1,11 +1,294 @@
+"""
+S3 Storages
+
+- StaticStorage: 내용 해시 파일명(staticfiles manifest) + immutable 캐시 + 증분/병렬 업로드
+- MediaStorage: 사용자 업로드 파일
+- ContentAddressedStorage: 내용 해시(sha256/ab/cd/...)로 이름을 정하는 미디어 Storage (opt-in)
+
+미디어 Storage는 MEDIA_CACHE_ROOT가 설정되면 읽은 파일을 로컬 디스크에 캐시합니다 (DiskCacheMixin).
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestFilesMixin
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import FileSystemStorage, Storage, storages
+
+from botocore.exceptions import ClientError
+from storages.backends.s3 import S3StaticStorage, S3Storage
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name
+
+from .disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+HASHED_NAME_RE = re.compile(r"\.[0-9a-f]{12}\.[^/.]+$")  # Django HashedFilesMixin 기본 해시 길이
 
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+SHORT_CACHE_CONTROL = "public, max-age=300"
+
+
+class StaticStorage(ManifestFilesMixin, S3StaticStorage):
+    """
+    내용 해시 파일명으로 S3에 정적 파일을 올리는 Storage
+
+    - 해시 파일명(app.3f2a9c1b7d4e.css)은 1년 immutable 캐시, 원본 파일명과 manifest는 짧은 캐시를 사용합니다.
+    - 업로드한 파일의 내용 해시를 로컬 기록(STATIC_MANIFEST_ROOT/uploaded.json)에 남기고,
+      collectstatic의 존재 확인은 S3 왕복 없이 이 기록으로 처리합니다.
+    - get_modified_time은 재정의하지 않으므로 collectstatic은 이미 있는 파일의 S3 LastModified(HEAD)를 원본 수정 시각과 비교해
+      원본이 더 오래된 파일은 건너뜁니다. 원본이 더 최근이어도 기록에 같은 해시가 있으면 다시 올리지 않습니다.
+    - 업로드는 스레드 풀(STATIC_UPLOAD_WORKERS)에서 병렬로 처리하고 post_process가 끝날 때 모두 기다립니다.
+
+    staticfiles manifest(staticfiles.json)도 STATIC_MANIFEST_ROOT에 저장하므로 서버 시작 시 S3를 읽지 않습니다.
+    collectstatic을 실행한 빌드 결과물에 STATIC_MANIFEST_ROOT를 포함해 배포해야 합니다.
+    """
 
-class StaticStorage(S3Boto3Storage):
     location = "static"
     default_acl = None  # Ensure no ACL is set
+    file_overwrite = True  # 같은 이름은 덮어쓰기 (존재 확인 왕복 없음)
+    upload_record_name = "uploaded.json"
+    _missing_manifest_logged = False
+    manifest_storage: Storage  # __init__에서 항상 설정
+
+    def __init__(self, **kwargs: Any) -> None:
+        manifest_root = getattr(settings, "STATIC_MANIFEST_ROOT", settings.BASE_DIR / "staticfiles-manifest")
+        kwargs.setdefault("manifest_storage", FileSystemStorage(location=manifest_root))
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[str, Future] = {}  # 파일명별 마지막 업로드
+        self._pending: dict[str, tuple[bytes, str]] = {}  # 업로드 중인 파일 (내용, 해시), post_process 중 다시 읽을 때 사용
+        self._deleted: set[str] = set()
+        self._uploaded = self._read_upload_record()
+
+    # 로컬 업로드 기록
+
+    def _read_upload_record(self) -> dict[str, str]:
+        try:
+            with self.manifest_storage.open(self.upload_record_name) as record:
+                data = json.loads(record.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+        if data.get("bucket") != self.bucket_name or data.get("location") != self.location:
+            return {}
+        return data["files"]
+
+    def _write_upload_record(self) -> None:
+        contents = json.dumps({"bucket": self.bucket_name, "location": self.location, "files": self._uploaded}, sort_keys=True)
+        if self.manifest_storage.exists(self.upload_record_name):
+            self.manifest_storage.delete(self.upload_record_name)
+        self.manifest_storage.save(self.upload_record_name, ContentFile(contents.encode()))
+
+    # S3 왕복 없이 로컬 기록으로 처리
+
+    def exists(self, name: str) -> bool:
+        name = clean_name(name)
+        return name in self._pending or (name in self._uploaded and name not in self._deleted)
+
+    def delete(self, name: str) -> None:
+        # collectstatic은 덮어쓰기 전에 delete를 호출하므로, 실제 삭제는 다시 저장되지 않은 파일만 마지막에 처리합니다.
+        with self._lock:
+            self._deleted.add(clean_name(name))
+
+    def _open(self, name: str, mode: str = "rb") -> File:
+        pending = self._pending.get(clean_name(name))
+        if pending is not None:
+            return ContentFile(pending[0], name=name)
+        return super()._open(name, mode)
+
+    # 병렬 업로드
+
+    def get_object_parameters(self, name: str) -> dict[str, Any]:
+        params = super().get_object_parameters(name)
+        params["CacheControl"] = IMMUTABLE_CACHE_CONTROL if HASHED_NAME_RE.search(name) else SHORT_CACHE_CONTROL
+        return params
+
+    def _save(self, name: str, content: File) -> str:
+        name = clean_name(name)
+        content.seek(0)
+        data = content.read()
+        if isinstance(data, str):
+            data = data.encode()
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            self._deleted.discard(name)
+            pending = self._pending.get(name)
+            if (pending[1] if pending else self._uploaded.get(name)) == digest:
+                return name
+            self._pending[name] = (data, digest)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=getattr(settings, "STATIC_UPLOAD_WORKERS", 16), thread_name_prefix="static-upload")
+            self._futures[name] = self._executor.submit(self._upload, name, data, digest, self._futures.get(name))
+        return name
+
+    def _upload(self, name: str, data: bytes, digest: str, previous: Future | None) -> None:
+        if previous is not None:
+            previous.result()  # 같은 파일명은 저장 순서대로 올립니다 (post_process는 CSS를 여러 번 저장).
+        super()._save(name, ContentFile(data, name=os.path.basename(name)))
+        with self._lock:
+            self._uploaded[name] = digest
+            if self._pending.get(name, (b"", ""))[1] == digest:
+                del self._pending[name]
+
+    def wait_for_uploads(self) -> None:
+        """진행 중인 업로드를 모두 기다리고, 다시 저장되지 않은 삭제 요청을 반영한 뒤 로컬 기록을 저장합니다."""
+        futures, self._futures = self._futures, {}
+        for future in futures.values():
+            future.result()
+
+        for name in sorted(self._deleted):
+            super().delete(name)
+            self._uploaded.pop(name, None)
+        self._deleted.clear()
+        self._write_upload_record()
+
+    def post_process(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        yield from super().post_process(*args, **kwargs)
+        if not kwargs.get("dry_run"):
+            self.wait_for_uploads()
+
+    def stored_name(self, name: str) -> str:
+        # manifest에 없는 파일(collectstatic 전 개발/테스트 환경 등)은 원본 파일명으로 제공합니다.
+        # 배포 환경에서 manifest가 빠지면 모든 파일이 짧은 캐시의 원본 파일명으로 제공되므로,
+        # check --deploy(config.E001)로 막고 실행 중에는 오류 로그를 남깁니다.
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            if not self.hashed_files and not self._missing_manifest_logged:
+                self._missing_manifest_logged = True
+                logger.error("staticfiles manifest가 없어 원본 파일명으로 제공합니다: %s", self.manifest_storage.path(self.manifest_name))
+            return name
+
+
+class DiskCacheMixin(S3Storage):
+    """
+    S3 읽기를 로컬 디스크 캐시(MEDIA_CACHE_ROOT, 최대 MEDIA_CACHE_MAX_BYTES, LRU)로 처리합니다.
+
+    캐시된 파일은 MEDIA_CACHE_REVALIDATE_AFTER초가 지나면 ETag 조건부 GET으로 재검증하고,
+    304면 본문을 받지 않고 캐시를 그대로 사용합니다. immutable Storage는 재검증하지 않습니다.
+    """
+
+    immutable = False  # 같은 이름의 내용이 바뀌지 않는 Storage (재검증 생략)
+
+    @property
+    def disk_cache(self) -> DiskCache | None:
+        root = getattr(settings, "MEDIA_CACHE_ROOT", None)
+        if not root:
+            return None
+        if getattr(self, "_disk_cache", None) is None:
+            self._disk_cache = DiskCache(Path(root) / self.location, settings.MEDIA_CACHE_MAX_BYTES)
+        return self._disk_cache
+
+    def _open(self, name: str, mode: str = "rb") -> File:
+        cache = self.disk_cache
+        if cache is None or mode != "rb":
+            return super()._open(name, mode)
+
+        key = self._normalize_name(clean_name(name))
+        entry = cache.get(key)
+        if entry is not None and (self.immutable or time.time() - entry.validated_at < settings.MEDIA_CACHE_REVALIDATE_AFTER):
+            cache.touch(key)
+            return File(open(entry.path, "rb"), name=name)
+
+        params = {"Bucket": self.bucket_name, "Key": key}
+        if entry is not None:
+            params["IfNoneMatch"] = entry.etag
+        try:
+            response = self.connection.meta.client.get_object(**params)
+        except ClientError as err:
+            status = err.response["ResponseMetadata"]["HTTPStatusCode"]
+            if status == 304 and entry is not None:
+                cache.touch(key, validated=True)
+                return File(open(entry.path, "rb"), name=name)
+            if status == 404:
+                cache.delete(key)
+                raise FileNotFoundError(f"File does not exist: {name}") from err
+            raise
+
+        if response["ContentLength"] > cache.max_bytes:
+            # 캐시 전체보다 큰 파일은 캐시하지 않고 S3에서 바로 읽습니다.
+            response["Body"].close()
+            return super()._open(name, mode)
+
+        path = cache.put(key, response["Body"], response["ETag"])
+        return File(open(path, "rb"), name=name)
+
+    def _save(self, name: str, content: File) -> str:
+        name = super()._save(name, content)
+        if self.disk_cache is not None:
+            self.disk_cache.delete(self._normalize_name(clean_name(name)))
+        return name
+
+    def delete(self, name: str) -> None:
+        super().delete(name)
+        if self.disk_cache is not None:
+            self.disk_cache.delete(self._normalize_name(clean_name(name)))
+
+
+class MediaStorage(DiskCacheMixin, S3Boto3Storage):
+    location = "media"
+    default_acl = None  # Ensure no ACL is set
+
+
+def hash_content(content: File) -> str:
+    """파일 내용의 sha256 (chunk 단위로 읽고 처음 위치로 되돌립니다)"""
+    digest = hashlib.sha256()
+    content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk if isinstance(chunk, bytes) else chunk.encode())
+    content.seek(0)
+    return digest.hexdigest()
+
+
+def content_addressed_name(digest: str) -> str:
+    """sha256/ab/cd/<digest> (확장자는 이름에 넣지 않으므로 내용이 같으면 항상 같은 이름)"""
+    return f"sha256/{digest[:2]}/{digest[2:4]}/{digest}"
+
+
+class ContentAddressedMixin:
+    """
+    내용 해시로 저장 경로를 정합니다.
+    같은 내용은 같은 이름이 되므로 빈 이름을 찾는 존재 확인(HEAD) 없이 그대로 저장(덮어쓰기)합니다.
+    저장 경로에는 확장자가 없으므로 Content-Type은 요청한 이름의 확장자로 추정합니다.
+    """
 
+    def get_available_name(self, name: str, max_length: int | None = None) -> str:
+        return name
 
-class MediaStorage(S3Boto3Storage):
+    def _save(self, name: str, content: File) -> str:
+        if not getattr(content, "content_type", None):
+            content.content_type = mimetypes.guess_type(name)[0]  # type: ignore[attr-defined]
+        return super()._save(content_addressed_name(hash_content(content)), content)  # type: ignore[misc]
+
+
+class ContentAddressedStorage(ContentAddressedMixin, DiskCacheMixin, S3Boto3Storage):
     location = "media"
     default_acl = None  # Ensure no ACL is set
+    file_overwrite = True
+    immutable = True
+
+
+class LocalContentAddressedStorage(ContentAddressedMixin, FileSystemStorage):
+    """개발 환경용 (MEDIA_ROOT에 저장)"""
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(**kwargs)
+
+
+def content_addressed_storage() -> Storage:
+    """FileField(storage=...)에서 사용하는 settings.STORAGES["content_addressed"] 인스턴스"""
+    return storages["content_addressed"]
@@ -0,0 +1,16 @@
+import logging
+
+from celery import shared_task
+
+from .metrics import is_shared_cache, refresh_stale_metrics
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_dashboard_metrics() -> list[str]:
+    """오래된 대시보드 지표 스냅샷을 다시 계산합니다. (공유 캐시가 아니면 웹 프로세스가 읽을 수 없으므로 건너뜀)"""
+    if not is_shared_cache():
+        logger.warning("대시보드 지표 사전 계산을 건너뜁니다: 로컬 메모리 캐시는 웹 프로세스와 공유되지 않습니다. (REDIS_URL 설정 필요)")
+        return []
+    return refresh_stale_metrics()
@@ -0,0 +1,736 @@
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from dataclasses import replace
+from datetime import timedelta
+import gzip
+from io import BytesIO, StringIO
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any, cast
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sessions.models import Session
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse, HttpResponseBase, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.functional import empty
+
+import boto3
+import brotli  # type: ignore[import-untyped]
+from constance import config  # type: ignore[import-untyped]
+from constance.forms import ConstanceForm  # type: ignore[import-untyped]
+from moto import mock_aws
+from rest_framework.response import Response
+from storages.backends.s3 import S3Storage
+import yaml
+
+from config import db_router, metrics, schema_fingerprint
+from config.checks import check_static_manifest
+from config.custom_schema import TagFilteredSchemaGenerator
+from config.middleware import ReadReplicaMiddleware
+from config.models import ArchivedLogEntry
+from config.schema_categories import CategoryMatcher
+from config.schema_diff import diff_schemas
+from config.schema_views import ExternalAPISchemaView
+from config.schema_views import base as schema_base
+from config.schema_views import versioned
+from config.session_backends.signed_cookies import SessionStore as SignedCookieSessionStore
+from config.storages import MediaStorage, StaticStorage
+from config.tasks import refresh_dashboard_metrics
+from config.throttling import ExternalRateThrottle
+from config.views import get_recent_users_table
+from utils.runtime_config import clear_config_cache
+
+User = get_user_model()
+
+
+class DashboardMetricsTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_cards_never_compute_synchronously(self) -> None:
+        with mock.patch("config.metrics.threading.Thread") as thread:
+            cards = metrics.get_cards()
+        self.assertEqual([card["metric"] for card in cards], [metrics.EMPTY_METRIC] * len(metrics.get_metrics()))
+        self.assertEqual(thread.call_count, len(metrics.get_metrics()))
+
+    def test_stale_snapshot_is_served_while_revalidating(self) -> None:
+        User.objects.create_user(username="testuser", password="testpass123")
+        metric = metrics._registry["total_users"]
+        cache.set(metrics.SNAPSHOT_KEY.format(metric.key), {"value": 0, "computed_at": time.time() - metric.max_age}, timeout=None)
+
+        with mock.patch("config.metrics.threading.Thread") as thread:
+            card = metrics.get_cards()[0]
+            metrics.get_cards()
+        self.assertEqual(card["metric"], 0)
+        # 갱신 잠금으로 중복 갱신은 예약되지 않습니다
+        self.assertEqual(sum(1 for call in thread.call_args_list if call.kwargs["args"] == (metric,)), 1)
+
+    def test_refresh_stale_metrics(self) -> None:
+        User.objects.create_user(username="testuser", password="testpass123")
+        self.assertEqual(metrics.refresh_stale_metrics(), [metric.key for metric in metrics.get_metrics()])
+        self.assertEqual(metrics.refresh_stale_metrics(), [])
+        self.assertEqual(metrics.get_cards()[0]["metric"], 1)
+
+    def test_refresh_continues_after_failing_metric(self) -> None:
+        failing = metrics.get_metrics()[0]
+        with mock.patch.dict(metrics._registry, {failing.key: replace(failing, compute=mock.Mock(side_effect=RuntimeError))}):
+            with self.assertLogs("config.metrics", "ERROR"):
+                refreshed = metrics.refresh_stale_metrics()
+        self.assertEqual(refreshed, [metric.key for metric in metrics.get_metrics()[1:]])
+
+    def test_beat_task_requires_shared_cache(self) -> None:
+        with self.assertLogs("config.tasks", "WARNING"):
+            self.assertEqual(refresh_dashboard_metrics(), [])
+        self.assertIsNone(cache.get(metrics.SNAPSHOT_KEY.format("total_users")))
+
+
+class DashboardViewTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass123")
+        self.client.force_login(self.admin)
+
+    def test_recent_users_table(self) -> None:
+        User.objects.create_user(username="newbie", email="newbie@example.com", password="testpass123")
+        table = get_recent_users_table()
+        self.assertEqual(table["rows"][0][:2], ["newbie", "newbie@example.com"])
+        self.assertEqual(len(table["rows"]), 2)
+
+    def test_fragments_cached_until_users_change(self) -> None:
+        with mock.patch("config.metrics.threading.Thread"):
+            response = self.client.get("/admin/")
+            self.assertContains(response, "admin")
+
+            with mock.patch("config.views.get_recent_users_table") as table:
+                self.client.get("/admin/")
+            table.assert_not_called()
+
+            User.objects.create_user(username="newbie", email="newbie@example.com", password="testpass123")
+            response = self.client.get("/admin/")
+        self.assertContains(response, "newbie")
+
+    def test_cards_are_not_cached_while_pending(self) -> None:
+        key = make_template_fragment_key("dashboard_cards", ["superuser"])
+        with mock.patch("config.metrics.threading.Thread"):
+            self.client.get("/admin/")
+            self.assertIsNone(cache.get(key))  # "-" 카드는 캐시하지 않음
+
+            metrics.refresh_stale_metrics()
+            self.client.get("/admin/")
+        self.assertIsNotNone(cache.get(key))
+        self.assertNotIn(f">{metrics.EMPTY_METRIC}<", "".join(cache.get(key).split()))
+
+    def test_login_does_not_clear_fragments(self) -> None:
+        with mock.patch("config.views.invalidate_dashboard_cache") as invalidate:
+            self.assertTrue(self.client.login(username="admin", password="adminpass123"))
+            invalidate.assert_not_called()
+
+            self.admin.email = "admin@example.org"
+            self.admin.save()
+            invalidate.assert_called_once()
+
+
+class ThrottleTests(TestCase):
+    url = "/api/user/external/users/"
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(clear_config_cache)
+
+    def test_limit_is_exact_across_threads(self) -> None:
+        def consume(_: int) -> bool:
+            return ExternalRateThrottle().consume("ip:10.0.0.1", 50, 60)
+
+        with mock.patch("config.throttling.time.time", return_value=6000.0), ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(consume, range(200)))
+        self.assertEqual(results.count(True), 50)
+
+    def test_previous_window_is_weighted(self) -> None:
+        throttle = ExternalRateThrottle()
+        with mock.patch("config.throttling.time.time", return_value=6000.0):
+            for _ in range(10):
+                throttle.consume("ip:10.0.0.1", 10, 60)
+        with mock.patch("config.throttling.time.time", return_value=6090.0):  # 다음 윈도우의 절반 경과
+            results = [throttle.consume("ip:10.0.0.1", 10, 60) for _ in range(6)]
+        self.assertEqual(results, [True] * 5 + [False])
+        self.assertEqual(throttle.wait(), 6)  # 10 * (1 - 0.6) + 5 + 1 = 10
+
+    def test_denied_requests_are_not_counted(self) -> None:
+        throttle = ExternalRateThrottle()
+        with mock.patch("config.throttling.time.time", return_value=6000.0):
+            results = [throttle.consume("ip:10.0.0.1", 10, 60) for _ in range(50)]
+        self.assertEqual(results.count(True), 10)
+        self.assertEqual(throttle.wait(), 60 + 6)  # 다음 윈도우에서 10 * (1 - 0.1) + 1 = 10
+        with mock.patch("config.throttling.time.time", return_value=6000.0 + 66):
+            self.assertTrue(throttle.consume("ip:10.0.0.1", 10, 60))
+
+    def test_invalid_constance_rate_falls_back_to_default(self) -> None:
+        config.API_RATE_LIMIT_EXTERNAL = "12O/min"
+        with self.assertLogs("config.throttling", "WARNING"):
+            self.assertEqual(ExternalRateThrottle().get_rate("ip:10.0.0.1"), (120, 60))
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        field = ConstanceForm(initial={}).fields["API_RATE_LIMIT_EXTERNAL"]
+        self.assertEqual(field.clean("30/hour"), "30/hour")
+        with self.assertRaises(ValidationError):
+            field.clean("12O/min")
+
+    @override_settings(API_THROTTLE_CLIENT_RATES={"external": {"ip:127.0.0.1": "2/min"}})
+    def test_client_override_returns_retry_after(self) -> None:
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response["Retry-After"]), 0)
+
+    def test_constance_rate_applies_at_runtime(self) -> None:
+        config.API_RATE_LIMIT_EXTERNAL = "1/hour"
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        self.assertEqual(self.client.get(self.url).status_code, 429)
+        config.API_RATE_LIMIT_EXTERNAL = ""
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+
+class SessionTests(TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(clear_config_cache)
+
+    def test_cookie_age_follows_constance(self) -> None:
+        User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass123")
+        config.SESSION_TIMEOUT_MINUTES = 30
+        response = self.client.post("/admin/login/", {"username": "admin", "password": "adminpass123"})
+        self.assertEqual(response.cookies["sessionid"]["max-age"], 30 * 60)
+
+    def test_signed_cookie_session_expires(self) -> None:
+        session = SignedCookieSessionStore()
+        session["_auth_user_id"] = "1"
+        session.save()
+        self.assertEqual(SignedCookieSessionStore(session.session_key).get("_auth_user_id"), "1")
+
+        config.SESSION_TIMEOUT_MINUTES = 1
+        with mock.patch("django.core.signing.time.time", return_value=time.time() + 120):
+            self.assertIsNone(SignedCookieSessionStore(session.session_key).get("_auth_user_id"))
+
+    def test_clear_expired_sessions_in_batches(self) -> None:
+        now = timezone.now()
+        Session.objects.bulk_create(
+            [Session(session_key=f"expired-{i}", session_data="", expire_date=now - timedelta(days=1)) for i in range(7)]
+            + [Session(session_key="active", session_data="", expire_date=now + timedelta(days=1))]
+        )
+        with self.assertNumQueries(9):  # (조회 + 삭제) x 4 batch + 마지막 빈 조회
+            call_command("clear_expired_sessions", batch_size=2, stdout=StringIO())
+        self.assertEqual(list(Session.objects.values_list("session_key", flat=True)), ["active"])
+
+
+class SchemaFingerprintTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base_dir = Path(tmp.name)
+
+    def write(self, name: str, source: str) -> None:
+        path = self.base_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+
+    def test_fingerprint_tracks_schema_sources(self) -> None:
+        self.write("user/serializers.py", "class A: ...")
+        self.write("user/views/user/app.py", "class V: ...")
+        self.write("user/admin.py", "")
+        self.write("user/migrations/0001_initial.py", "")
+        fingerprint = schema_fingerprint.compute_fingerprint(self.base_dir)
+
+        self.write("user/admin.py", "# 스키마와 무관")
+        self.write("user/migrations/0001_initial.py", "# 스키마와 무관")
+        self.assertEqual(schema_fingerprint.compute_fingerprint(self.base_dir), fingerprint)
+
+        self.write("user/serializers.py", "class B: ...")
+        self.assertNotEqual(schema_fingerprint.compute_fingerprint(self.base_dir), fingerprint)
+
+        for name in ("config/renderers.py", "config/throttling.py"):
+            fingerprint = schema_fingerprint.compute_fingerprint(self.base_dir)
+            self.write(name, "# 응답에 영향")
+            self.assertNotEqual(schema_fingerprint.compute_fingerprint(self.base_dir), fingerprint, msg=name)
+
+    def test_check_schema_skips_generation_when_unchanged(self) -> None:
+        with mock.patch.object(schema_fingerprint, "FINGERPRINT_PATH", self.base_dir / "check_schema.fingerprint"):
+            schema_fingerprint.write_fingerprint(schema_fingerprint.compute_fingerprint())
+            with mock.patch("drf_spectacular.generators.SchemaGenerator.get_schema") as get_schema:
+                call_command("check_schema", stdout=StringIO())
+        get_schema.assert_not_called()
+
+
+class SchemaDiffTests(TestCase):
+    schema: dict[str, Any] = {
+        "paths": {
+            "/users/": {"get": {"summary": "목록", "responses": {"200": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/UserList"}}}}}}},
+            "/health/": {"get": {"summary": "상태", "responses": {"200": {"description": "OK"}}}},
+        },
+        "components": {
+            "schemas": {
+                "UserList": {"type": "array", "items": {"$ref": "#/components/schemas/User"}},
+                "User": {"type": "object", "description": "유저", "properties": {"id": {"type": "integer"}, "description": {"type": "string"}}},
+            }
+        },
+    }
+
+    def test_nested_component_change_marks_operation(self) -> None:
+        curr = copy.deepcopy(self.schema)
+        curr["components"]["schemas"]["User"]["properties"]["id"]["type"] = "string"
+        diff = diff_schemas(self.schema, curr)
+
+        self.assertEqual(diff.components["modified"], ["schemas/User"])
+        self.assertEqual([(op.path, op.method, op.components) for op in diff.modified], [("/users/", "get", ("schemas/User",))])
+        self.assertEqual(diff.as_changelog()["modified"][0]["components"], ["schemas/User"])
+
+    def test_documentation_changes_are_ignored(self) -> None:
+        curr = copy.deepcopy(self.schema)
+        curr["paths"]["/health/"]["get"]["summary"] = "헬스 체크"
+        curr["components"]["schemas"]["User"]["description"] = "서비스 유저"
+        self.assertFalse(diff_schemas(self.schema, curr))
+
+        del curr["components"]["schemas"]["User"]["properties"]["description"]  # 이름이 description인 필드는 구조
+        self.assertTrue(diff_schemas(self.schema, curr).modified)
+
+    def test_shared_node_is_hashed_per_role(self) -> None:
+        shared = {"description": {"type": "string"}}  # YAML anchor처럼 같은 객체를 properties와 일반 값으로 사용
+        prev: dict[str, Any] = {"components": {"schemas": {"Meta": {"type": "object", "x-meta": shared}, "User": {"type": "object", "properties": shared}}}}
+        curr = copy.deepcopy(prev)
+        curr["components"]["schemas"]["User"]["properties"]["description"]["type"] = "integer"
+        self.assertEqual(diff_schemas(prev, curr).components["modified"], ["schemas/User"])
+
+    def test_added_and_removed_operations(self) -> None:
+        curr = copy.deepcopy(self.schema)
+        curr["paths"]["/ping/"] = curr["paths"].pop("/health/")
+        diff = diff_schemas(self.schema, curr)
+        self.assertEqual([op.path for op in diff.added], ["/ping/"])
+        self.assertEqual([op.as_dict() for op in diff.removed], [{"method": "GET", "path": "/health/", "summary": "상태"}])
+        self.assertEqual(diff.modified, [])
+
+
+class CategoryMatcherTests(TestCase):
+    matcher = CategoryMatcher({"app": ("app", "user"), "admin": ("admin",)})
+
+    def test_tag_prefix_matching(self) -> None:
+        self.assertEqual(self.matcher.categories_for_tag("app-user"), {"app"})
+        self.assertEqual(self.matcher.categories_for_tag("user"), {"app"})
+        self.assertEqual(self.matcher.categories_for_tag("admin-user-log"), {"admin"})
+        self.assertEqual(self.matcher.categories_for_tag("application"), set())
+
+    def test_split_projects_every_category_in_one_pass(self) -> None:
+        operation = {"tags": ["app-user", "admin"]}
+        paths = {"/users/": {"parameters": [{"name": "q"}], "get": operation, "post": {"tags": ["admin-user"]}}, "/health/": {"get": {}}}
+        split = self.matcher.split(paths)
+
+        self.assertEqual(split["app"], {"/users/": {"parameters": [{"name": "q"}], "get": operation}})
+        self.assertEqual(list(split["admin"]["/users/"]), ["parameters", "get", "post"])
+        self.assertIs(split["admin"]["/users/"]["get"], operation)
+        self.assertEqual(self.matcher.filter(paths, "admin"), split["admin"])
+
+    def test_tag_filtered_schema_generator(self) -> None:
+        schema = TagFilteredSchemaGenerator(category="external").get_schema(public=True)
+        self.assertTrue(schema["paths"])
+        self.assertTrue(all(path.startswith("/api/user/external/") for path in schema["paths"]))
+        self.assertNotIn("Upload", schema["components"]["schemas"])  # 다른 카테고리 endpoint는 분석하지 않음
+
+    def test_category_view_generates_only_its_scope_once(self) -> None:
+        schema_base.clear_schemas()
+        self.addCleanup(schema_base.clear_schemas)
+        with mock.patch.object(schema_base, "generate_schema", wraps=schema_base.generate_schema) as generate, mock.patch.object(schema_base, "start_warmup") as warmup:
+            for _ in range(2):
+                response = ExternalAPISchemaView.as_view()(RequestFactory().get("/api/schema/external/"))
+        generate.assert_called_once_with("external")
+        warmup.assert_called_once()
+        self.assertEqual(response.data["info"]["title"], "External APIs")
+        self.assertNotEqual(schema_base.get_schema("external")["info"]["title"], "External APIs")
+
+    def test_categories_are_generated_independently(self) -> None:
+        schema_base.clear_schemas()
+        self.addCleanup(schema_base.clear_schemas)
+        started, release = threading.Event(), threading.Event()
+
+        def generate(category: str | None) -> dict[str, Any]:
+            if category == "app":
+                started.set()
+                release.wait(5)
+            return {"category": category}
+
+        with mock.patch.object(schema_base, "generate_schema", side_effect=generate):
+            thread = threading.Thread(target=schema_base.get_schema, args=("app", False))
+            thread.start()
+            self.addCleanup(thread.join)
+            self.addCleanup(release.set)
+            started.wait(5)
+            self.assertEqual(schema_base.get_schema("external", warm=False), {"category": "external"})  # app 생성을 기다리지 않음
+            release.set()
+            thread.join()
+        self.assertEqual(schema_base.get_schema("app", warm=False), {"category": "app"})
+
+    def test_schemas_are_dropped_when_fingerprint_changes(self) -> None:
+        schema_base.clear_schemas()
+        self.addCleanup(schema_base.clear_schemas)
+        with (
+            mock.patch.object(schema_base, "FINGERPRINT_CHECK_INTERVAL", 0),
+            mock.patch.object(schema_base, "compute_fingerprint", side_effect=["a", "a", "b"]),
+            mock.patch.object(schema_base, "generate_schema", return_value={}) as generate,
+        ):
+            for _ in range(3):
+                schema_base.get_schema("external", warm=False)
+        self.assertEqual(generate.call_count, 2)
+
+
+class VersionedSchemaArtifactTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(versioned, "SCHEMA_DIR", tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        operation = {"summary": "목록", "tags": ["app-user"], "responses": {"200": {"description": "OK"}}}
+        paths = {"/api/user/app/users/": {"get": operation}}
+        Path(tmp.name, "schema_v1.0.0.yml").write_text(yaml.dump({"info": {"title": "API"}, "paths": paths}))
+        paths = {**paths, "/api/user/admin/users/": {"get": {**operation, "tags": ["admin-user"]}}}
+        Path(tmp.name, "schema_v1.1.0.yml").write_text(yaml.dump({"info": {"title": "API"}, "paths": paths}))
+
+    def get(self, version: str, category: str | None = None, **headers: Any) -> HttpResponseBase:
+        return versioned.VersionedSchemaAPIView.as_view()(RequestFactory().get("/", **headers), version=version, category=category)
+
+    def read(self, response: HttpResponseBase) -> bytes:
+        assert isinstance(response, StreamingHttpResponse)
+        return b"".join(response)
+
+    def test_serves_precompressed_category_schema(self) -> None:
+        response = self.get("1.1.0", "admin", HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+        self.assertEqual((response.status_code, response["Content-Encoding"]), (200, "br"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+        schema = json.loads(brotli.decompress(self.read(response)))
+        self.assertEqual(list(schema["paths"]), ["/api/user/admin/users/"])
+        self.assertTrue(schema["paths"]["/api/user/admin/users/"]["get"]["summary"].startswith("🟢"))
+        self.assertEqual(schema["info"]["x-previous-version"], "1.0.0")
+
+        response = self.get("1.1.0", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(len(json.loads(gzip.decompress(self.read(response)))["paths"]), 2)
+        response = self.get("1.1.0", "app")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(list(json.loads(self.read(response))["paths"]), ["/api/user/app/users/"])
+
+    def test_unknown_version_or_category(self) -> None:
+        self.assertEqual(self.get("9.9.9").status_code, 404)
+        self.assertEqual(self.get("1.0.0", "unknown").status_code, 404)
+
+
+class AdminLogArchiveTests(TestCase):
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass123")
+        content_type = ContentType.objects.get_for_model(User)
+        now = timezone.now()
+        for days, name in ((200, "old-1"), (100, "old-2"), (1, "recent")):
+            LogEntry.objects.create(user=self.admin, content_type=content_type, object_id="1", object_repr=name, action_flag=CHANGE, action_time=now - timedelta(days=days))
+
+    def test_archives_expired_entries_in_batches(self) -> None:
+        call_command("archive_admin_logs", batch_size=1, stdout=StringIO())
+        self.assertEqual(list(LogEntry.objects.values_list("object_repr", flat=True)), ["recent"])
+        archived = ArchivedLogEntry.objects.get(object_repr="old-1")
+        self.assertEqual((archived.username, archived.content_type, archived.action_flag), ("admin", "user.user", CHANGE))
+        self.assertEqual(ArchivedLogEntry.objects.count(), 2)
+
+    def test_archive_admin_searches_on_demand(self) -> None:
+        call_command("archive_admin_logs", stdout=StringIO())
+        self.client.force_login(self.admin)
+        url = reverse("admin:config_archivedlogentry_changelist")
+        self.assertContains(self.client.get(reverse("admin:admin_logentry_changelist")), url)
+        self.assertEqual(self.client.get(url).context["cl"].result_count, 0)
+        self.assertEqual([entry.object_repr for entry in self.client.get(url, {"q": "admin"}).context["cl"].result_list], ["old-2", "old-1"])
+
+
+@override_settings(READ_REPLICAS=["replica"])
+class ReadReplicaRouterTests(TestCase):
+    def setUp(self) -> None:
+        token = db_router.start_request()
+        self.addCleanup(db_router.end_request, token)
+
+    def test_reads_stick_to_primary_after_write(self) -> None:
+        self.assertEqual(User.objects.all().db, "default")
+        with db_router.use_read_replica():
+            self.assertEqual(User.objects.all().db, "replica")
+            User.objects.create_user(username="writer", email="writer@example.com", password="testpass123")
+            self.assertEqual(User.objects.all().db, "default")
+
+    def test_middleware_sticks_client_after_write(self) -> None:
+        seen = []
+
+        def view(request: Any) -> HttpResponse:
+            with db_router.use_read_replica():
+                seen.append(User.objects.all().db)
+            if request.method == "POST":
+                User.objects.create_user(username="writer", email="writer@example.com", password="testpass123")
+            return HttpResponse()
+
+        middleware = ReadReplicaMiddleware(view)
+        self.assertNotIn(db_router.STICKY_COOKIE, middleware(RequestFactory().get("/")).cookies)
+        cookie = middleware(RequestFactory().post("/")).cookies[db_router.STICKY_COOKIE]
+        self.assertEqual(cookie["max-age"], 5)
+        middleware(RequestFactory().get("/", HTTP_COOKIE=f"{db_router.STICKY_COOKIE}=1"))
+        middleware(RequestFactory().get("/"))
+        self.assertEqual(seen, ["replica", "replica", "default", "replica"])
+
+
+# 읽기 replica 테스트용 DB alias: 테스트 DB를 mirror하는 별도 연결 (READ_REPLICAS를 지정한 테스트에서만 라우팅됨)
+connections.settings.setdefault("replica", {**connections.settings[DEFAULT_DB_ALIAS], "TEST": {**connections.settings[DEFAULT_DB_ALIAS]["TEST"], "MIRROR": DEFAULT_DB_ALIAS}})
+
+
+@override_settings(READ_REPLICAS=["replica"])
+class ReadReplicaDatabaseTests(TransactionTestCase):
+    """실제 두 번째 DB alias로 GET이 어느 DB에서 조회되는지 확인합니다. (primary의 쓰기가 커밋되어야 replica 연결에서 보이므로 TransactionTestCase)"""
+
+    databases = {"default", "replica"}
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+        self.other = User.objects.create_user(username="other", email="other@example.com", password="testpass123")
+        self.client.force_login(self.user)
+        # constance는 DB에 없는 설정을 처음 읽을 때 기본값을 저장(쓰기)하므로 요청 전에 미리 채워 둡니다
+        for name in settings.CONSTANCE_CONFIG:
+            getattr(config, name)
+
+    def get_users(self) -> tuple[list[str], list[str]]:
+        """사용자 목록 GET에서 primary/replica 연결이 실행한 user 테이블 조회"""
+        with CaptureQueriesContext(connections["default"]) as primary, CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get("/api/user/app/users/")
+        self.assertEqual(response.status_code, 200)
+        return [q["sql"] for q in primary.captured_queries if 'FROM "user"' in q["sql"]], [q["sql"] for q in replica.captured_queries if 'FROM "user"' in q["sql"]]
+
+    def test_get_is_served_from_replica_until_write(self) -> None:
+        primary, replica = self.get_users()
+        self.assertEqual(primary, [])
+        self.assertTrue(replica)
+
+        response = self.client.post(f"/api/user/app/users/{self.other.pk}/toggle_active/")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(db_router.STICKY_COOKIE, response.cookies)
+
+        primary, replica = self.get_users()
+        self.assertTrue(primary)
+        self.assertEqual(replica, [])
+
+
+class SchemaChangelogTests(TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(versioned, "SCHEMA_DIR", tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for version in ("1.0.0", "1.1.0", "1.2.0", "1.10.0"):
+            Path(tmp.name, f"schema_v{version}.yml").write_text(yaml.dump({"info": {"title": "API"}, "paths": {}}))
+
+        def op(path: str, *components: str) -> dict[str, Any]:
+            return {"method": "GET", "path": path, "summary": path, **({"components": list(components)} if components else {})}
+
+        self.store = versioned.get_changelog_store()
+        self.store.append({"version": "1.0.0", "added": [op("/a/"), op("/b/")]})
+        self.store.append({"version": "1.1.0", "added": [op("/tmp/")], "removed": [op("/b/")], "components": {"added": ["schemas/Tmp"]}})
+        self.store.append({"version": "1.2.0", "added": [op("/b/")], "modified": [op("/a/", "schemas/A")], "removed": [op("/tmp/")], "components": {"removed": ["schemas/Tmp"]}})
+        self.store.append({"version": "1.10.0", "added": [op("/c/")]})
+        self.store.append({"version": "1.10.0", "added": [op("/d/")]})  # 다시 export한 버전은 마지막 줄이 우선
+
+    def test_net_diff_folds_version_deltas(self) -> None:
+        self.assertEqual(self.store.versions(), ["1.0.0", "1.1.0", "1.2.0", "1.10.0"])
+        diff = self.store.net_diff("1.0.0", "1.10.0")
+        self.assertEqual(diff["versions"], ["1.1.0", "1.2.0", "1.10.0"])
+        self.assertEqual([op["path"] for op in diff["added"]], ["/d/"])  # /tmp/는 추가 후 삭제되어 제외
+        self.assertEqual(diff["modified"], [{"method": "GET", "path": "/a/", "summary": "/a/", "components": ["schemas/A"]}, {"method": "GET", "path": "/b/", "summary": "/b/"}])
+        self.assertEqual((diff["removed"], diff["components"]), ([], {"added": [], "modified": [], "removed": []}))
+        self.assertEqual([op["path"] for op in self.store.net_diff("1.0.0", "1.1.0")["removed"]], ["/b/"])
+
+    def test_diff_view_is_cached_until_changelog_changes(self) -> None:
+        def get(from_version: str, to_version: str) -> Response:
+            response = versioned.VersionDiffAPIView.as_view()(RequestFactory().get("/"), from_version=from_version, to_version=to_version)
+            assert isinstance(response, Response)
+            return response
+
+        cache.clear()
+        self.assertEqual([op["path"] for op in get("1.1.0", "1.10.0").data["added"]], ["/b/", "/d/"])
+        with mock.patch.object(versioned.ChangelogStore, "net_diff") as net_diff:
+            self.assertEqual(get("1.1.0", "1.10.0").status_code, 200)
+        net_diff.assert_not_called()
+        self.assertEqual(get("1.2.0", "1.0.0").status_code, 400)
+        self.assertEqual(get("1.0.0", "9.9.9").status_code, 404)
+
+
+@mock_aws
+class StaticStorageTests(TestCase):
+    def setUp(self) -> None:
+        self.s3 = boto3.client("s3", region_name="ap-northeast-2")
+        self.s3.create_bucket(Bucket="static-test", CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source = Path(tmp.name) / "src"
+        (self.source / "css").mkdir(parents=True)
+        (self.source / "css" / "app.css").write_text("body { background: url('../img/logo.png'); }")
+        (self.source / "img").mkdir()
+        (self.source / "img" / "logo.png").write_bytes(b"\x89PNG logo")
+
+        settings_override = override_settings(
+            STATICFILES_DIRS=[self.source],
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+            STATIC_MANIFEST_ROOT=Path(tmp.name) / "manifest",
+            STORAGES={"staticfiles": {"BACKEND": "config.storages.StaticStorage", "OPTIONS": {"bucket_name": "static-test"}}},
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def collectstatic(self) -> list[str]:
+        with mock.patch.object(S3Storage, "_save", autospec=True, side_effect=S3Storage._save) as save, mock.patch.object(S3Storage, "exists") as exists:
+            call_command("collectstatic", interactive=False, verbosity=0)
+        exists.assert_not_called()
+        return sorted(call.args[1] for call in save.call_args_list)
+
+    def reset_storage(self) -> None:
+        """새 프로세스처럼 staticfiles_storage를 다시 만듭니다. (로컬 기록을 다시 읽음)"""
+        staticfiles_storage._wrapped = empty  # type: ignore[attr-defined]
+
+    def stored_name(self, name: str) -> str:
+        return cast(StaticStorage, staticfiles_storage).stored_name(name)
+
+    def test_hashed_names_are_immutable(self) -> None:
+        uploaded = self.collectstatic()
+        hashed_css = self.stored_name("css/app.css")
+        hashed_logo = self.stored_name("img/logo.png")
+        self.assertRegex(hashed_css, r"^css/app\.[0-9a-f]{12}\.css$")
+        self.assertEqual(uploaded, [hashed_css, "css/app.css", hashed_logo, "img/logo.png"])
+        head = self.s3.head_object(Bucket="static-test", Key=f"static/{hashed_css}")
+        self.assertEqual(head["CacheControl"], "public, max-age=31536000, immutable")
+        head = self.s3.head_object(Bucket="static-test", Key="static/css/app.css")
+        self.assertEqual(head["CacheControl"], "public, max-age=300")
+
+        body = self.s3.get_object(Bucket="static-test", Key=f"static/{hashed_css}")["Body"].read().decode()
+        self.assertIn(hashed_logo.split("/")[-1], body)
+
+    def test_deploy_check_requires_manifest(self) -> None:
+        self.reset_storage()
+        self.assertEqual([error.id for error in check_static_manifest(None)], ["config.E001"])
+        with self.assertLogs("config.storages", "ERROR"):
+            self.assertEqual(self.stored_name("css/app.css"), "css/app.css")
+
+        self.collectstatic()
+        self.reset_storage()
+        self.assertEqual(check_static_manifest(None), [])
+
+    def test_unchanged_files_are_skipped(self) -> None:
+        self.collectstatic()
+        self.reset_storage()
+        self.assertEqual(self.collectstatic(), [])
+
+        (self.source / "img" / "logo.png").write_bytes(b"\x89PNG new logo")
+        future = time.time() + 60  # S3 LastModified보다 최근에 수정된 원본
+        os.utime(self.source / "img" / "logo.png", (future, future))
+        self.reset_storage()
+        uploaded = self.collectstatic()
+        # 바뀐 이미지(원본 + 해시)와 이미지를 참조하는 CSS의 해시 파일만 다시 올립니다.
+        self.assertEqual(uploaded, sorted([self.stored_name("css/app.css"), self.stored_name("img/logo.png"), "img/logo.png"]))
+
+
+@mock_aws
+class MediaDiskCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.s3 = boto3.client("s3", region_name="ap-northeast-2")
+        self.s3.create_bucket(Bucket="media-test", CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+        for name in ("a", "b", "c"):
+            self.s3.put_object(Bucket="media-test", Key=f"media/{name}.txt", Body=name.encode() * 4)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings_override = override_settings(MEDIA_CACHE_ROOT=tmp.name, MEDIA_CACHE_MAX_BYTES=10, MEDIA_CACHE_REVALIDATE_AFTER=60)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.storage = MediaStorage(bucket_name="media-test")
+        disk_cache = self.storage.disk_cache
+        assert disk_cache is not None
+        self.disk_cache = disk_cache
+        client = self.storage.connection.meta.client
+        patcher = mock.patch.object(client, "get_object", wraps=client.get_object)
+        self.get_object = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read(self, name: str) -> bytes:
+        with self.storage.open(name) as f:
+            return f.read()
+
+    def test_reads_are_served_from_disk(self) -> None:
+        self.assertEqual(self.read("a.txt"), b"aaaa")
+        self.assertEqual(self.read("a.txt"), b"aaaa")
+        self.assertEqual(self.get_object.call_count, 1)
+
+    def test_revalidates_with_etag(self) -> None:
+        self.read("a.txt")
+        with override_settings(MEDIA_CACHE_REVALIDATE_AFTER=0):
+            self.assertEqual(self.read("a.txt"), b"aaaa")
+            self.assertIn("IfNoneMatch", self.get_object.call_args.kwargs)
+
+            self.s3.put_object(Bucket="media-test", Key="media/a.txt", Body=b"changed")
+            self.assertEqual(self.read("a.txt"), b"changed")
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        self.read("a.txt")
+        self.read("b.txt")
+        self.read("a.txt")
+        self.read("c.txt")  # 12 bytes > 10 → 가장 오래 사용하지 않은 b 삭제
+        self.get_object.reset_mock()
+
+        self.read("a.txt")
+        self.read("c.txt")
+        self.assertEqual(self.get_object.call_count, 0)
+        self.read("b.txt")
+        self.assertEqual(self.get_object.call_count, 1)
+
+    def test_file_larger_than_cache_is_not_cached(self) -> None:
+        self.s3.put_object(Bucket="media-test", Key="media/large.txt", Body=b"x" * 20)
+        self.read("a.txt")
+        self.assertEqual(self.read("large.txt"), b"x" * 20)
+        self.assertEqual(self.read("large.txt"), b"x" * 20)
+        self.assertIsNone(self.disk_cache.get("media/large.txt"))
+        self.assertIsNotNone(self.disk_cache.get("media/a.txt"))
+
+    def test_directory_is_scanned_only_when_over_limit(self) -> None:
+        cache = self.disk_cache
+        with mock.patch("config.disk_cache.os.scandir", wraps=os.scandir) as scandir:
+            cache.put("media/1.txt", BytesIO(b"1" * 4), "etag")  # 첫 저장에서 전체 크기를 계산
+            cache.put("media/2.txt", BytesIO(b"2" * 4), "etag")
+            cache.delete("media/1.txt")
+            cache.put("media/3.txt", BytesIO(b"3" * 4), "etag")
+            self.assertEqual(scandir.call_count, 1)
+
+            cache.put("media/4.txt", BytesIO(b"4" * 4), "etag")  # 12 bytes > 10 → 정리
+            self.assertEqual(scandir.call_count, 2)
+        self.assertIsNone(cache.get("media/2.txt"))
+        self.assertIsNotNone(cache.get("media/3.txt"))
+        self.assertIsNotNone(cache.get("media/4.txt"))
+
+    def test_entry_just_written_is_never_evicted(self) -> None:
+        path = self.disk_cache.put("media/big.txt", BytesIO(b"y" * 20), "etag")
+        self.assertEqual(path.read_bytes(), b"y" * 20)
+
+    def test_missing_file(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            self.storage.open("missing.txt")
@@ -0,0 +1,140 @@
+"""
+API Throttling
+
+공유 캐시(Redis)의 원자적 incr로 구현한 sliding window counter throttle입니다.
+직전 윈도우의 요청 수를 경과 비율만큼 가중해 현재 윈도우 카운터와 합산하므로
+고정 윈도우 경계에서 요청이 두 배로 몰리는 문제가 없습니다.
+
+- 카테고리별 기본 한도: constance (관리자 화면에서 런타임 변경)
+- 클라이언트별 한도: settings.API_THROTTLE_CLIENT_RATES
+- 한도 값이 형식에 맞지 않으면 경고를 남기고 constance 기본값을 사용합니다.
+- 거부된 요청은 카운트하지 않으므로, 계속 재시도하는 클라이언트도 Retry-After가 지나면 다시 통과합니다.
+- 제한 시 DRF가 429 응답과 Retry-After 헤더를 설정합니다.
+
+사용법:
+    class UserViewSet(ModelViewSet):
+        throttle_classes = [AppRateThrottle]
+"""
+
+from functools import lru_cache
+import logging
+import math
+import re
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from rest_framework.request import Request
+from rest_framework.throttling import BaseThrottle
+
+from config.contance import RATE_LIMIT_PATTERN
+from utils.runtime_config import get_config
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_KEY = "throttle:{}:{}:{}:{}"  # scope, client, duration, window
+
+DURATIONS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+RATE_RE = re.compile(RATE_LIMIT_PATTERN)
+
+
+@lru_cache(maxsize=64)
+def parse_rate(rate: str) -> tuple[int, int] | None:
+    """'120/min' 형식의 한도를 (요청 수, 윈도우 초)로 변환합니다. 빈 값이면 제한 없음(None), 형식이 틀리면 ValueError."""
+    if not rate:
+        return None
+    match = RATE_RE.match(rate)
+    if match is None:
+        raise ValueError(f"Invalid rate: {rate!r}")
+    return int(match[1]), DURATIONS[match[2]]
+
+
+@lru_cache(maxsize=64)
+def warn_invalid_rate(name: str, rate: str) -> None:
+    """잘못된 한도 값마다 한 번만 경고합니다."""
+    logger.warning("Invalid throttle rate %s=%r, using the default", name, rate)
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """카테고리(scope)별 sliding window counter throttle"""
+
+    scope: str = ""
+    rate_config: str = ""  # 기본 한도를 읽을 constance 키
+
+    def get_client_ident(self, request: Request) -> str:
+        """클라이언트 식별자: 로그인 유저는 user:<pk>, 그 외에는 ip:<주소>"""
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+    def get_rate(self, client: str) -> tuple[int, int] | None:
+        overrides = getattr(settings, "API_THROTTLE_CLIENT_RATES", {}).get(self.scope, {})
+        rate = overrides[client] if client in overrides else get_config(self.rate_config)
+        try:
+            return parse_rate(rate)
+        except ValueError:
+            warn_invalid_rate(self.rate_config, rate)
+            return parse_rate(settings.CONSTANCE_CONFIG[self.rate_config][0])
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        client = self.get_client_ident(request)
+        rate = self.get_rate(client)
+        if rate is None:
+            return True
+        return self.consume(client, *rate)
+
+    def consume(self, client: str, num_requests: int, duration: int) -> bool:
+        now = time.time()
+        window = int(now // duration)
+        key = THROTTLE_KEY.format(self.scope, client, duration, window)
+
+        # 요청마다 먼저 카운트하고 판단하므로, 동시에 들어온 요청도 정확히 num_requests개만 통과합니다.
+        try:
+            count = cache.incr(key)
+        except ValueError:
+            if cache.add(key, 1, timeout=duration * 2):
+                count = 1
+            else:
+                count = cache.incr(key)
+        previous = cache.get(THROTTLE_KEY.format(self.scope, client, duration, window - 1), 0)
+
+        elapsed = (now % duration) / duration
+        allowed = previous * (1 - elapsed) + count <= num_requests
+        if not allowed:
+            # 거부된 요청은 카운트에서 뺍니다. (재시도가 한도를 계속 밀어내지 않도록)
+            try:
+                cache.decr(key)
+            except ValueError:  # 그사이 만료된 경우
+                pass
+            count -= 1
+        self.history = (previous, count, elapsed, num_requests, duration)
+        return allowed
+
+    def wait(self) -> float | None:
+        """
+        다음 요청이 통과할 때까지 남은 시간(초)
+
+        통과 조건: 가중 합산(previous * (1 - t) + count) + 1 <= num_requests (t: 윈도우 경과 비율)
+        이번 윈도우 안에서 만족하지 못하면, 다음 윈도우에서 이번 count가 previous가 되어 가중되는 시점을 계산합니다.
+        """
+        previous, count, elapsed, num_requests, duration = self.history
+        room = num_requests - count - 1
+        if room >= 0 and previous > 0:
+            target = 1 - room / previous
+            if target <= 1:
+                return max(math.ceil((target - elapsed) * duration), 1)
+        # 다음 윈도우: count * (1 - u) + 1 <= num_requests
+        next_target = max(1 - (num_requests - 1) / count, 0) if count else 0
+        return max(math.ceil((1 - elapsed + next_target) * duration), 1)
+
+
+class AppRateThrottle(SlidingWindowThrottle):
+    scope = "app"
+    rate_config = "API_RATE_LIMIT_APP"
+
+
+class ExternalRateThrottle(SlidingWindowThrottle):
+    scope = "external"
+    rate_config = "API_RATE_LIMIT_EXTERNAL"
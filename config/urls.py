@@ -26,7 +26,7 @@ from drf_spectacular.views import SpectacularRedocView
 from rest_framework import routers
 
 from .schema_views import *
-from .schema_views.versioned import VersionedRedocView, VersionedSchemaAPIView, VersionedSwaggerView, VersionListAPIView
+from .schema_views.versioned import VersionDiffAPIView, VersionedRedocView, VersionedSchemaAPIView, VersionedSwaggerView, VersionListAPIView
 
 router = routers.DefaultRouter()
 # AdminUserViewSet은 이제 user/views/user/admin.py로 이동됨
@@ -40,6 +40,7 @@ urlpatterns = [
     path("", index),
     path("admin/", admin.site.urls),
     path("api/user/", include("user.urls")),
+    path("api/upload/", include("upload.urls")),
 ]
 
 if settings.DEBUG:
@@ -64,6 +65,7 @@ if settings.DEBUG:
         path("api/versions/", VersionListAPIView.as_view(), name="version-list"),
         path("api/versions/<str:version>/schema/", VersionedSchemaAPIView.as_view(), name="versioned-schema"),
         path("api/versions/<str:version>/schema/<str:category>/", VersionedSchemaAPIView.as_view(), name="versioned-category-schema"),
+        path("api/versions/<str:from_version>/diff/<str:to_version>/", VersionDiffAPIView.as_view(), name="version-diff"),
         path("swagger/versions/<str:version>/", VersionedSwaggerView.as_view(), name="versioned-swagger"),
         path("swagger/versions/<str:version>/<str:category>/", VersionedSwaggerView.as_view(), name="versioned-category-swagger"),
         path("redoc/versions/<str:version>/", VersionedRedocView.as_view(), name="versioned-redoc"),
@@ -1,8 +1,12 @@
 import json
 from typing import Dict
 
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db.models import OuterRef, Subquery
 from django.http import HttpRequest
 from django.shortcuts import render
+from django.utils import timezone
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status
@@ -10,12 +14,18 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from config.metrics import get_cards, has_pending_metrics
 from config.settings import SERVER_MODE
 from config.unfold import color_dict
-from user.models import User
+from user.models import User, UserActivity
 from user.serializers import UserListSerializer, UserSerializer
 from utils.timezone_utils import get_start_of_today
 
+# templates/admin/index.html 의 {% cache %} fragment 이름
+DASHBOARD_FRAGMENTS = ("dashboard_cards", "dashboard_charts", "dashboard_tables")
+DASHBOARD_CACHE_SCOPES = ("superuser", "staff", "user")
+DASHBOARD_CARDS_TIMEOUT = 30  # 초
+
 
 def index(request):
     return render(request, "index.html")
@@ -31,9 +41,6 @@ def environment_callback(request):
 
 
 def dashboard_callback(request: HttpRequest, context) -> Dict:
-    def get_total_user():
-        return User.objects.count()
-
     bar_chart_data = {
         "data": json.dumps(
             {
@@ -154,51 +161,13 @@ def dashboard_callback(request: HttpRequest, context) -> Dict:
 
     context.update(
         {
-            "cards": [
-                {
-                    "title": "총 유저",
-                    "metric": get_total_user(),
-                    "icon": "people",
-                    # "footer": "Footer 1",
-                },
-                {
-                    "title": "신규가입",
-                    "metric": "1",
-                    "icon": "person_add",
-                    # "footer": "Footer 2",
-                },
-                {
-                    "title": "인증대기 유저",
-                    "metric": "1",
-                    "icon": "hourglass",
-                    # "footer": "Footer 3",
-                },
-                {
-                    "title": "MAU",
-                    "metric": "0",
-                    "icon": "monitoring",
-                    # "footer": "Footer 3",
-                },
-            ],
-            "table_data": {
-                "headers": ["col 1", "col 2"],
-                "rows": [
-                    ["a", "b"],
-                    ["c", "d"],
-                ],
-            },
+            # 템플릿 fragment 캐시가 비었을 때만 평가되도록 callable로 전달합니다
+            "dashboard_cache_scope": get_dashboard_cache_scope(request),
+            "cards": get_cards,
+            "dashboard_cards_timeout": get_cards_cache_timeout,
             "bar_chart_data": bar_chart_data,
             "line_chart_data": line_chart_data,
-            "table_data": {
-                "headers": ["유저네임", "이름", "활동", "가입일"],
-                "rows": [
-                    ["user1", "홍길동", "2024-07-30", "2023-01-01"],
-                    ["user2", "김철수", "2024-07-30", "2023-02-15"],
-                    ["user3", "이영희", "2024-07-30", "2023-03-20"],
-                    ["user4", "박민수", "2024-07-29", "2023-04-10"],
-                    ["user5", "최지우", "2024-07-29", "2023-05-05"],
-                ],
-            },
+            "table_data": get_recent_users_table,
             "progress_data": [
                 {
                     "title": "Daily Exercise",
@@ -232,6 +201,39 @@ def dashboard_callback(request: HttpRequest, context) -> Dict:
     return context
 
 
+def get_dashboard_cache_scope(request: HttpRequest) -> str:
+    """대시보드 fragment 캐시를 구분하는 권한 수준"""
+    if request.user.is_superuser:
+        return "superuser"
+    if request.user.is_staff:
+        return "staff"
+    return "user"
+
+
+def get_cards_cache_timeout() -> int:
+    """대시보드 카드 fragment 캐시 시간. 아직 계산되지 않은 지표("-")가 있으면 캐시하지 않습니다."""
+    return 0 if has_pending_metrics() else DASHBOARD_CARDS_TIMEOUT
+
+
+def get_recent_users_table(limit: int = 5) -> Dict:
+    """최근 가입한 유저 테이블 (registered_at 인덱스 사용)"""
+    last_activity = UserActivity.objects.filter(user=OuterRef("pk")).order_by("-created_at").values("created_at")[:1]
+    users = User.objects.only("username", "email", "registered_at").annotate(last_activity_at=Subquery(last_activity)).order_by("-registered_at")[:limit]
+
+    def format_date(value):
+        return timezone.localtime(value).strftime("%Y-%m-%d") if value else "-"
+
+    return {
+        "headers": ["유저네임", "이메일", "활동", "가입일"],
+        "rows": [[user.username, user.email or "-", format_date(user.last_activity_at), format_date(user.registered_at)] for user in users],
+    }
+
+
+def invalidate_dashboard_cache() -> None:
+    """모든 권한 수준의 대시보드 fragment 캐시를 삭제합니다."""
+    cache.delete_many([make_template_fragment_key(fragment, [scope]) for fragment in DASHBOARD_FRAGMENTS for scope in DASHBOARD_CACHE_SCOPES])
+
+
 def user_badge_callback(request):
     start_of_today = get_start_of_today()
     count = User.objects.filter(registered_at__gte=start_of_today).count()
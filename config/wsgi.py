@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# 활동 이벤트 버퍼를 주기적으로 저장하는 백그라운드 스레드
+from user.activity import activity_buffer  # noqa: E402
+
+activity_buffer.start()
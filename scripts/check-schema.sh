@@ -0,0 +1,9 @@
+#!/bin/bash
+# API 스키마 변경 감지 (pre-commit)
+# 스키마 입력 fingerprint가 마지막 통과 시점과 같으면 Django를 부팅하지 않고 바로 통과합니다.
+
+if python config/schema_fingerprint.py; then
+    exit 0
+fi
+
+exec python manage.py check_schema
@@ -0,0 +1,30 @@
+from django.contrib import admin
+
+from config.admin import ModelAdmin
+
+from .models import Blob, BlobReference, Upload
+
+
+@admin.register(Upload)
+class UploadAdmin(ModelAdmin):
+    list_display = ("filename", "user", "size", "method", "status", "created_at", "completed_at")
+    list_filter = ("status", "method")
+    search_fields = ("filename", "file", "user__username")
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
+    readonly_fields = ("file", "size", "method", "multipart_upload_id", "etag", "created_at", "completed_at")
+
+
+@admin.register(Blob)
+class BlobAdmin(ModelAdmin):
+    list_display = ("file", "size", "created_at")
+    search_fields = ("sha256",)
+    readonly_fields = ("file", "sha256", "size", "created_at")
+
+
+@admin.register(BlobReference)
+class BlobReferenceAdmin(ModelAdmin):
+    list_display = ("name", "blob", "updated_at")
+    search_fields = ("name",)
+    list_select_related = ("blob",)
+    raw_id_fields = ("blob",)
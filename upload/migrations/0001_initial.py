@@ -0,0 +1,41 @@
+# Generated by Django 5.2.13 on 2026-10-19 09:24
+
+import config.storages
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Upload",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("file", models.FileField(max_length=500, storage=config.storages.MediaStorage, upload_to="", verbose_name="파일")),
+                ("filename", models.CharField(max_length=255, verbose_name="원본 파일명")),
+                ("content_type", models.CharField(max_length=255, verbose_name="Content-Type")),
+                ("size", models.PositiveBigIntegerField(verbose_name="크기 (bytes)")),
+                ("method", models.CharField(choices=[("post", "Presigned POST"), ("put", "Presigned PUT"), ("multipart", "Multipart")], max_length=10, verbose_name="업로드 방식")),
+                ("multipart_upload_id", models.CharField(blank=True, default="", max_length=255, verbose_name="Multipart Upload ID")),
+                ("status", models.CharField(choices=[("pending", "업로드 대기"), ("completed", "완료"), ("aborted", "취소")], default="pending", max_length=10, verbose_name="상태")),
+                ("etag", models.CharField(blank=True, default="", max_length=255, verbose_name="ETag")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+                ("completed_at", models.DateTimeField(blank=True, null=True, verbose_name="완료일시")),
+                ("user", models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="uploads", to=settings.AUTH_USER_MODEL, verbose_name="유저")),
+            ],
+            options={
+                "verbose_name": "업로드",
+                "verbose_name_plural": "업로드",
+                "db_table": "upload",
+                "indexes": [models.Index(fields=["user", "created_at"], name="upload_user_id_569a75_idx")],
+            },
+        ),
+    ]
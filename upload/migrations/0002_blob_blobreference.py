@@ -0,0 +1,45 @@
+# Generated by Django 5.2.13 on 2026-10-19 09:27
+
+import config.storages
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("upload", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Blob",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("file", models.FileField(storage=config.storages.content_addressed_storage, unique=True, upload_to="", verbose_name="파일")),
+                ("sha256", models.CharField(db_index=True, max_length=64, verbose_name="SHA-256")),
+                ("size", models.PositiveBigIntegerField(verbose_name="크기 (bytes)")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+            ],
+            options={
+                "verbose_name": "Blob",
+                "verbose_name_plural": "Blob",
+                "db_table": "blob",
+            },
+        ),
+        migrations.CreateModel(
+            name="BlobReference",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=255, unique=True, verbose_name="경로")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성일시")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일시")),
+                ("blob", models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name="references", to="upload.blob", verbose_name="Blob")),
+            ],
+            options={
+                "verbose_name": "Blob 참조",
+                "verbose_name_plural": "Blob 참조",
+                "db_table": "blob_reference",
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.13 on 2026-10-19 10:24
+
+from django.db import migrations, models
+
+
+def merge_duplicate_blobs(apps, schema_editor):
+    """확장자만 다른 같은 내용의 Blob을 가장 먼저 저장된 Blob 하나로 합칩니다. (남은 Storage 객체는 참조되지 않음)"""
+    Blob = apps.get_model("upload", "Blob")
+    BlobReference = apps.get_model("upload", "BlobReference")
+
+    duplicates = Blob.objects.values("sha256").annotate(count=models.Count("pk")).filter(count__gt=1).values_list("sha256", flat=True)
+    for digest in duplicates:
+        keep, *others = Blob.objects.filter(sha256=digest).order_by("pk").values_list("pk", flat=True)
+        BlobReference.objects.filter(blob_id__in=others).update(blob_id=keep)
+        Blob.objects.filter(pk__in=others).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("upload", "0002_blob_blobreference"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_blobs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="blob",
+            name="sha256",
+            field=models.CharField(max_length=64, unique=True, verbose_name="SHA-256"),
+        ),
+    ]
@@ -0,0 +1,132 @@
+from django.conf import settings
+from django.core.files import File
+from django.db import IntegrityError, models, transaction
+from django.utils.translation import gettext_lazy as _
+
+from config.storages import MediaStorage, content_addressed_storage, hash_content
+
+
+class Upload(models.Model):
+    """
+    S3 직접 업로드 기록
+
+    클라이언트는 presigned URL로 S3에 바로 업로드하고, 완료 API 호출 시 객체를 확인한 뒤 completed로 기록합니다.
+    file은 MediaStorage(S3) 기준 경로이므로 file.url로 바로 접근할 수 있습니다.
+    """
+
+    class Method(models.TextChoices):
+        POST = "post", _("Presigned POST")
+        PUT = "put", _("Presigned PUT")
+        MULTIPART = "multipart", _("Multipart")
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("업로드 대기")
+        COMPLETED = "completed", _("완료")
+        ABORTED = "aborted", _("취소")
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="uploads", verbose_name=_("유저"))
+    file = models.FileField(max_length=500, storage=MediaStorage, verbose_name=_("파일"))
+    filename = models.CharField(max_length=255, verbose_name=_("원본 파일명"))
+    content_type = models.CharField(max_length=255, verbose_name=_("Content-Type"))
+    size = models.PositiveBigIntegerField(verbose_name=_("크기 (bytes)"))
+    method = models.CharField(max_length=10, choices=Method.choices, verbose_name=_("업로드 방식"))
+    multipart_upload_id = models.CharField(max_length=255, blank=True, default="", verbose_name=_("Multipart Upload ID"))
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING, verbose_name=_("상태"))
+    etag = models.CharField(max_length=255, blank=True, default="", verbose_name=_("ETag"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("생성일시"))
+    completed_at = models.DateTimeField(null=True, blank=True, verbose_name=_("완료일시"))
+
+    class Meta:
+        db_table = "upload"
+        verbose_name = _("업로드")
+        verbose_name_plural = _("업로드")
+        indexes = [
+            models.Index(fields=["user", "created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return self.filename
+
+    @property
+    def key(self) -> str:
+        """S3 객체 키 (MediaStorage location 포함)"""
+        return f"{MediaStorage.location}/{self.file.name}"
+
+    @property
+    def is_image(self) -> bool:
+        return self.content_type.startswith("image/")
+
+
+class BlobManager(models.Manager["Blob"]):
+    def store(self, content: File, name: str = "") -> "Blob":
+        """
+        내용이 같은 Blob이 있으면 그대로 반환하고, 없을 때만 Storage에 업로드합니다.
+        sha256(unique)으로 조회하므로 S3 존재 확인 없이 DB 조회 한 번으로 중복을 판단합니다.
+        확장자가 달라도 내용이 같으면 같은 Blob이며, 확장자는 참조(BlobReference.name)에 남습니다.
+        """
+        digest = hash_content(content)
+        blob = self.filter(sha256=digest).first()
+        if blob is not None:
+            return blob
+
+        blob = self.model(sha256=digest, size=content.size)
+        blob.file.save(name or digest, content, save=False)  # 저장 경로는 Storage가 내용 해시로 정함
+        try:
+            with transaction.atomic(using=self.db):
+                blob.save(using=self.db)
+        except IntegrityError:  # 동시에 같은 내용이 저장된 경우 (객체는 같은 내용으로 덮어써짐)
+            return self.get(sha256=digest)
+        return blob
+
+    def unreferenced(self) -> models.QuerySet["Blob"]:
+        return self.filter(references__isnull=True)
+
+
+class Blob(models.Model):
+    """내용 해시로 저장된 파일 (같은 내용은 확장자와 관계없이 한 번만 저장)"""
+
+    file = models.FileField(max_length=100, unique=True, storage=content_addressed_storage, verbose_name=_("파일"))
+    sha256 = models.CharField(max_length=64, unique=True, verbose_name=_("SHA-256"))
+    size = models.PositiveBigIntegerField(verbose_name=_("크기 (bytes)"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("생성일시"))
+
+    objects: BlobManager = BlobManager()
+
+    class Meta:
+        db_table = "blob"
+        verbose_name = _("Blob")
+        verbose_name_plural = _("Blob")
+
+    def __str__(self) -> str:
+        return self.file.name
+
+
+class BlobReferenceManager(models.Manager["BlobReference"]):
+    def attach(self, name: str, content: File) -> "BlobReference":
+        """논리 경로 name이 content를 가리키도록 저장합니다. (기존 참조는 새 Blob으로 교체)"""
+        blob = Blob.objects.store(content, name)
+        reference, _ = self.update_or_create(name=name, defaults={"blob": blob})
+        return reference
+
+
+class BlobReference(models.Model):
+    """논리 파일 경로 → Blob 매핑"""
+
+    name = models.CharField(max_length=255, unique=True, verbose_name=_("경로"))
+    blob = models.ForeignKey(Blob, on_delete=models.PROTECT, related_name="references", verbose_name=_("Blob"))
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("생성일시"))
+    updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일시"))
+
+    objects: BlobReferenceManager = BlobReferenceManager()
+
+    class Meta:
+        db_table = "blob_reference"
+        verbose_name = _("Blob 참조")
+        verbose_name_plural = _("Blob 참조")
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def url(self) -> str:
+        return self.blob.file.url
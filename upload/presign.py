@@ -0,0 +1,134 @@
+"""
+S3 직접 업로드
+
+presigned POST/PUT URL 또는 multipart part URL을 발급하고, 업로드 완료 시 S3 객체를 확인해 기록합니다.
+파일 내용은 앱 서버를 거치지 않습니다.
+
+흐름:
+    1. create_upload()   → Upload(pending) 생성 + 업로드 URL 발급
+    2. 클라이언트가 S3에 직접 업로드 (multipart는 part별 PUT 후 ETag 수집)
+    3. complete_upload() → (multipart 완료) + head_object로 크기 확인 → completed
+                           (이미지이고 RENDITION_ON_UPLOAD면 변환본 생성 task 예약)
+"""
+
+import math
+import os
+from typing import Any
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from config.s3 import get_s3_client
+
+from .models import Upload
+
+
+class UploadError(Exception):
+    """S3 객체가 요청과 다르거나 완료할 수 없는 업로드"""
+
+
+def build_name(filename: str) -> str:
+    """MediaStorage 기준 저장 경로 (업로드마다 고유)"""
+    return f"uploads/{timezone.localdate():%Y/%m/%d}/{uuid.uuid4().hex}/{get_valid_filename(os.path.basename(filename)) or 'file'}"
+
+
+def create_upload(user: Any, filename: str, content_type: str, size: int, method: str = Upload.Method.POST) -> tuple[Upload, dict[str, Any]]:
+    """업로드 기록을 만들고 클라이언트에 전달할 업로드 정보를 반환합니다. 큰 파일은 multipart로 전환합니다."""
+    if size > settings.UPLOAD_MULTIPART_THRESHOLD:
+        method = Upload.Method.MULTIPART
+
+    upload = Upload(user=user, filename=filename, content_type=content_type, size=size, method=method)
+    upload.file.name = build_name(filename)
+
+    client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    expires_in = settings.UPLOAD_URL_EXPIRES
+    ticket: dict[str, Any] = {"method": method, "expires_in": expires_in}
+
+    if method == Upload.Method.POST:
+        post = client.generate_presigned_post(
+            Bucket=bucket,
+            Key=upload.key,
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", size, size]],
+            ExpiresIn=expires_in,
+        )
+        ticket.update(url=post["url"], fields=post["fields"])
+    elif method == Upload.Method.PUT:
+        ticket["url"] = client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": bucket, "Key": upload.key, "ContentType": content_type},
+            ExpiresIn=expires_in,
+        )
+        ticket["headers"] = {"Content-Type": content_type}
+    else:
+        upload.multipart_upload_id = client.create_multipart_upload(Bucket=bucket, Key=upload.key, ContentType=content_type)["UploadId"]
+        part_size = settings.UPLOAD_PART_SIZE
+        ticket["part_size"] = part_size
+        ticket["parts"] = [
+            {
+                "part_number": part_number,
+                "url": client.generate_presigned_url(
+                    "upload_part",
+                    Params={"Bucket": bucket, "Key": upload.key, "UploadId": upload.multipart_upload_id, "PartNumber": part_number},
+                    ExpiresIn=expires_in,
+                ),
+            }
+            for part_number in range(1, max(math.ceil(size / part_size), 1) + 1)
+        ]
+
+    upload.save()
+    return upload, ticket
+
+
+def complete_upload(upload: Upload, parts: list[dict[str, Any]] | None = None) -> Upload:
+    """S3 객체를 확인하고 업로드를 완료 처리합니다. multipart는 part ETag 목록으로 객체를 조립합니다."""
+    if upload.status != Upload.Status.PENDING:
+        raise UploadError("이미 완료되었거나 취소된 업로드입니다.")
+
+    client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    if upload.method == Upload.Method.MULTIPART:
+        if not parts:
+            raise UploadError("multipart 업로드는 part 목록이 필요합니다.")
+        try:
+            client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=upload.key,
+                UploadId=upload.multipart_upload_id,
+                MultipartUpload={"Parts": [{"PartNumber": part["part_number"], "ETag": part["etag"]} for part in sorted(parts, key=lambda part: part["part_number"])]},
+            )
+        except client.exceptions.ClientError as e:  # InvalidPart, InvalidPartOrder, NoSuchUpload 등 잘못된 part 목록
+            raise UploadError(f"multipart 업로드를 완료할 수 없습니다. ({e.response['Error']['Code']})") from e
+
+    try:
+        head = client.head_object(Bucket=bucket, Key=upload.key)
+    except client.exceptions.ClientError as e:
+        raise UploadError("업로드된 파일을 찾을 수 없습니다.") from e
+    if head["ContentLength"] != upload.size:
+        raise UploadError(f"파일 크기가 일치하지 않습니다. (요청: {upload.size}, 업로드: {head['ContentLength']})")
+
+    upload.etag = head["ETag"].strip('"')
+    upload.status = Upload.Status.COMPLETED
+    upload.completed_at = timezone.now()
+    upload.save(update_fields=["etag", "status", "completed_at"])
+
+    if settings.RENDITION_ON_UPLOAD and upload.is_image:
+        from .tasks import generate_upload_renditions
+
+        transaction.on_commit(lambda: generate_upload_renditions.delay(upload.pk))
+    return upload
+
+
+def abort_upload(upload: Upload) -> Upload:
+    """완료되지 않은 업로드를 취소합니다. multipart는 S3에 올라간 part도 정리합니다."""
+    if upload.status != Upload.Status.PENDING:
+        raise UploadError("대기 중인 업로드만 취소할 수 있습니다.")
+    if upload.method == Upload.Method.MULTIPART:
+        get_s3_client().abort_multipart_upload(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=upload.key, UploadId=upload.multipart_upload_id)
+    upload.status = Upload.Status.ABORTED
+    upload.save(update_fields=["status"])
+    return upload
@@ -0,0 +1,147 @@
+"""
+이미지 변환본 (rendition)
+
+업로드된 원본 이미지를 여러 너비와 포맷(WebP/JPEG)으로 줄인 변환본을 만들어 settings.STORAGES["renditions"](MediaStorage)에 저장합니다.
+변환본 키는 원본 이름, 너비, 포맷으로 정해지므로 한 번 만든 뒤에는 존재 여부만 확인하고 redirect합니다.
+
+- get_rendition(): 첫 요청 시 생성 (lazy), 이후에는 캐시된 존재 여부로 바로 이름 반환
+- generate_renditions(): 업로드 완료 시 모든 변환본을 미리 생성 (settings.RENDITION_ON_UPLOAD, celery)
+
+디코딩/리사이즈/인코딩은 CPU를 오래 쓰므로 웹 프로세스가 아닌 ProcessPoolExecutor에서 실행합니다.
+원본 하나의 변환본은 worker 하나가 한 번 디코딩해 모두 만들고, 여러 원본은 worker들이 나눠 처리합니다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import io
+import multiprocessing
+import os
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, storages
+from django.db.models.fields.files import FieldFile
+
+from PIL import Image, ImageOps
+
+RENDITION_CACHE_KEY = "rendition:{}"
+
+EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+CONTENT_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+
+
+class RenditionError(Exception):
+    """이미지가 아니거나 변환할 수 없는 원본"""
+
+
+def rendition_storage() -> Storage:
+    return storages["renditions"]
+
+
+def rendition_name(source_name: str, width: int, fmt: str) -> str:
+    """변환본 저장 경로 (원본 이름, 너비, 포맷이 같으면 항상 같은 경로)"""
+    return f"renditions/{os.path.splitext(source_name)[0]}/{width}.{EXTENSIONS[fmt]}"
+
+
+def pick_width(width: int) -> int:
+    """요청 너비를 허용된 너비 중 같거나 큰 가장 작은 값으로 올립니다. (변환본 종류를 제한)"""
+    widths = sorted(settings.RENDITION_WIDTHS)
+    return next((w for w in widths if w >= width), widths[-1])
+
+
+def render(data: bytes, variants: list[tuple[int, str]], quality: int) -> list[bytes]:
+    """
+    원본 이미지를 한 번만 디코딩해 variants의 (width, fmt)마다 width 이하로 줄여 인코딩합니다. (worker 프로세스에서 실행)
+
+    원본보다 크게 늘리지 않고, EXIF 회전을 반영하며, JPEG는 투명도를 흰 배경으로 합성합니다.
+    """
+    largest = max(width for width, _ in variants)
+    with Image.open(io.BytesIO(data)) as image:
+        image.draft("RGB", (largest, largest))  # JPEG는 디코딩 단계에서 축소 (회전 전이므로 양변 모두 width 이상 유지)
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA") if image.has_transparency_data else image.convert("RGB")
+        return [_encode(_resize(image, width), fmt, quality) for width, fmt in variants]
+
+
+def _resize(image: Image.Image, width: int) -> Image.Image:
+    if image.width <= width:
+        return image
+    return image.resize((width, max(round(image.height * width / image.width), 1)), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+    output = io.BytesIO()
+    if fmt == "jpeg":
+        if image.mode == "RGBA":
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        image.save(output, "JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(output, "WEBP", quality=quality, method=4)
+    return output.getvalue()
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> ProcessPoolExecutor:
+    """
+    리사이즈 worker 프로세스 풀 (프로세스당 하나, 처음 사용할 때 생성)
+
+    worker는 fork하지 않고 forkserver(없으면 spawn)로 시작하므로 웹 프로세스의 스레드, DB 연결, 락을 물려받지 않습니다.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=settings.RENDITION_WORKERS, mp_context=multiprocessing.get_context(method))
+
+
+def generate_renditions(source: FieldFile, variants: list[tuple[int, str]] | None = None) -> list[str]:
+    """
+    원본을 한 번 읽어 worker 프로세스 하나에 넘기고, worker는 한 번 디코딩한 이미지로 변환본을 모두 만듭니다.
+    (원본 bytes를 변환본마다 worker로 복사하고 다시 디코딩하지 않습니다)
+
+    variants를 생략하면 RENDITION_WIDTHS x RENDITION_FORMATS 전체를 만듭니다.
+    저장한 변환본 이름 목록을 반환합니다.
+    """
+    if not source.name:
+        raise RenditionError("원본 파일이 없습니다.")
+    if variants is None:
+        variants = [(width, fmt) for width in settings.RENDITION_WIDTHS for fmt in settings.RENDITION_FORMATS]
+
+    with source.open("rb") as f:
+        data = f.read()
+
+    try:
+        contents = get_executor().submit(render, data, variants, settings.RENDITION_QUALITY).result()
+    except (OSError, Image.DecompressionBombError) as e:  # UnidentifiedImageError는 OSError
+        raise RenditionError("이미지로 변환할 수 없는 파일입니다.") from e
+
+    storage = rendition_storage()
+    names = []
+    for (width, fmt), content in zip(variants, contents):
+        name = rendition_name(source.name, width, fmt)
+        file = ContentFile(content)
+        file.content_type = CONTENT_TYPES[fmt]  # type: ignore[attr-defined]  # S3Storage가 ContentType으로 사용
+        storage.save(name, file)
+        cache.set(RENDITION_CACHE_KEY.format(name), True, None)
+        names.append(name)
+    return names
+
+
+def get_rendition(source: FieldFile, width: int, fmt: str) -> str:
+    """
+    변환본 이름을 반환합니다. 없으면 그 변환본 하나만 만들어 저장합니다.
+
+    존재 여부는 캐시에 기록하므로 이후 요청은 Storage 확인(HEAD) 없이 바로 반환합니다.
+    """
+    if not source.name:
+        raise RenditionError("원본 파일이 없습니다.")
+    width = pick_width(width)
+    name = rendition_name(source.name, width, fmt)
+    cache_key = RENDITION_CACHE_KEY.format(name)
+    if cache.get(cache_key):
+        return name
+
+    if rendition_storage().exists(name):
+        cache.set(cache_key, True, None)
+        return name
+    return generate_renditions(source, [(width, fmt)])[0]
@@ -0,0 +1,64 @@
+from django.conf import settings
+
+from rest_framework import serializers
+
+from .models import Upload
+
+
+class UploadSerializer(serializers.ModelSerializer):
+    """업로드 기록 Serializer"""
+
+    class Meta:
+        model = Upload
+        fields = ["id", "file", "filename", "content_type", "size", "method", "status", "etag", "created_at", "completed_at"]
+        read_only_fields = fields
+
+
+class UploadCreateSerializer(serializers.Serializer):
+    """업로드 URL 발급 요청"""
+
+    filename = serializers.CharField(max_length=255, help_text="원본 파일명")
+    content_type = serializers.CharField(max_length=255, help_text="파일 Content-Type")
+    size = serializers.IntegerField(min_value=1, help_text="파일 크기 (bytes), 업로드된 객체와 정확히 일치해야 합니다.")
+    method = serializers.ChoiceField(
+        choices=[Upload.Method.POST, Upload.Method.PUT],
+        default=Upload.Method.POST,
+        help_text="presigned POST(form) 또는 PUT. 큰 파일은 자동으로 multipart로 전환됩니다.",
+    )
+
+    def validate_size(self, value: int) -> int:
+        if value > settings.UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(f"최대 {settings.UPLOAD_MAX_SIZE} bytes까지 업로드할 수 있습니다.")
+        return value
+
+
+class UploadPartSerializer(serializers.Serializer):
+    part_number = serializers.IntegerField(min_value=1)
+    url = serializers.URLField(read_only=True)
+    etag = serializers.CharField(write_only=True, help_text="part 업로드 응답의 ETag 헤더")
+
+
+class UploadTicketSerializer(serializers.Serializer):
+    """클라이언트가 S3에 직접 업로드할 때 필요한 정보"""
+
+    upload = UploadSerializer()
+    method = serializers.ChoiceField(choices=Upload.Method.choices)
+    expires_in = serializers.IntegerField(help_text="URL 유효 시간 (초)")
+    url = serializers.URLField(required=False, help_text="post/put 업로드 URL")
+    fields = serializers.DictField(child=serializers.CharField(), required=False, help_text="post: form 필드 (file 필드보다 먼저 전송)")  # type: ignore[assignment]  # 선언 필드는 metaclass가 _declared_fields로 옮김
+    headers = serializers.DictField(child=serializers.CharField(), required=False, help_text="put: 요청 헤더")
+    part_size = serializers.IntegerField(required=False, help_text="multipart: part 크기 (마지막 part 제외)")
+    parts = UploadPartSerializer(many=True, required=False, help_text="multipart: part별 PUT URL")
+
+
+class UploadCompleteSerializer(serializers.Serializer):
+    """업로드 완료 요청 (multipart는 part ETag 목록 필요)"""
+
+    parts = UploadPartSerializer(many=True, required=False)
+
+
+class RenditionQuerySerializer(serializers.Serializer):
+    """이미지 변환본 요청"""
+
+    width = serializers.IntegerField(min_value=1, help_text="원하는 너비 (px), 허용된 너비 중 같거나 큰 값으로 올림")
+    image_format = serializers.ChoiceField(choices=settings.RENDITION_FORMATS, default="webp", help_text="변환 포맷")
@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from .models import Upload
+from .renditions import generate_renditions
+
+
+@shared_task
+def generate_upload_renditions(upload_id: int) -> list[str]:
+    """업로드된 이미지의 변환본을 모두 미리 만듭니다."""
+    upload = Upload.objects.get(pk=upload_id)
+    return generate_renditions(upload.file)
@@ -0,0 +1,213 @@
+from concurrent.futures import ProcessPoolExecutor
+import io
+from typing import Any
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+
+from PIL import Image
+import boto3
+from moto import mock_aws
+import requests
+from storages.backends.s3 import S3Storage
+
+from config.s3 import get_s3_client
+from config.storages import ContentAddressedStorage, MediaStorage
+
+from .models import Blob, BlobReference, Upload
+from .presign import build_name
+from .renditions import generate_renditions
+
+User = get_user_model()
+
+
+@mock_aws
+@override_settings(AWS_STORAGE_BUCKET_NAME="upload-test")
+class UploadTests(TestCase):
+    url = "/api/upload/app/uploads/"
+
+    def setUp(self) -> None:
+        get_s3_client.cache_clear()
+        self.addCleanup(get_s3_client.cache_clear)
+        self.s3 = boto3.client("s3", region_name="ap-northeast-2")
+        self.s3.create_bucket(Bucket="upload-test", CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+        self.client.force_login(self.user)
+
+    def create(self, content: bytes, method: str = "post") -> dict:
+        response = self.client.post(self.url, {"filename": "../photo 1.png", "content_type": "image/png", "size": len(content), "method": method})
+        self.assertEqual(response.status_code, 201)
+        return response.json()
+
+    def complete(self, ticket: dict, parts: list[dict] | None = None) -> Any:
+        return self.client.post(f"{self.url}{ticket['upload']['id']}/complete/", {"parts": parts or []}, content_type="application/json")
+
+    def test_presigned_post(self) -> None:
+        ticket = self.create(b"png-bytes")
+        response = requests.post(ticket["url"], data=ticket["fields"], files={"file": b"png-bytes"})
+        self.assertLess(response.status_code, 300)
+
+        response = self.complete(ticket)
+        self.assertEqual(response.json()["status"], "completed")
+        upload = Upload.objects.get()
+        self.assertRegex(upload.file.name, r"^uploads/\d{4}/\d{2}/\d{2}/[0-9a-f]{32}/photo_1\.png$")
+        self.assertEqual(self.s3.get_object(Bucket="upload-test", Key=f"media/{upload.file.name}")["Body"].read(), b"png-bytes")
+
+    def test_presigned_put_size_mismatch(self) -> None:
+        ticket = self.create(b"png-bytes", method="put")
+        requests.put(ticket["url"], data=b"png", headers=ticket["headers"])
+
+        response = self.complete(ticket)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Upload.objects.get().status, Upload.Status.PENDING)
+
+    @override_settings(UPLOAD_MULTIPART_THRESHOLD=1024, UPLOAD_PART_SIZE=5 * 1024**2)
+    def test_multipart_upload(self) -> None:
+        content = b"x" * (5 * 1024**2 + 10)
+        ticket = self.create(content)
+        self.assertEqual(ticket["method"], "multipart")
+        self.assertEqual(len(ticket["parts"]), 2)
+
+        parts = []
+        for part in ticket["parts"]:
+            start = (part["part_number"] - 1) * ticket["part_size"]
+            response = requests.put(part["url"], data=content[start : start + ticket["part_size"]])
+            parts.append({"part_number": part["part_number"], "etag": response.headers["ETag"]})
+
+        response = self.complete(ticket, parts)
+        self.assertEqual(response.json()["status"], "completed")
+        self.assertEqual(self.s3.head_object(Bucket="upload-test", Key=f"media/{Upload.objects.get().file.name}")["ContentLength"], len(content))
+
+    @override_settings(UPLOAD_MULTIPART_THRESHOLD=1024, UPLOAD_PART_SIZE=5 * 1024**2)
+    def test_multipart_invalid_part_etag(self) -> None:
+        ticket = self.create(b"x" * 2048)
+        part = ticket["parts"][0]
+        requests.put(part["url"], data=b"x" * 2048)
+
+        response = self.complete(ticket, [{"part_number": part["part_number"], "etag": '"0123456789abcdef0123456789abcdef"'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("InvalidPart", str(response.json()))
+        self.assertEqual(Upload.objects.get().status, Upload.Status.PENDING)
+
+    @override_settings(UPLOAD_MULTIPART_THRESHOLD=1024)
+    def test_abort_multipart(self) -> None:
+        ticket = self.create(b"x" * 2048)
+        response = self.client.delete(f"{self.url}{ticket['upload']['id']}/")
+        self.assertEqual(response.json()["status"], "aborted")
+        self.assertNotIn("Uploads", self.s3.list_multipart_uploads(Bucket="upload-test"))
+
+    def test_other_users_uploads_are_hidden(self) -> None:
+        ticket = self.create(b"png-bytes")
+        other = User.objects.create_user(username="other", email="other@example.com", password="testpass123")
+        self.client.force_login(other)
+        self.assertEqual(self.complete(ticket).status_code, 404)
+        self.assertEqual(self.client.get(self.url).json(), [])
+
+
+@mock_aws
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self) -> None:
+        self.s3 = boto3.client("s3", region_name="ap-northeast-2")
+        self.s3.create_bucket(Bucket="upload-test", CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+        patcher = mock.patch.object(Blob._meta.get_field("file"), "storage", ContentAddressedStorage(bucket_name="upload-test"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_identical_content_is_stored_once(self) -> None:
+        with mock.patch.object(S3Storage, "_save", autospec=True, side_effect=S3Storage._save) as save, mock.patch.object(S3Storage, "exists") as exists:
+            first = BlobReference.objects.attach("avatars/1.png", ContentFile(b"same image"))
+            second = BlobReference.objects.attach("avatars/2.png", ContentFile(b"same image"))
+        exists.assert_not_called()
+        self.assertEqual(save.call_count, 1)
+
+        self.assertEqual(first.blob, second.blob)
+        self.assertRegex(first.blob.file.name, r"^sha256/([0-9a-f]{2})/([0-9a-f]{2})/\1\2[0-9a-f]{60}$")
+        self.assertEqual(self.s3.get_object(Bucket="upload-test", Key=f"media/{first.blob.file.name}")["Body"].read(), b"same image")
+
+    def test_blob_is_keyed_on_content_not_extension(self) -> None:
+        png = BlobReference.objects.attach("avatars/1.png", ContentFile(b"same image"))
+        jpg = BlobReference.objects.attach("avatars/1.jpg", ContentFile(b"same image"))
+        self.assertEqual(png.blob, jpg.blob)
+        self.assertEqual(Blob.objects.count(), 1)
+        self.assertEqual([png.name, jpg.name], ["avatars/1.png", "avatars/1.jpg"])
+        # 저장 경로에는 확장자가 없으므로 Content-Type은 처음 저장한 이름으로 정해집니다
+        self.assertEqual(self.s3.head_object(Bucket="upload-test", Key=f"media/{png.blob.file.name}")["ContentType"], "image/png")
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Blob.objects.create(file="sha256/other", sha256=png.blob.sha256, size=10)
+
+    def test_reattach_replaces_blob(self) -> None:
+        BlobReference.objects.attach("avatars/1.png", ContentFile(b"old image"))
+        reference = BlobReference.objects.attach("avatars/1.png", ContentFile(b"new image"))
+        self.assertEqual(reference.blob.file.read(), b"new image")
+        self.assertEqual(BlobReference.objects.count(), 1)
+        self.assertEqual(Blob.objects.unreferenced().count(), 1)
+
+
+@mock_aws
+@override_settings(STORAGES={"renditions": {"BACKEND": "config.storages.MediaStorage", "OPTIONS": {"file_overwrite": True, "bucket_name": "upload-test"}}})
+class RenditionTests(TestCase):
+    def setUp(self) -> None:
+        self.s3 = boto3.client("s3", region_name="ap-northeast-2")
+        self.s3.create_bucket(Bucket="upload-test", CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+        patcher = mock.patch.object(Upload._meta.get_field("file"), "storage", MediaStorage(bucket_name="upload-test"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+        self.client.force_login(self.user)
+
+    def create_upload(self, content: bytes, content_type: str = "image/png") -> Upload:
+        upload = Upload(user=self.user, filename="photo.png", content_type=content_type, size=len(content), method=Upload.Method.PUT, status=Upload.Status.COMPLETED)
+        upload.file.name = build_name("photo.png")
+        self.s3.put_object(Bucket="upload-test", Key=upload.key, Body=content)
+        upload.save()
+        return upload
+
+    def test_rendition_is_generated_once_and_redirected(self) -> None:
+        image = io.BytesIO()
+        Image.new("RGBA", (800, 600), (255, 0, 0, 128)).save(image, "PNG")
+        upload = self.create_upload(image.getvalue())
+        url = f"/api/upload/app/uploads/{upload.pk}/rendition/"
+
+        response = self.client.get(url, {"width": "300", "image_format": "webp"})
+        self.assertEqual(response.status_code, 302)
+        key = f"media/renditions/{upload.file.name.removesuffix('.png')}/320.webp"
+        self.assertIn(key, response["Location"])
+        obj = self.s3.get_object(Bucket="upload-test", Key=key)
+        self.assertEqual(obj["ContentType"], "image/webp")
+        with Image.open(obj["Body"]) as rendition:
+            self.assertEqual((rendition.format, rendition.size), ("WEBP", (320, 240)))
+
+        with mock.patch("upload.renditions.generate_renditions") as generate, mock.patch.object(MediaStorage, "exists") as exists:
+            response = self.client.get(url, {"width": "320", "image_format": "webp"})
+        self.assertEqual(response.status_code, 302)
+        generate.assert_not_called()
+        exists.assert_not_called()
+
+        response = self.client.get(url, {"width": "4000", "image_format": "jpeg"})
+        with Image.open(self.s3.get_object(Bucket="upload-test", Key=key.replace("320.webp", "1280.jpg"))["Body"]) as rendition:
+            self.assertEqual((rendition.format, rendition.size), ("JPEG", (800, 600)))
+
+    def test_all_variants_are_rendered_in_one_worker_call(self) -> None:
+        image = io.BytesIO()
+        Image.new("RGB", (800, 600), (255, 0, 0)).save(image, "JPEG")
+        upload = self.create_upload(image.getvalue(), "image/jpeg")
+
+        with mock.patch.object(ProcessPoolExecutor, "submit", autospec=True, side_effect=ProcessPoolExecutor.submit) as submit:
+            names = generate_renditions(upload.file, [(160, "webp"), (320, "jpeg"), (1280, "jpeg")])
+        self.assertEqual(submit.call_count, 1)
+        sizes = []
+        for name in names:
+            with Image.open(self.s3.get_object(Bucket="upload-test", Key=f"media/{name}")["Body"]) as rendition:
+                sizes.append((rendition.format, rendition.size))
+        self.assertEqual(sizes, [("WEBP", (160, 120)), ("JPEG", (320, 240)), ("JPEG", (800, 600))])
+
+    def test_non_image_is_rejected(self) -> None:
+        upload = self.create_upload(b"not an image")
+        response = self.client.get(f"/api/upload/app/uploads/{upload.pk}/rendition/", {"width": 160})
+        self.assertEqual(response.status_code, 400)
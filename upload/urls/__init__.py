@@ -0,0 +1,5 @@
+from django.urls import include, path
+
+urlpatterns = [
+    path("app/", include("upload.urls.app")),
+]
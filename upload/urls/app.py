@@ -0,0 +1,12 @@
+from django.urls import include, path
+
+from rest_framework.routers import DefaultRouter
+
+from ..views.upload.app import UploadViewSet
+
+router = DefaultRouter()
+router.register(r"uploads", UploadViewSet, basename="app-uploads")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
@@ -0,0 +1,115 @@
+from typing import cast
+
+from django.db.models import QuerySet
+from django.http import HttpResponseRedirect
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema, extend_schema_view
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.viewsets import ModelViewSet
+
+from config.throttling import AppRateThrottle
+from user.models import User
+
+from ...models import Upload
+from ...presign import UploadError, abort_upload, complete_upload, create_upload
+from ...renditions import RenditionError, get_rendition, rendition_storage
+from ...serializers import RenditionQuerySerializer, UploadCompleteSerializer, UploadCreateSerializer, UploadSerializer, UploadTicketSerializer
+
+
+@extend_schema_view(
+    list=extend_schema(tags=["app-upload"], summary="내 업로드 목록", description="로그인한 사용자의 업로드 기록을 조회합니다."),
+    retrieve=extend_schema(tags=["app-upload"], summary="업로드 상세 조회", description="업로드 기록을 조회합니다."),
+)
+class UploadViewSet(ModelViewSet):
+    """
+    S3 직접 업로드 ViewSet
+
+    파일은 발급된 presigned URL로 S3에 바로 올리고, 서버는 URL 발급과 완료 확인만 처리합니다.
+    """
+
+    serializer_class = UploadSerializer
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [AppRateThrottle]
+    http_method_names = ["get", "post", "delete"]
+
+    def get_queryset(self) -> QuerySet[Upload]:
+        """본인 업로드만 조회"""
+        if getattr(self, "swagger_fake_view", False):  # 스키마 생성
+            return Upload.objects.none()
+        return Upload.objects.filter(user=cast(User, self.request.user)).order_by("-created_at")  # IsAuthenticated
+
+    @extend_schema(
+        tags=["app-upload"],
+        summary="업로드 URL 발급",
+        description="""
+        S3에 직접 업로드할 URL을 발급합니다.
+
+        - `post`: `url`로 `fields`와 file을 multipart/form-data로 전송
+        - `put`: `url`로 `headers`와 함께 파일 본문을 PUT
+        - `multipart`: 큰 파일은 자동 전환, `parts`의 URL로 `part_size` 단위로 PUT 후 응답 ETag를 완료 API에 전달
+        """,
+        request=UploadCreateSerializer,
+        responses={201: UploadTicketSerializer},
+    )
+    def create(self, request: Request, *args: object, **kwargs: object) -> Response:
+        serializer = UploadCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload, ticket = create_upload(request.user, **serializer.validated_data)
+        return Response(UploadTicketSerializer({"upload": upload, **ticket}).data, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        tags=["app-upload"],
+        summary="업로드 완료",
+        description="S3 객체의 크기를 확인하고 업로드를 완료 처리합니다. multipart 업로드는 part 목록으로 객체를 조립합니다.",
+        request=UploadCompleteSerializer,
+        responses={200: UploadSerializer},
+    )
+    @action(detail=True, methods=["post"])
+    def complete(self, request: Request, pk: str | None = None) -> Response:
+        serializer = UploadCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            upload = complete_upload(self.get_object(), serializer.validated_data.get("parts"))
+        except UploadError as e:
+            raise ValidationError({"detail": str(e)}) from e
+        return Response(UploadSerializer(upload).data)
+
+    @extend_schema(tags=["app-upload"], summary="업로드 취소", description="완료되지 않은 업로드를 취소합니다.", responses={200: UploadSerializer})
+    def destroy(self, request: Request, *args: object, **kwargs: object) -> Response:
+        try:
+            upload = abort_upload(self.get_object())
+        except UploadError as e:
+            raise ValidationError({"detail": str(e)}) from e
+        return Response(UploadSerializer(upload).data)
+
+    @extend_schema(
+        tags=["app-upload"],
+        summary="이미지 변환본",
+        description="""
+        업로드된 이미지를 줄인 WebP/JPEG 변환본 URL로 redirect(302)합니다.
+
+        - 첫 요청 시 변환본을 만들어 저장하고, 이후 요청은 저장된 변환본으로 바로 redirect합니다.
+        - `width`는 허용된 너비(예: 160, 320, 640, 1280) 중 같거나 큰 값으로 올립니다. 원본보다 크게 늘리지 않습니다.
+        """,
+        parameters=[RenditionQuerySerializer],
+        responses={302: OpenApiResponse(description="변환본 URL로 redirect"), 400: OpenApiResponse(response=OpenApiTypes.OBJECT)},
+    )
+    @action(detail=True, methods=["get"])
+    def rendition(self, request: Request, pk: str | None = None) -> HttpResponseRedirect:
+        serializer = RenditionQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        upload = self.get_object()
+        if upload.status != Upload.Status.COMPLETED or not upload.is_image:
+            raise ValidationError({"detail": "완료된 이미지 업로드만 변환할 수 있습니다."})
+
+        try:
+            name = get_rendition(upload.file, serializer.validated_data["width"], serializer.validated_data["image_format"])
+        except RenditionError as e:
+            raise ValidationError({"detail": str(e)}) from e
+        return HttpResponseRedirect(rendition_storage().url(name))
@@ -0,0 +1,128 @@
+"""
+사용자 활동 이벤트 수집
+
+뷰/미들웨어에서 log_activity()로 이벤트를 기록하면 프로세스별 메모리 버퍼에 쌓였다가
+크기/시간 임계값 도달 시 또는 프로세스 종료 시 bulk_create로 한 번에 저장됩니다.
+요청 경로에서는 deque.append 한 번만 수행합니다.
+gunicorn --preload처럼 start() 이후 fork된 워커에서는 첫 log() 호출 시 flusher 스레드를 다시 시작합니다.
+
+사용법:
+    from user.activity import log_activity
+
+    log_activity(request.user.pk, "login")
+"""
+
+import atexit
+from collections import defaultdict, deque
+from datetime import date, datetime
+import logging
+import os
+import threading
+import weakref
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityBuffer:
+    """프로세스별 활동 이벤트 버퍼"""
+
+    def __init__(self, max_size: int, flush_interval: float, batch_size: int = 1000) -> None:
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._events: deque[tuple[int, str, str, datetime]] = deque()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher_pid: int | None = None
+        self._started = False
+        # 부모의 flusher 스레드는 fork된 자식으로 복제되지 않으므로 자식에서 상태를 초기화합니다.
+        after_fork = weakref.WeakMethod(self._after_fork)
+        os.register_at_fork(after_in_child=lambda: (method := after_fork()) and method())
+
+    def log(self, user_id: int, action: str, path: str = "") -> None:
+        self._events.append((user_id, action, path[:255], timezone.now()))
+        if self._started and self._flusher_pid != os.getpid():
+            self.start()
+        if len(self._events) >= self.max_size:
+            if self._flusher_pid == os.getpid():
+                self._wakeup.set()
+            else:
+                # 백그라운드 flusher가 없는 프로세스 (관리 커맨드, 테스트 등)
+                self.flush()
+
+    def start(self) -> None:
+        """시간 임계값마다 버퍼를 비우는 백그라운드 스레드를 시작합니다. (fork 이후 재호출 가능)"""
+        self._started = True
+        if self._flusher_pid == os.getpid():
+            return
+        self._flusher_pid = os.getpid()
+        threading.Thread(target=self._run, name="activity-flusher", daemon=True).start()
+
+    def _after_fork(self) -> None:
+        # fork 시점에 flusher가 잡고 있던 lock과 부모가 저장할 이벤트는 물려받지 않습니다.
+        self._events = deque()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher_pid = None
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("활동 이벤트 저장 실패")
+            finally:
+                close_old_connections()
+
+    def flush(self) -> int:
+        """버퍼의 이벤트를 모두 저장하고 저장한 개수를 반환합니다."""
+        from .models import DailyActiveUserSketch, UserActivity
+
+        with self._flush_lock:
+            events = []
+            while True:
+                try:
+                    events.append(self._events.popleft())
+                except IndexError:
+                    break
+            if not events:
+                return 0
+
+            UserActivity.objects.bulk_create(
+                [UserActivity(user_id=user_id, action=action, path=path, created_at=created_at) for user_id, action, path, created_at in events],
+                batch_size=self.batch_size,
+            )
+
+            # 일별 활성 유저 스케치 갱신 (날짜별로 한 번씩)
+            users_by_day: defaultdict[date, set[int]] = defaultdict(set)
+            for user_id, _, _, created_at in events:
+                users_by_day[timezone.localdate(created_at)].add(user_id)
+            for day, user_ids in users_by_day.items():
+                DailyActiveUserSketch.objects.record(user_ids, day=day)
+
+            return len(events)
+
+    def clear(self) -> None:
+        """저장하지 않고 버퍼를 비웁니다. (테스트용)"""
+        self._events.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+activity_buffer = ActivityBuffer(
+    max_size=getattr(settings, "ACTIVITY_BUFFER_SIZE", 1000),
+    flush_interval=getattr(settings, "ACTIVITY_FLUSH_INTERVAL", 5.0),
+)
+atexit.register(activity_buffer.flush)
+
+
+def log_activity(user_id: int, action: str, path: str = "") -> None:
+    """사용자 활동 이벤트를 기록합니다."""
+    activity_buffer.log(user_id, action, path)
@@ -1,9 +1,10 @@
 import time
 from typing import Any
 
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
+from django.core.exceptions import ValidationError
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
@@ -11,7 +12,7 @@ from django.utils.translation import gettext_lazy as _
 from config.admin import ModelAdmin
 
 from .forms import UserForm
-from .models import AdminUser, User
+from .models import AdminUser, ArchivedUser, User
 
 
 class AllUserAdmin(ModelAdmin):
@@ -57,3 +58,31 @@ class AdminUserAdmin(AllUserAdmin):
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[User]:
         return super().get_queryset(request).filter(is_staff=True)
+
+
+@admin.register(ArchivedUser)
+class ArchivedUserAdmin(ModelAdmin):
+    list_display = ("username", "email", "original_id", "registered_at", "deactivated_at", "archived_at")
+    search_fields = ("username", "email", "=original_id")
+    list_filter = ("is_staff", "archived_at")
+    readonly_fields = ("original_id", "username", "email", "is_staff", "is_superuser", "last_login", "registered_at", "deactivated_at", "archived_at", "data")
+    exclude = ("password",)
+    actions = ("restore_users",)
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: Any = None) -> bool:
+        return False
+
+    @admin.action(description=_("선택한 유저 복원"), permissions=["delete"])
+    def restore_users(self, request: HttpRequest, queryset: QuerySet[ArchivedUser]) -> None:
+        restored = 0
+        for archived in queryset:
+            try:
+                archived.restore()
+                restored += 1
+            except ValidationError as e:
+                self.message_user(request, f"{archived.username}: {' '.join(e.messages)}", messages.ERROR)
+        if restored:
+            self.message_user(request, _("%(count)d명을 복원했습니다.") % {"count": restored}, messages.SUCCESS)
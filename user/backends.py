@@ -0,0 +1,80 @@
+"""
+로그인 시도 제한 인증 백엔드
+
+유저네임별, IP별 로그인 실패 횟수를 캐시의 원자적 incr로 세고,
+한도(constance MAX_LOGIN_ATTEMPTS / MAX_LOGIN_ATTEMPTS_PER_IP)를 넘으면
+LOGIN_LOCKOUT_MINUTES 동안 비밀번호 해싱 없이 바로 거부합니다.
+카운터는 첫 실패 시점부터 만료되며, 시도마다 DB에 쓰지 않습니다.
+
+django.contrib.auth.authenticate()를 거치는 모든 로그인(관리자 로그인, DRF Session/Basic 인증 등)에 적용됩니다.
+"""
+
+import hashlib
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest
+
+from utils.runtime_config import get_config
+
+USERNAME_KEY = "login-failures:user:{}"
+IP_KEY = "login-failures:ip:{}"
+
+
+def get_client_ip(request: HttpRequest | None) -> str | None:
+    return request.META.get("REMOTE_ADDR") if request is not None else None
+
+
+def get_lockout_keys(username: str | None, ip: str | None) -> dict[str, int]:
+    """검사할 카운터 키와 각 키의 한도"""
+    keys = {}
+    if username:
+        digest = hashlib.md5(username.lower().encode(), usedforsecurity=False).hexdigest()
+        keys[USERNAME_KEY.format(digest)] = get_config("MAX_LOGIN_ATTEMPTS")
+    if ip:
+        keys[IP_KEY.format(ip)] = get_config("MAX_LOGIN_ATTEMPTS_PER_IP")
+    return keys
+
+
+def is_locked_out(username: str | None, ip: str | None) -> bool:
+    keys = get_lockout_keys(username, ip)
+    counts = cache.get_many(list(keys))
+    return any(counts.get(key, 0) >= limit for key, limit in keys.items())
+
+
+def record_failure(username: str | None, ip: str | None) -> None:
+    timeout = get_config("LOGIN_LOCKOUT_MINUTES") * 60
+    for key in get_lockout_keys(username, ip):
+        if not cache.add(key, 1, timeout=timeout):
+            try:
+                cache.incr(key)
+            except ValueError:  # add와 incr 사이에 만료된 경우
+                cache.add(key, 1, timeout=timeout)
+
+
+def reset_failures(username: str | None) -> None:
+    """로그인에 성공하면 해당 유저네임의 실패 횟수를 초기화합니다 (IP 카운터는 유지)."""
+    cache.delete_many(list(get_lockout_keys(username, None)))
+
+
+class LockoutModelBackend(ModelBackend):
+    """로그인 실패 횟수를 제한하는 ModelBackend"""
+
+    def authenticate(self, request: HttpRequest | None, username: str | None = None, password: str | None = None, **kwargs: Any) -> Any:
+        if username is None:
+            username = kwargs.get(get_user_model().USERNAME_FIELD)
+        ip = get_client_ip(request)
+
+        if is_locked_out(username, ip):
+            # PermissionDenied는 다른 백엔드도 시도하지 않고 인증을 즉시 중단시킵니다.
+            raise PermissionDenied("Too many failed login attempts")
+
+        user = super().authenticate(request, username=username, password=password, **kwargs)
+        if user is None:
+            record_failure(username, ip)
+        else:
+            reset_failures(username)
+        return user
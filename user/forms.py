@@ -1,6 +1,7 @@
 from typing import Any
 
 from django import forms
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, identify_hasher
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
@@ -38,9 +39,22 @@ class UserForm(forms.ModelForm):
     def save(self, commit: bool = True) -> User:
         user = super().save(commit=False)
         password = self.cleaned_data.get("password")
-        if password and (user.id is None or not password.startswith("pbkdf2_sha256$")):
+        if password and (user.id is None or not is_password_hash(password)):
             user.set_password(password)
 
-        user.save()
+        if commit:
+            user.save()
+            self.save_m2m()  # save(commit=False)가 설정
 
         return user
+
+
+def is_password_hash(value: str) -> bool:
+    """PASSWORD_HASHERS 중 하나로 만든 해시(또는 사용 불가 표시)인지 (아니면 새로 입력한 비밀번호)"""
+    if value.startswith(UNUSABLE_PASSWORD_PREFIX):
+        return True
+    try:
+        identify_hasher(value)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,73 @@
+"""
+비활성 유저 보관 커맨드
+
+비활성화된 지 settings.USER_ARCHIVE_RETENTION_DAYS일이 지난 유저를 archived_user 테이블로 옮기고
+user 테이블과 그룹/권한(M2M) 테이블에서 삭제합니다. 이들의 관리자 로그는 archived_admin_log로 옮기고 활동 기록은 지웁니다. PK 순서로 batch 단위로 나눠 batch마다 짧은 트랜잭션으로 처리합니다.
+
+사용법:
+    python manage.py archive_users
+    python manage.py archive_users --days 180 --batch-size 200 --sleep 0.1
+    python manage.py archive_users --dry-run
+    python manage.py archive_users --restore 42 43   # 원래 유저 ID로 복원
+"""
+
+from datetime import timedelta
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone
+
+from user.models import ArchivedUser, User
+
+
+class Command(BaseCommand):
+    help = "오래 비활성화된 유저를 batch 단위로 보관 테이블로 옮깁니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--days", type=int, default=None, help="비활성화 후 보관까지의 기간(일) (기본값: USER_ARCHIVE_RETENTION_DAYS)")
+        parser.add_argument("--batch-size", type=int, default=500, help="한 트랜잭션에서 옮길 유저 수 (기본값: 500)")
+        parser.add_argument("--sleep", type=float, default=0.0, help="batch 사이 대기 시간(초) (기본값: 0)")
+        parser.add_argument("--dry-run", action="store_true", help="옮기지 않고 대상 유저 수만 출력")
+        parser.add_argument("--restore", type=int, nargs="+", metavar="USER_ID", help="보관된 유저를 원래 ID로 복원")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["restore"]:
+            self.restore(options["restore"])
+            return
+
+        days = settings.USER_ARCHIVE_RETENTION_DAYS if options["days"] is None else options["days"]
+        cutoff = timezone.now() - timedelta(days=days)
+        candidates = User.objects.filter(is_active=False, deactivated_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(f"보관 대상 유저: {candidates.count()}명 (비활성화 {days}일 경과)")
+            return
+
+        archived = 0
+        last_pk = 0
+        while True:
+            ids = list(candidates.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[: options["batch_size"]])
+            if not ids:
+                break
+            last_pk = ids[-1]
+            archived += ArchivedUser.objects.archive(ids, cutoff, options["batch_size"])
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"유저 {archived}명을 보관했습니다."))
+
+    def restore(self, user_ids: list[int]) -> None:
+        archived = {user.original_id: user for user in ArchivedUser.objects.filter(original_id__in=user_ids)}
+        missing = [user_id for user_id in user_ids if user_id not in archived]
+        if missing:
+            raise CommandError(f"보관된 유저가 없습니다: {', '.join(map(str, missing))}")
+
+        for user_id in user_ids:
+            try:
+                user = archived[user_id].restore()
+            except ValidationError as e:
+                raise CommandError(f"{user_id}: {' '.join(e.messages)}") from e
+            self.stdout.write(self.style.SUCCESS(f"{user.username}({user.pk})를 복원했습니다."))
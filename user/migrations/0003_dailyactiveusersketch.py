@@ -0,0 +1,39 @@
+# Generated by Django 5.2.13 on 2026-10-19 08:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0002_user_deactivated_at_alter_user_registered_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyActiveUserSketch",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("date", models.DateField(unique=True, verbose_name="날짜")),
+                ("registers", models.BinaryField(verbose_name="HLL 레지스터")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정일")),
+            ],
+            options={
+                "verbose_name": "일별 활성 유저 스케치",
+                "verbose_name_plural": "일별 활성 유저 스케치",
+                "db_table": "daily_active_user_sketch",
+            },
+        ),
+        migrations.CreateModel(
+            name="AdminUser",
+            fields=[],
+            options={
+                "verbose_name": "관리자",
+                "verbose_name_plural": "관리자",
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("user.user",),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.13 on 2026-10-19 08:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0003_dailyactiveusersketch"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserActivity",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("action", models.CharField(max_length=50, verbose_name="활동")),
+                ("path", models.CharField(blank=True, default="", max_length=255, verbose_name="경로")),
+                ("created_at", models.DateTimeField(verbose_name="발생일시")),
+                ("user", models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name="activities", to=settings.AUTH_USER_MODEL, verbose_name="사용자")),
+            ],
+            options={
+                "verbose_name": "사용자 활동",
+                "verbose_name_plural": "사용자 활동",
+                "db_table": "user_activity",
+                "ordering": ["-created_at"],
+                "indexes": [models.Index(fields=["created_at"], name="user_activi_created_646acc_idx"), models.Index(fields=["user", "created_at"], name="user_activi_user_id_133bc2_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.13 on 2026-10-19 08:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("user", "0004_useractivity"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["registered_at"], name="user_registe_d609eb_idx"),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.13 on 2026-10-19 09:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0005_user_registered_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, verbose_name="수정일시"),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.13 on 2026-10-19 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("user", "0006_user_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedUser",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("original_id", models.BigIntegerField(unique=True, verbose_name="원래 ID")),
+                ("username", models.CharField(db_index=True, max_length=50, verbose_name="유저네임")),
+                ("email", models.EmailField(blank=True, db_index=True, max_length=254, null=True, verbose_name="이메일")),
+                ("password", models.CharField(max_length=128, verbose_name="비밀번호")),
+                ("is_staff", models.BooleanField(default=False, verbose_name="스태프 여부")),
+                ("is_superuser", models.BooleanField(default=False, verbose_name="슈퍼유저 여부")),
+                ("last_login", models.DateTimeField(blank=True, null=True, verbose_name="마지막 로그인")),
+                ("registered_at", models.DateTimeField(verbose_name="가입일시")),
+                ("deactivated_at", models.DateTimeField(verbose_name="비활성화일시")),
+                ("archived_at", models.DateTimeField(auto_now_add=True, verbose_name="보관일시")),
+                ("data", models.JSONField(default=dict, verbose_name="연결 데이터")),
+            ],
+            options={
+                "verbose_name": "보관된 사용자",
+                "verbose_name_plural": "보관된 사용자",
+                "db_table": "archived_user",
+                "ordering": ["-archived_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(condition=models.Q(("deactivated_at__isnull", False)), fields=["deactivated_at"], name="user_deactivated_at_idx"),
+        ),
+    ]
@@ -1,9 +1,16 @@
-from typing import Any
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable, cast
 
-from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, Group, Permission, PermissionsMixin
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from utils.hyperloglog import HyperLogLog
+
 
 class UserManager(BaseUserManager["User"]):
     def create_user(self, username: str, email: str | None = None, password: str | None = None, **extra_fields: Any) -> "User":
@@ -36,6 +43,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_staff = models.BooleanField(default=False, verbose_name=_("스태프 여부"))
     registered_at = models.DateTimeField(auto_now_add=True, verbose_name=_("가입일시"))
     deactivated_at = models.DateTimeField(blank=True, null=True, verbose_name=_("비활성화일시"))
+    updated_at = models.DateTimeField(auto_now=True, db_index=True, verbose_name=_("수정일시"))
 
     objects: UserManager = UserManager()
 
@@ -45,6 +53,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         db_table = "user"
         verbose_name = _("사용자")
         verbose_name_plural = _("사용자")
+        indexes = [
+            models.Index(fields=["registered_at"]),
+            # 보관 대상 조회용, 비활성화된 유저만 포함하는 부분 인덱스
+            models.Index(fields=["deactivated_at"], condition=Q(deactivated_at__isnull=False), name="user_deactivated_at_idx"),
+        ]
 
 
 class AdminUser(User):
@@ -52,3 +65,184 @@ class AdminUser(User):
         proxy = True
         verbose_name = _("관리자")
         verbose_name_plural = _("관리자")
+
+
+class DailyActiveUserSketchManager(models.Manager["DailyActiveUserSketch"]):
+    def record(self, user_ids: Iterable[int], day: date | None = None) -> None:
+        """해당 날짜의 활성 유저 스케치에 유저 ID들을 추가합니다."""
+        day = day or timezone.localdate()
+        with transaction.atomic(using=self.db):
+            sketch, created = self.select_for_update().get_or_create(date=day, defaults={"registers": HyperLogLog().to_bytes()})
+            hll = HyperLogLog.from_bytes(sketch.registers)
+            hll.add_many(user_ids)
+            sketch.registers = hll.to_bytes()
+            sketch.save(update_fields=["registers", "updated_at"])
+
+    def estimate(self, days: int, end: date | None = None) -> int:
+        """end(기본값: 오늘)를 포함한 최근 days일 동안의 고유 활성 유저 수를 추정합니다. (DAU=1, WAU=7, MAU=30)"""
+        end = end or timezone.localdate()
+        registers = self.filter(date__gt=end - timedelta(days=days), date__lte=end).values_list("registers", flat=True)
+        return HyperLogLog.union(HyperLogLog.from_bytes(data) for data in registers).count()
+
+
+class DailyActiveUserSketch(models.Model):
+    date = models.DateField(unique=True, verbose_name=_("날짜"))
+    registers = models.BinaryField(verbose_name=_("HLL 레지스터"))
+    updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일"))
+
+    objects: DailyActiveUserSketchManager = DailyActiveUserSketchManager()
+
+    def __str__(self) -> str:
+        return str(self.date)
+
+    class Meta:
+        db_table = "daily_active_user_sketch"
+        verbose_name = _("일별 활성 유저 스케치")
+        verbose_name_plural = _("일별 활성 유저 스케치")
+
+
+class UserActivity(models.Model):
+    # 버퍼링 후 bulk_create로 기록하므로 그 사이 삭제된 유저가 배치 전체를 실패시키지 않도록 DB 제약은 두지 않습니다.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False, related_name="activities", verbose_name=_("사용자"))
+    action = models.CharField(max_length=50, verbose_name=_("활동"))
+    path = models.CharField(max_length=255, blank=True, default="", verbose_name=_("경로"))
+    created_at = models.DateTimeField(verbose_name=_("발생일시"))
+
+    def __str__(self) -> str:
+        return f"{self.user_id} {self.action}"
+
+    class Meta:
+        db_table = "user_activity"
+        verbose_name = _("사용자 활동")
+        verbose_name_plural = _("사용자 활동")
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["user", "created_at"]),
+        ]
+
+
+class ArchivedUserManager(models.Manager["ArchivedUser"]):
+    def archive(self, user_ids: Iterable[int], cutoff: datetime, batch_size: int = 500) -> int:
+        """
+        cutoff 이전에 비활성화된 유저를 보관 테이블로 옮기고 user 테이블에서 삭제합니다.
+
+        유저를 지우면 CASCADE로 함께 지워질 행을 먼저 batch_size개씩 나눠 처리합니다.
+        - 관리자 로그(LogEntry): 감사 기록이므로 ArchivedLogEntry로 옮깁니다.
+        - 활동 기록(UserActivity): 삭제합니다.
+        그 뒤 유저 이동은 트랜잭션 하나로 처리하며, 그사이 새로 생긴 행만 그 안에서 처리합니다.
+        그룹/권한(M2M)과 업로드 연결은 복원할 수 있도록 data에 기록한 뒤 지웁니다.
+        옮긴 유저 수를 반환합니다.
+        """
+        from django.contrib.admin.models import LogEntry
+
+        from config.models import ArchivedLogEntry
+        from upload.models import Upload
+
+        ids = list(User.objects.filter(pk__in=list(user_ids), is_active=False, deactivated_at__lt=cutoff).values_list("pk", flat=True))
+        if not ids:
+            return 0
+        ArchivedLogEntry.objects.archive(LogEntry.objects.filter(user_id__in=ids), batch_size)
+        self._purge_activities(ids, batch_size)
+
+        with transaction.atomic(using=self.db):
+            users = list(User.objects.select_for_update().filter(pk__in=ids, is_active=False, deactivated_at__lt=cutoff))
+            if not users:
+                return 0
+            ids = [user.pk for user in users]
+            ArchivedLogEntry.objects.archive(LogEntry.objects.filter(user_id__in=ids), batch_size)
+            self._purge_activities(ids, batch_size)
+
+            data: dict[int, dict[str, list[int]]] = defaultdict(lambda: {"groups": [], "user_permissions": [], "uploads": []})
+            for user_id, group_id in User.groups.through.objects.filter(user_id__in=ids).values_list("user_id", "group_id"):
+                data[user_id]["groups"].append(group_id)
+            for user_id, permission_id in User.user_permissions.through.objects.filter(user_id__in=ids).values_list("user_id", "permission_id"):
+                data[user_id]["user_permissions"].append(permission_id)
+            for user_id, upload_id in Upload.objects.filter(user_id__in=ids).values_list("user_id", "pk"):
+                data[user_id]["uploads"].append(upload_id)
+
+            self.bulk_create(
+                [
+                    ArchivedUser(
+                        original_id=user.pk,
+                        username=user.username,
+                        email=user.email,
+                        password=user.password,
+                        is_staff=user.is_staff,
+                        is_superuser=user.is_superuser,
+                        last_login=user.last_login,
+                        registered_at=user.registered_at,
+                        deactivated_at=cast(datetime, user.deactivated_at),  # deactivated_at__lt 조건으로 조회했으므로 None이 아님
+                        data=data[user.pk],
+                    )
+                    for user in users
+                ]
+            )
+            User.groups.through.objects.filter(user_id__in=ids).delete()
+            User.user_permissions.through.objects.filter(user_id__in=ids).delete()
+            User.objects.filter(pk__in=ids).delete()
+        return len(users)
+
+    def _purge_activities(self, user_ids: list[int], batch_size: int) -> None:
+        """유저들의 활동 기록을 batch_size개씩 삭제합니다."""
+        while pks := list(UserActivity.objects.filter(user_id__in=user_ids).values_list("pk", flat=True)[:batch_size]):
+            UserActivity.objects.filter(pk__in=pks).delete()
+
+
+class ArchivedUser(models.Model):
+    """오래 비활성화된 유저 (archive_users 커맨드가 user 테이블에서 옮김)"""
+
+    original_id = models.BigIntegerField(unique=True, verbose_name=_("원래 ID"))
+    username = models.CharField(max_length=50, db_index=True, verbose_name=_("유저네임"))
+    email = models.EmailField(null=True, blank=True, db_index=True, verbose_name=_("이메일"))
+    password = models.CharField(max_length=128, verbose_name=_("비밀번호"))
+    is_staff = models.BooleanField(default=False, verbose_name=_("스태프 여부"))
+    is_superuser = models.BooleanField(default=False, verbose_name=_("슈퍼유저 여부"))
+    last_login = models.DateTimeField(null=True, blank=True, verbose_name=_("마지막 로그인"))
+    registered_at = models.DateTimeField(verbose_name=_("가입일시"))
+    deactivated_at = models.DateTimeField(verbose_name=_("비활성화일시"))
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name=_("보관일시"))
+    data = models.JSONField(default=dict, verbose_name=_("연결 데이터"))  # groups, user_permissions, uploads의 ID
+
+    objects: ArchivedUserManager = ArchivedUserManager()
+
+    def __str__(self) -> str:
+        return self.username
+
+    def restore(self) -> User:
+        """
+        유저를 원래 ID로 user 테이블에 되돌리고 활성화합니다.
+
+        그사이 같은 유저네임/이메일로 가입한 유저가 있으면 ValidationError를 발생시킵니다.
+        """
+        from upload.models import Upload
+
+        with transaction.atomic():
+            conflict = Q(username=self.username) | Q(email=self.email) if self.email else Q(username=self.username)
+            if User.objects.filter(conflict).exists():
+                raise ValidationError(_("같은 유저네임 또는 이메일을 사용하는 유저가 있어 복원할 수 없습니다."))
+
+            user = User(
+                pk=self.original_id,
+                username=self.username,
+                email=self.email,
+                password=self.password,
+                is_staff=self.is_staff,
+                is_superuser=self.is_superuser,
+                last_login=self.last_login,
+            )
+            user.save(force_insert=True)
+            User.objects.filter(pk=user.pk).update(registered_at=self.registered_at)  # auto_now_add 대신 원래 가입일시
+            user.registered_at = self.registered_at
+
+            user.groups.set(Group.objects.filter(pk__in=self.data.get("groups", [])))
+            user.user_permissions.set(Permission.objects.filter(pk__in=self.data.get("user_permissions", [])))
+            Upload.objects.filter(pk__in=self.data.get("uploads", []), user__isnull=True).update(user=user)
+            self.delete()
+        return user
+
+    class Meta:
+        db_table = "archived_user"
+        verbose_name = _("보관된 사용자")
+        verbose_name_plural = _("보관된 사용자")
+        ordering = ["-archived_at"]
@@ -3,6 +3,8 @@ from typing import Any
 from drf_spectacular.utils import OpenApiExample, extend_schema_serializer
 from rest_framework import serializers
 
+from config.serializers import ValuesSerializer
+
 from .models import User
 
 
@@ -49,12 +51,8 @@ class UserSerializer(serializers.ModelSerializer):
         }
 
     def create(self, validated_data: dict[str, Any]) -> User:
-        """사용자 생성 시 비밀번호 해싱"""
-        password = validated_data.pop("password")
-        user = User.objects.create_user(**validated_data)
-        user.set_password(password)
-        user.save()
-        return user
+        """사용자 생성 (비밀번호는 create_user에서 한 번만 해싱)"""
+        return User.objects.create_user(**validated_data)
 
     def update(self, instance: User, validated_data: dict[str, Any]) -> User:
         """사용자 정보 업데이트"""
@@ -77,3 +75,35 @@ class UserListSerializer(serializers.ModelSerializer):
         model = User
         fields = ["id", "username", "email", "is_active", "is_staff", "registered_at", "deactivated_at"]
         read_only_fields = ["id", "registered_at", "deactivated_at"]
+
+
+class UserListValuesSerializer(ValuesSerializer):
+    """UserListSerializer와 같은 출력을 values() row에서 바로 만드는 목록 조회용 빠른 경로"""
+
+    serializer_class = UserListSerializer
+
+
+class ExternalUserListSerializer(UserListSerializer):
+    """외부 연동용 사용자 Serializer (external 카테고리 문서에 별도 컴포넌트로 표시)"""
+
+    class Meta(UserListSerializer.Meta):
+        fields = ["id", "username", "email", "is_active", "is_staff", "registered_at", "deactivated_at"]
+
+
+class ExternalUserListValuesSerializer(ValuesSerializer):
+    """ExternalUserListSerializer의 목록 조회용 빠른 경로"""
+
+    serializer_class = ExternalUserListSerializer
+
+
+class AppUserListSerializer(UserListSerializer):
+    """앱용 사용자 목록 Serializer (app 카테고리 문서에 별도 컴포넌트로 표시)"""
+
+    class Meta(UserListSerializer.Meta):
+        fields = ["id", "username", "email", "is_active", "is_staff", "registered_at", "deactivated_at"]
+
+
+class AppUserListValuesSerializer(ValuesSerializer):
+    """AppUserListSerializer의 목록 조회용 빠른 경로"""
+
+    serializer_class = AppUserListSerializer
@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .activity import log_activity
+from .models import AdminUser, User
+
+# 로그인할 때마다 저장되는 필드 (last_login 갱신, 해시 업그레이드). 대시보드에 표시되지 않습니다.
+LOGIN_UPDATE_FIELDS = frozenset({"last_login", "password"})
+
+
+@receiver(user_logged_in)
+def record_login_activity(sender: Any, request: Any, user: Any, **kwargs: Any) -> None:
+    """로그인 활동을 기록합니다. (버퍼 flush 시 일별 활성 유저 스케치에도 반영)"""
+    log_activity(user.pk, "login")
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=AdminUser)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=AdminUser)
+def clear_dashboard_cache(sender: Any, update_fields: frozenset[str] | None = None, **kwargs: Any) -> None:
+    """유저가 변경되면 관리자 대시보드 fragment 캐시를 비웁니다. (로그인 시의 저장은 제외)"""
+    from config.views import invalidate_dashboard_cache
+
+    if update_fields and update_fields <= LOGIN_UPDATE_FIELDS:
+        return
+
+    invalidate_dashboard_cache()
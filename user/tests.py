@@ -1,5 +1,34 @@
-from django.contrib.auth import get_user_model
-from django.test import TestCase
+from datetime import date, timedelta
+from io import StringIO
+import os
+import threading
+import time
+from unittest import mock
+
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+
+from constance import config  # type: ignore[import-untyped]
+import numpy as np
+import orjson
+
+from config.models import ArchivedLogEntry
+from user.activity import ActivityBuffer, activity_buffer
+from user.forms import is_password_hash
+from user.models import ArchivedUser, DailyActiveUserSketch, UserActivity
+from user.serializers import UserListSerializer, UserListValuesSerializer, UserSerializer
+from utils.hyperloglog import HyperLogLog
+from utils.runtime_config import clear_config_cache
 
 User = get_user_model()
 
@@ -36,3 +65,345 @@ class UserModelTests(TestCase):
     def test_user_str(self) -> None:
         user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
         self.assertEqual(str(user), "testuser")
+
+
+class HyperLogLogTests(TestCase):
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(42)
+
+    def test_accuracy_against_exact_count(self) -> None:
+        for size in (100, 10_000, 200_000):
+            ids = self.rng.integers(0, 10**9, size=size)
+            sketch = HyperLogLog()
+            sketch.add_many(ids)
+            exact = len(np.unique(ids))
+            # precision 12의 표준오차 ≈ 1.6%, 3σ 이내
+            self.assertLess(abs(sketch.count() - exact) / exact, 0.05, msg=f"size={size}")
+
+    def test_union_matches_exact_window(self) -> None:
+        days = [self.rng.integers(0, 50_000, size=20_000) for _ in range(30)]
+        sketches = []
+        for ids in days:
+            sketch = HyperLogLog()
+            sketch.add_many(ids)
+            sketches.append(sketch)
+        exact = len(np.unique(np.concatenate(days)))
+        self.assertLess(abs(HyperLogLog.union(sketches).count() - exact) / exact, 0.05)
+
+    def test_bytes_round_trip(self) -> None:
+        sketch = HyperLogLog()
+        sketch.add_many(range(1000))
+        restored = HyperLogLog.from_bytes(sketch.to_bytes())
+        self.assertEqual(len(sketch.to_bytes()), 4096)
+        self.assertEqual(restored.count(), sketch.count())
+
+
+class DailyActiveUserSketchTests(TestCase):
+    def test_estimate_windows(self) -> None:
+        today = date(2024, 7, 30)
+        for offset in range(30):
+            DailyActiveUserSketch.objects.record(range(offset * 100, offset * 100 + 1000), day=today - timedelta(days=offset))
+
+        self.assertAlmostEqual(DailyActiveUserSketch.objects.estimate(days=1, end=today), 1000, delta=50)
+        self.assertAlmostEqual(DailyActiveUserSketch.objects.estimate(days=7, end=today), 1600, delta=80)
+        self.assertAlmostEqual(DailyActiveUserSketch.objects.estimate(days=30, end=today), 3900, delta=195)
+
+    def test_login_records_active_user(self) -> None:
+        User.objects.create_user(username="testuser", password="testpass123")
+        self.assertTrue(self.client.login(username="testuser", password="testpass123"))
+        activity_buffer.flush()
+        self.assertEqual(DailyActiveUserSketch.objects.estimate(days=1), 1)
+
+
+class ActivityBufferTests(TestCase):
+    def setUp(self) -> None:
+        # 다른 테스트의 요청이 모듈 버퍼에 남긴 이벤트를 버립니다.
+        activity_buffer.clear()
+        self.addCleanup(activity_buffer.clear)
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+
+    def test_flush_on_size_threshold(self) -> None:
+        buffer = ActivityBuffer(max_size=3, flush_interval=60)
+        buffer.log(self.user.pk, "a")
+        buffer.log(self.user.pk, "b")
+        self.assertEqual(UserActivity.objects.count(), 0)
+        buffer.log(self.user.pk, "c")
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(UserActivity.objects.count(), 3)
+
+    def test_middleware_logs_authenticated_requests(self) -> None:
+        self.client.force_login(self.user)
+        self.client.get("/admin/")
+        activity_buffer.flush()
+        self.assertTrue(UserActivity.objects.filter(user=self.user, action="GET", path="/admin/").exists())
+
+    def test_log_is_deferred_and_flush_is_batched(self) -> None:
+        buffer = ActivityBuffer(max_size=100_000, flush_interval=60, batch_size=1000)
+        with self.assertNumQueries(0):
+            for _ in range(20_000):
+                buffer.log(self.user.pk, "GET", "/api/user/app/users/")
+        # 이벤트당 INSERT가 아니라 배치 단위 INSERT (배치 크기는 DB의 변수 개수 제한에 따라 다름)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(buffer.flush(), 20_000)
+        self.assertLess(len(queries), 100)
+        self.assertEqual(UserActivity.objects.count(), 20_000)
+
+    def test_flusher_restarts_in_forked_child(self) -> None:
+        buffer = ActivityBuffer(max_size=100, flush_interval=60)
+        buffer.start()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover (자식 프로세스)
+            os.close(read_fd)
+            inherited = len(buffer)
+            buffer.log(self.user.pk, "GET")
+            alive = any(thread.name == "activity-flusher" and thread.is_alive() for thread in threading.enumerate())
+            os.write(write_fd, f"{inherited},{buffer._flusher_pid == os.getpid()},{alive}".encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            result = pipe.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(result, "0,True,True")
+
+
+class ConditionalGetTests(TestCase):
+    url = "/api/user/external/users/"
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+
+    def test_list_not_modified(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        User.objects.create_user(username="another", email="another@example.com", password="testpass123")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_has_no_last_modified(self) -> None:
+        older = User.objects.create_user(username="older", email="older@example.com", password="testpass123")
+        User.objects.filter(pk=older.pk).update(updated_at=timezone.now() - timedelta(days=1))
+        response = self.client.get(self.url)
+        self.assertNotIn("Last-Modified", response)
+
+        # 가장 최근에 수정된 row가 아닌 row를 삭제해도 If-Modified-Since로 304가 나오지 않습니다
+        since = http_date(time.time() + 60)
+        older.delete()
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_retrieve_not_modified(self) -> None:
+        url = f"{self.url}{self.user.pk}/"
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(response.status_code, 304)
+
+        self.user.email = "changed@example.com"
+        self.user.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 200)
+
+    def test_retrieve_missing_user(self) -> None:
+        self.assertEqual(self.client.get(f"{self.url}0/").status_code, 404)
+
+
+class UserListValuesSerializerTests(TestCase):
+    def test_matches_model_serializer(self) -> None:
+        User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+        User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass123")
+        User.objects.filter(username="testuser").update(is_active=False, deactivated_at=timezone.now())
+
+        queryset = User.objects.order_by("pk")
+        expected = UserListSerializer(queryset, many=True).data
+        actual = UserListValuesSerializer.serialize(queryset.values(*UserListValuesSerializer.fields))
+        self.assertEqual(actual, [dict(row) for row in expected])
+
+    def test_list_endpoint_renders_with_orjson(self) -> None:
+        User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+        response = self.client.get("/api/user/external/users/")
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(orjson.loads(response.content)[0]["username"], "testuser")
+
+
+class SparseFieldsetTests(TestCase):
+    url = "/api/user/external/users/"
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+
+    def test_list_fields(self) -> None:
+        response = self.client.get(self.url, {"fields": "username,id"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(orjson.loads(response.content), [{"id": self.user.pk, "username": "testuser"}])
+
+    def test_list_exclude(self) -> None:
+        response = self.client.get(self.url, {"exclude": "registered_at"})
+        self.assertEqual(list(orjson.loads(response.content)[0]), ["id", "username"])
+
+    def test_default_response_is_unchanged(self) -> None:
+        list_fields = ["id", "username", "email", "is_active", "is_staff", "registered_at", "deactivated_at"]
+        self.assertEqual(list(orjson.loads(self.client.get(self.url).content)[0]), list_fields)
+        self.assertEqual(list(self.client.get(f"{self.url}{self.user.pk}/").json()), list_fields)
+
+        self.client.force_login(self.user)
+        self.assertEqual(list(self.client.get("/api/user/app/users/").json()[0]), list_fields)
+        self.assertEqual(list(self.client.get("/api/user/admin/users/").json()[0]), list_fields)
+
+    def test_schema_documents_each_category_response(self) -> None:
+        from drf_spectacular.generators import SchemaGenerator
+
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        list_fields = ["id", "username", "email", "is_active", "is_staff", "registered_at", "deactivated_at"]
+        for path, component in [("/api/user/external/users/", "ExternalUserList"), ("/api/user/app/users/", "AppUserList"), ("/api/user/admin/users/", "UserList")]:
+            ref = schema["paths"][path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["items"]["$ref"]
+            self.assertEqual(ref, f"#/components/schemas/{component}")
+            self.assertEqual(list(schema["components"]["schemas"][component]["properties"]), list_fields)
+
+    def test_retrieve_fields_defers_columns(self) -> None:
+        with self.assertNumQueries(2):  # 조건부 GET 검증자 + 본문
+            response = self.client.get(f"{self.url}{self.user.pk}/", {"fields": "username"})
+        self.assertEqual(response.json(), {"username": "testuser"})
+
+    def test_rejects_fields_outside_whitelist(self) -> None:
+        response = self.client.get(self.url, {"fields": "username,email"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json())
+
+        self.assertEqual(self.client.get(self.url, {"exclude": "password"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"exclude": "email"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"fields": "id", "exclude": "id"}).status_code, 400)
+
+    def test_schema_documents_parameters(self) -> None:
+        from drf_spectacular.generators import SchemaGenerator
+
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        parameters = {parameter["name"] for parameter in schema["paths"]["/api/user/external/users/"]["get"]["parameters"]}
+        self.assertTrue({"fields", "exclude"} <= parameters)
+
+
+class LoginLockoutTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+        self.request = RequestFactory().post("/admin/login/", REMOTE_ADDR="10.0.0.1")
+
+    def test_locks_out_without_hashing(self) -> None:
+        for _ in range(5):  # MAX_LOGIN_ATTEMPTS
+            self.assertIsNone(authenticate(self.request, username="TestUser", password="wrong"))
+
+        with mock.patch("django.contrib.auth.base_user.check_password") as check_password:
+            self.assertIsNone(authenticate(self.request, username="testuser", password="testpass123"))
+        check_password.assert_not_called()
+
+    def test_success_resets_username_counter(self) -> None:
+        for _ in range(4):
+            authenticate(self.request, username="testuser", password="wrong")
+        self.assertEqual(authenticate(self.request, username="testuser", password="testpass123"), self.user)
+        authenticate(self.request, username="testuser", password="wrong")
+        self.assertEqual(authenticate(self.request, username="testuser", password="testpass123"), self.user)
+
+    def test_locks_out_ip_across_usernames(self) -> None:
+        config.MAX_LOGIN_ATTEMPTS_PER_IP = 6
+        self.addCleanup(clear_config_cache)
+        for i in range(6):
+            authenticate(self.request, username=f"unknown-{i}", password="wrong")
+        self.assertIsNone(authenticate(self.request, username="testuser", password="testpass123"))
+
+        other = RequestFactory().post("/admin/login/", REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(authenticate(other, username="testuser", password="testpass123"), self.user)
+
+
+class ArchiveUsersTests(TestCase):
+    def setUp(self) -> None:
+        now = timezone.now()
+        self.group = Group.objects.create(name="editors")
+        self.old = User.objects.create_user(username="old", email="old@example.com", password="testpass123")
+        self.old.groups.add(self.group)
+        UserActivity.objects.create(user=self.old, action="login", created_at=now)
+        self.recent = User.objects.create_user(username="recent", email="recent@example.com", password="testpass123")
+        self.active = User.objects.create_user(username="active", email="active@example.com", password="testpass123")
+        User.objects.filter(pk=self.old.pk).update(is_active=False, deactivated_at=now - timedelta(days=400))
+        User.objects.filter(pk=self.recent.pk).update(is_active=False, deactivated_at=now - timedelta(days=10))
+
+    def test_archives_in_batches_and_purges_relations(self) -> None:
+        call_command("archive_users", batch_size=1, stdout=StringIO())
+        self.assertEqual(set(User.objects.values_list("username", flat=True)), {"recent", "active"})
+        self.assertFalse(User.groups.through.objects.filter(user_id=self.old.pk).exists())
+        self.assertFalse(UserActivity.objects.filter(user_id=self.old.pk).exists())
+
+        archived = ArchivedUser.objects.get()
+        self.assertEqual((archived.original_id, archived.username, archived.data["groups"]), (self.old.pk, "old", [self.group.pk]))
+
+    def test_staff_admin_log_survives_archiving(self) -> None:
+        User.objects.filter(pk=self.old.pk).update(is_staff=True)
+        LogEntry.objects.create(user_id=self.old.pk, content_type=ContentType.objects.get_for_model(Group), object_id=str(self.group.pk), object_repr="editors", action_flag=CHANGE)
+        call_command("archive_users", batch_size=1, stdout=StringIO())
+        self.assertFalse(User.objects.filter(pk=self.old.pk).exists())
+        archived = ArchivedLogEntry.objects.get()
+        self.assertEqual((archived.user_id, archived.username, archived.object_repr), (self.old.pk, "old", "editors"))
+
+    def test_restore(self) -> None:
+        call_command("archive_users", stdout=StringIO())
+        call_command("archive_users", restore=[self.old.pk], stdout=StringIO())
+        user = User.objects.get(pk=self.old.pk)
+        self.assertTrue(user.is_active and user.check_password("testpass123"))
+        self.assertEqual((user.registered_at, list(user.groups.all())), (self.old.registered_at, [self.group]))
+        self.assertFalse(ArchivedUser.objects.exists())
+
+    def test_restore_conflict(self) -> None:
+        call_command("archive_users", stdout=StringIO())
+        User.objects.create_user(username="old", password="testpass123")
+        with self.assertRaises(CommandError):
+            call_command("archive_users", restore=[self.old.pk], stdout=StringIO())
+        self.assertTrue(ArchivedUser.objects.exists())
+
+
+@override_settings(PASSWORD_PBKDF2_ITERATIONS=1000, PASSWORD_BCRYPT_ROUNDS=4)
+class PasswordHashingTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_signup_hashes_once(self) -> None:
+        with mock.patch("django.contrib.auth.base_user.make_password", wraps=make_password) as hash_password:
+            user = UserSerializer().create({"username": "testuser", "email": "testuser@example.com", "password": "testpass123"})
+        self.assertEqual(hash_password.call_count, 1)
+        self.assertTrue(User.objects.get(pk=user.pk).check_password("testpass123"))
+
+    def test_login_upgrades_hash(self) -> None:
+        user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpass123")
+        self.assertTrue(user.password.startswith("pbkdf2_sha256$1000$"))
+
+        with self.settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            authenticate(username="testuser", password="testpass123")
+            self.assertTrue(User.objects.get(pk=user.pk).password.startswith("pbkdf2_sha256$2000$"))
+
+        with self.settings(PASSWORD_HASHERS=["config.hashers.BCryptSHA256PasswordHasher", "config.hashers.PBKDF2PasswordHasher"]):
+            self.assertIsNone(authenticate(username="testuser", password="wrong"))
+            self.assertTrue(User.objects.get(pk=user.pk).password.startswith("pbkdf2_sha256$"))
+            self.assertEqual(authenticate(username="testuser", password="testpass123"), user)
+            self.assertTrue(User.objects.get(pk=user.pk).password.startswith("bcrypt_sha256$$2b$04$"))
+
+    def test_argon2_hasher(self) -> None:
+        with self.settings(PASSWORD_HASHERS=["config.hashers.Argon2PasswordHasher"], PASSWORD_ARGON2_TIME_COST=1, PASSWORD_ARGON2_MEMORY_COST=1024):
+            encoded = make_password("testpass123")
+            self.assertTrue(encoded.startswith("argon2$argon2id$v=19$m=1024,t=1,"))
+            self.assertTrue(check_password("testpass123", encoded))
+
+    def test_form_detects_hashes(self) -> None:
+        self.assertTrue(is_password_hash(make_password("testpass123")))
+        with self.settings(PASSWORD_HASHERS=["config.hashers.BCryptSHA256PasswordHasher", "config.hashers.PBKDF2PasswordHasher"]):
+            self.assertTrue(is_password_hash(make_password("testpass123")))
+        self.assertTrue(is_password_hash(make_password(None)))
+        self.assertFalse(is_password_hash("pbkdf2_sha256-like-plain-password"))
@@ -8,27 +8,37 @@ from django.shortcuts import render
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 from rest_framework.viewsets import ModelViewSet
 
+from config.mixins import ConditionalGetMixin, ReadReplicaMixin, SparseFieldsetMixin, ValuesListMixin, sparse_fieldset_parameters
+from config.renderers import ORJSONRenderer
 from config.settings import SERVER_MODE
 from config.unfold import color_dict
 from user.models import User
-from user.serializers import UserListSerializer, UserSerializer
+from user.serializers import UserListSerializer, UserListValuesSerializer, UserSerializer
 from utils.timezone_utils import get_start_of_today
 
+# ?fields= 로 선택 가능한 필드 (관리자: 전체)
+ADMIN_USER_SPARSE_FIELDS = ("id", "username", "email", "is_active", "is_staff", "is_superuser", "registered_at", "deactivated_at")
+
 
 # Admin API ViewSet
 @extend_schema_view(
-    list=extend_schema(tags=["admin-user"], summary="[관리자] 모든 사용자 조회", description="관리자용 - 비활성 사용자 포함 모든 사용자를 조회합니다."),
+    list=extend_schema(
+        tags=["admin-user"], summary="[관리자] 모든 사용자 조회", description="관리자용 - 비활성 사용자 포함 모든 사용자를 조회합니다.", parameters=sparse_fieldset_parameters(ADMIN_USER_SPARSE_FIELDS)
+    ),
     create=extend_schema(tags=["admin-user"], summary="[관리자] 사용자 생성", description="관리자용 - 새로운 사용자를 생성합니다."),
-    retrieve=extend_schema(tags=["admin-user"], summary="[관리자] 사용자 상세 조회", description="관리자용 - 특정 사용자의 상세 정보를 조회합니다."),
+    retrieve=extend_schema(
+        tags=["admin-user"], summary="[관리자] 사용자 상세 조회", description="관리자용 - 특정 사용자의 상세 정보를 조회합니다.", parameters=sparse_fieldset_parameters(ADMIN_USER_SPARSE_FIELDS)
+    ),
     update=extend_schema(tags=["admin-user"], summary="[관리자] 사용자 정보 수정", description="관리자용 - 사용자 정보를 전체 수정합니다."),
     partial_update=extend_schema(tags=["admin-user"], summary="[관리자] 사용자 정보 부분 수정", description="관리자용 - 사용자 정보를 부분적으로 수정합니다."),
     destroy=extend_schema(tags=["admin-user"], summary="[관리자] 사용자 삭제", description="관리자용 - 사용자를 삭제합니다."),
 )
-class AdminUserViewSet(ModelViewSet):
+class AdminUserViewSet(ReadReplicaMixin, ConditionalGetMixin, SparseFieldsetMixin, ValuesListMixin, ModelViewSet):
     """
     관리자용 사용자 관리 ViewSet
 
@@ -37,6 +47,9 @@ class AdminUserViewSet(ModelViewSet):
 
     queryset = User.objects.all()  # 모든 사용자 (비활성 포함)
     serializer_class = UserSerializer
+    values_serializer_class = UserListValuesSerializer  # 목록 조회 빠른 경로
+    sparse_fields = ADMIN_USER_SPARSE_FIELDS
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_serializer_class(self) -> type[Serializer]:
         """액션에 따라 다른 Serializer 사용"""
@@ -8,25 +8,36 @@ from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 from rest_framework.viewsets import ModelViewSet
 
+from config.mixins import ConditionalGetMixin, ReadReplicaMixin, SparseFieldsetMixin, ValuesListMixin, sparse_fieldset_parameters
+from config.renderers import ORJSONRenderer
+from config.throttling import AppRateThrottle
+
 from ...models import User
-from ...serializers import UserListSerializer, UserSerializer
+from ...serializers import AppUserListSerializer, AppUserListValuesSerializer, UserSerializer
 
 # Create your views here.
 
 
+# ?fields= 로 선택 가능한 필드 (앱: 권한 관련 필드 제외)
+APP_USER_SPARSE_FIELDS = ("id", "username", "email", "is_active", "registered_at")
+
+
 @extend_schema_view(
-    list=extend_schema(tags=["app-user"], summary="사용자 목록 조회", description="모든 사용자 목록을 조회합니다. 페이지네이션이 적용됩니다."),
+    list=extend_schema(
+        tags=["app-user"], summary="사용자 목록 조회", description="모든 사용자 목록을 조회합니다. 페이지네이션이 적용됩니다.", parameters=sparse_fieldset_parameters(APP_USER_SPARSE_FIELDS)
+    ),
     create=extend_schema(tags=["app-user"], summary="새 사용자 생성", description="새로운 사용자를 생성합니다."),
-    retrieve=extend_schema(tags=["app-user"], summary="사용자 상세 조회", description="특정 사용자의 상세 정보를 조회합니다."),
+    retrieve=extend_schema(tags=["app-user"], summary="사용자 상세 조회", description="특정 사용자의 상세 정보를 조회합니다.", parameters=sparse_fieldset_parameters(APP_USER_SPARSE_FIELDS)),
     update=extend_schema(tags=["app-user"], summary="사용자 정보 수정", description="사용자 정보를 전체 수정합니다."),
     partial_update=extend_schema(tags=["app-user"], summary="사용자 정보 부분 수정", description="사용자 정보를 부분적으로 수정합니다."),
     destroy=extend_schema(tags=["app-user"], summary="사용자 삭제", description="사용자를 삭제합니다."),
 )
-class UserViewSet(ModelViewSet):
+class UserViewSet(ReadReplicaMixin, ConditionalGetMixin, SparseFieldsetMixin, ValuesListMixin, ModelViewSet):
     """
     사용자 관리를 위한 ViewSet
 
@@ -35,11 +46,15 @@ class UserViewSet(ModelViewSet):
 
     queryset = User.objects.all()
     serializer_class = UserSerializer
+    values_serializer_class = AppUserListValuesSerializer  # 목록 조회 빠른 경로
+    sparse_fields = APP_USER_SPARSE_FIELDS
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    throttle_classes = [AppRateThrottle]
 
     def get_serializer_class(self) -> type[Serializer]:
         """액션에 따라 다른 Serializer 사용"""
         if self.action == "list":
-            return UserListSerializer
+            return AppUserListSerializer
         return UserSerializer
 
     def get_queryset(self) -> QuerySet[User]:
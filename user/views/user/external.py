@@ -1,14 +1,23 @@
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.viewsets import ModelViewSet
 
+from config.mixins import ConditionalGetMixin, ReadReplicaMixin, SparseFieldsetMixin, ValuesListMixin, sparse_fieldset_parameters
+from config.renderers import ORJSONRenderer
+from config.throttling import ExternalRateThrottle
+
 from ...models import User
-from ...serializers import UserListSerializer
+from ...serializers import ExternalUserListSerializer, ExternalUserListValuesSerializer
+
+# ?fields= 로 선택 가능한 필드 (외부: 기본 정보만)
+EXTERNAL_USER_SPARSE_FIELDS = ("id", "username", "registered_at")
 
 
 @extend_schema_view(
     list=extend_schema(
         tags=["external-user"],
         operation_id="external_users_list",
+        parameters=sparse_fieldset_parameters(EXTERNAL_USER_SPARSE_FIELDS),
         summary="[외부] 공개 사용자 정보",
         description="""
         **외부 연동용** - 제한된 사용자 정보를 제공합니다.
@@ -22,13 +31,14 @@ from ...serializers import UserListSerializer
     retrieve=extend_schema(
         tags=["external-user"],
         operation_id="external_users_detail",
+        parameters=sparse_fieldset_parameters(EXTERNAL_USER_SPARSE_FIELDS),
         summary="[외부] 사용자 기본 정보 조회",
         description="""
         **외부 연동용** - 특정 사용자의 기본 정보만 조회합니다.
         """,
     ),
 )
-class ExternalUserViewSet(ModelViewSet):
+class ExternalUserViewSet(ReadReplicaMixin, ConditionalGetMixin, SparseFieldsetMixin, ValuesListMixin, ModelViewSet):
     """
     ## 🌐 외부 연동용 사용자 ViewSet
 
@@ -41,5 +51,9 @@ class ExternalUserViewSet(ModelViewSet):
     """
 
     queryset = User.objects.filter(is_active=True)
-    serializer_class = UserListSerializer
+    serializer_class = ExternalUserListSerializer
+    values_serializer_class = ExternalUserListValuesSerializer  # 목록 조회 빠른 경로
+    sparse_fields = EXTERNAL_USER_SPARSE_FIELDS
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    throttle_classes = [ExternalRateThrottle]
     http_method_names = ["get"]  # 조회만 허용
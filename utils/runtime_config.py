@@ -0,0 +1,48 @@
+"""
+런타임 설정(constance) 조회 유틸리티
+
+constance DatabaseBackend는 값을 읽을 때마다 DB를 조회하므로,
+요청마다 읽는 핫 패스(throttle, 로그인 잠금 등)에서는 프로세스 메모리에 짧게 보관한 값을 사용합니다.
+관리자 화면에서 값을 바꾸면 같은 프로세스는 즉시, 다른 프로세스는 최대 CONFIG_CACHE_TTL 초 뒤에 반영됩니다.
+
+사용법:
+    get_config("MAX_LOGIN_ATTEMPTS")
+"""
+
+import threading
+import time
+from typing import Any
+
+from django.dispatch import receiver
+
+from constance import config  # type: ignore[import-untyped]
+from constance.signals import config_updated  # type: ignore[import-untyped]
+
+CONFIG_CACHE_TTL = 5.0  # 초
+
+_values: dict[str, tuple[float, Any]] = {}
+_lock = threading.Lock()
+
+
+def get_config(name: str) -> Any:
+    """constance 설정 값을 반환합니다 (CONFIG_CACHE_TTL 동안 프로세스 메모리에 보관)."""
+    cached = _values.get(name)
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    value = getattr(config, name)
+    with _lock:
+        _values[name] = (now + CONFIG_CACHE_TTL, value)
+    return value
+
+
+def clear_config_cache() -> None:
+    with _lock:
+        _values.clear()
+
+
+@receiver(config_updated)
+def _on_config_updated(sender: Any, key: str, **kwargs: Any) -> None:
+    with _lock:
+        _values.pop(key, None)